@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=no-member
+"""Offline EODHD WebSockets feed generator for benchmarks.
+
+Extends tests WebSocket server with a trades stream for subscribed symbols
+at configurable messages rate.
+"""
+import argparse
+import asyncio
+import json
+import time
+import websockets
+from tests.wss import authorize
+
+
+def handler(rate: int, batch: int = 100):
+    """Create WebSocket feed handler.
+
+    :param rate: messages per second, 0 - unlimited.
+    :param batch: messages sent between rate checks.
+    :return: handler coroutine function.
+    """
+    async def feed(websocket):
+        await authorize(websocket)
+        symbols = set()
+
+        async def listen():
+            async for raw in websocket:
+                msg = json.loads(raw)
+                if msg.get("action") == "subscribe":
+                    symbols.update(symbol.strip() for symbol in msg["symbols"].split(","))
+                if msg.get("action") == "unsubscribe":
+                    symbols.difference_update(symbol.strip() for symbol in msg["symbols"].split(","))
+
+        listener = asyncio.ensure_future(listen())
+        sent, started = 0, time.monotonic()
+        try:
+            while not listener.done():
+                if not symbols:
+                    await asyncio.sleep(0.01)
+                    continue
+                for symbol in list(symbols) * (batch // max(len(symbols), 1) or 1):
+                    await websocket.send(json.dumps({
+                        "s": symbol, "p": 100.0 + sent % 100 / 100, "v": 100, "c": [12, 37],
+                        "dp": False, "ms": "open", "t": int(time.time() * 1000)
+                    }))
+                    sent += 1
+                if rate:
+                    delay = sent / rate - (time.monotonic() - started)
+                    await asyncio.sleep(max(delay, 0))
+                else:
+                    await asyncio.sleep(0)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            listener.cancel()
+    return feed
+
+
+async def serve(port: int = 8003, rate: int = 0):
+    """Run WebSockets feed server.
+
+    :param port: listening port.
+    :param rate: messages per second, 0 - unlimited.
+    """
+    async with websockets.serve(handler(rate), "127.0.0.1", port):
+        await asyncio.Future()
+
+
+def run(port: int = 8003, rate: int = 0):
+    """Run WebSockets feed server in new event loop.
+
+    :param port: listening port.
+    :param rate: messages per second, 0 - unlimited.
+    """
+    asyncio.run(serve(port, rate))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8003)
+    parser.add_argument("--rate", type=int, default=0)
+    run(**vars(parser.parse_args()))
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""EODHDC benchmarks against offline EODHD API stand-in.
+
+Measures requests per second, p50 / p99 latency, network / parse time share and
+peak RSS for each client backend and output mode, and WebSockets messages rate.
+Every case runs in a separate process, so peak RSS is not shared between cases.
+
+    python -m benchmarks.run --requests 500 --concurrency 20 --rows 1000 --latency 0.01
+"""
+from typing import List
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import time
+from concurrent.futures import ThreadPoolExecutor
+from eodhdc import EODHDClient, EODHDWebSockets
+from eodhdc.metrics import Metrics
+from benchmarks import server, feed
+
+BACKENDS = ["requests", "httpxs", "httpxa", "aiohttp"]
+OUTPUTS = ["response", "content", "pandas"]
+
+
+def percentile(values: List[float], share: float) -> float:
+    """Get percentile of values.
+
+    :param values: values list.
+    :param share: percentile, 0 - 1.
+    :return: percentile value.
+    """
+    values = sorted(values)
+    return values[min(int(len(values) * share), len(values) - 1)] if values else 0.0
+
+
+# pylint: disable=too-many-locals
+def measure(backend: str, output: str, options: dict) -> dict:
+    """Run HTTP benchmark case.
+
+    :param backend: client backend name.
+    :param output: group method output mode.
+    :param options: benchmark options.
+    :return: case results.
+    """
+    metrics = Metrics()
+    latencies, errors, eodhd = [], 0, None
+
+    def build():
+        nonlocal eodhd
+        eodhd = EODHDClient(backend, metrics=metrics)
+        for group in [eodhd.alternative, eodhd.exchange, eodhd.fundamental, eodhd.market]:
+            group.base = f"http://127.0.0.1:{options['port']}/api"
+
+    def call():
+        started = time.perf_counter()
+        eodhd.market.historical("MCD.US", fmt=options["fmt"], output=output)
+        latencies.append(time.perf_counter() - started)
+
+    async def acall(semaphore):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await eodhd.market.historical("MCD.US", fmt=options["fmt"], output=output)
+                latencies.append(time.perf_counter() - started)
+            except Exception:  # pylint: disable=broad-except
+                errors += 1
+
+    async def arun():
+        build()
+        semaphore = asyncio.Semaphore(options["concurrency"])
+        await asyncio.gather(*[acall(semaphore) for _ in range(options["requests"])])
+        await eodhd.destroy()
+
+    started = time.perf_counter()
+    if backend in ["httpxa", "aiohttp"]:
+        asyncio.run(arun())
+    else:
+        build()
+        with ThreadPoolExecutor(options["concurrency"]) as executor:
+            futures = [executor.submit(call) for _ in range(options["requests"])]
+            errors = sum(1 for future in futures if future.exception())
+    elapsed = time.perf_counter() - started
+
+    stats = metrics.snapshot()["requests"].get("market.historical", {})
+    total = sum(stats.get(stage, 0.0) for stage in ["network", "parse", "write"]) or 1.0
+    return {
+        "backend": backend, "output": output, "requests": len(latencies), "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50": percentile(latencies, 0.5) * 1000, "p99": percentile(latencies, 0.99) * 1000,
+        "network": stats.get("network", 0.0) / total, "parse": stats.get("parse", 0.0) / total,
+        "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }
+
+
+def stream(options: dict) -> dict:
+    """Run WebSockets benchmark case.
+
+    :param options: benchmark options.
+    :return: case results.
+    """
+    metrics = Metrics()
+    eodhdws = EODHDWebSockets(metrics=metrics)
+    eodhdws.base = f"ws://127.0.0.1:{options['port'] + 1}/ws"
+
+    async def receive():
+        async with eodhdws.connect("us") as websocket:
+            await eodhdws.subscribe(websocket, ["AAPL", "MSFT", "TSLA"])
+            finish = time.monotonic() + options["duration"]
+            async for _ in eodhdws.receive(websocket):
+                if time.monotonic() > finish:
+                    eodhdws.deactivate()
+
+    asyncio.run(receive())
+    stats = metrics.snapshot()["messages"]["us"]
+    return {
+        "messages": stats["count"], "rate": stats["rate"],
+        "decode": stats["decode"] / max(stats["count"], 1) * 1e6,
+        "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }
+
+
+def isolated(func, *args):
+    """Run function in separate process.
+
+    :param func: function to run.
+    :param args: function arguments.
+    :return: function result.
+    """
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(func, args)
+
+
+def main():
+    """Benchmarks launcher."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=BACKENDS, choices=BACKENDS)
+    parser.add_argument("--outputs", nargs="+", default=OUTPUTS, choices=OUTPUTS)
+    parser.add_argument("--fmt", default="csv", choices=["csv", "json"])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--errors", type=float, default=0.0)
+    parser.add_argument("--rate", type=int, default=0, help="websocket messages rate, 0 - unlimited")
+    parser.add_argument("--duration", type=float, default=3.0, help="websocket benchmark duration")
+    parser.add_argument("--json", help="save results to file")
+    options = vars(parser.parse_args())
+
+    context = multiprocessing.get_context("spawn")
+    servers = [
+        context.Process(target=server.serve, kwargs={
+            "port": options["port"], "latency": options["latency"], "rows": options["rows"],
+            "errors": options["errors"], "limit": 10 ** 9
+        }, daemon=True),
+        context.Process(target=feed.run, args=(options["port"] + 1, options["rate"]), daemon=True)
+    ]
+    for process in servers:
+        process.start()
+    time.sleep(1)
+
+    results = {"http": [], "wss": None}
+    print(f"{'backend':<10}{'output':<10}{'rps':>10}{'p50 ms':>10}{'p99 ms':>10}"
+          f"{'network':>10}{'parse':>10}{'errors':>8}{'rss MB':>10}")
+    try:
+        for backend in options["backends"]:
+            for output in options["outputs"]:
+                result = isolated(measure, backend, output, options)
+                results["http"].append(result)
+                print(f"{backend:<10}{output:<10}{result['rps']:>10.1f}{result['p50']:>10.2f}"
+                      f"{result['p99']:>10.2f}{result['network']:>10.0%}{result['parse']:>10.0%}"
+                      f"{result['errors']:>8}{result['rss']:>10.1f}")
+        wss = results["wss"] = isolated(stream, options)
+        print(f"\nwebsockets: {wss['rate']:.0f} msg/s, decode {wss['decode']:.1f} us/msg, rss {wss['rss']:.1f} MB")
+    finally:
+        for process in servers:
+            process.terminate()
+
+    if options["json"]:
+        with open(options["json"], "w", encoding="utf-8") as handle:
+            json.dump({"options": options, "results": results}, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Offline EODHD API stand-in for benchmarks.
+
+Serves generated end-of-day data for any path under "/api", in CSV or JSON
+depending on "fmt" query parameter, with configurable latency, payload size,
+rate-limit headers and error injection. Responses have "ETag" validator and
+conditional requests with matching "If-None-Match" are answered with 304.
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+def payload(rows: int, fmt: str) -> bytes:
+    """Generate end-of-day data payload.
+
+    :param rows: number of rows.
+    :param fmt: "csv" or "json".
+    :return: payload body.
+    """
+    records = [
+        {
+            "date": f"{2000 + index // 365:04d}-{index % 12 + 1:02d}-{index % 28 + 1:02d}",
+            "open": 100.0 + index % 7, "high": 101.5 + index % 7, "low": 99.25 + index % 7,
+            "close": 100.75 + index % 7, "adjusted_close": 100.5 + index % 7, "volume": 1000000 + index
+        }
+        for index in range(rows)
+    ]
+    if fmt == "json":
+        return json.dumps(records).encode("utf-8")
+    lines = ["Date,Open,High,Low,Close,Adjusted_close,Volume"]
+    lines.extend(",".join(str(value) for value in record.values()) for record in records)
+    return "\n".join(lines).encode("utf-8")
+
+
+class Handler(BaseHTTPRequestHandler):
+    """EODHD API stand-in request handler."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    config = {"latency": 0.0, "rows": 100, "errors": 0.0, "limit": 100000}
+    cache = {}
+    lock = threading.Lock()
+    remaining = 100000
+
+    # pylint: disable=invalid-name
+    def do_GET(self):
+        """Handle GET request."""
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        if self.config["latency"]:
+            time.sleep(self.config["latency"])
+
+        with self.lock:
+            Handler.remaining = max(Handler.remaining - 1, 0)
+            remaining = Handler.remaining
+        headers = {
+            "X-RateLimit-Limit": str(self.config["limit"]),
+            "X-RateLimit-Remaining": str(remaining)
+        }
+
+        if not url.path.startswith("/api/") or params.get("api_token") != ["demo"]:
+            return self.reply(401, b"Unauthenticated", "text/html", headers)
+        if remaining == 0:
+            return self.reply(429, b"Too Many Requests", "text/html", headers)
+        if self.config["errors"] and random.random() < self.config["errors"]:
+            return self.reply(random.choice([500, 502, 503]), b"Server Error", "text/html", headers)
+
+        fmt = params.get("fmt", ["csv"])[0]
+        if fmt not in self.cache:
+            self.cache[fmt] = payload(self.config["rows"], fmt)
+        content = "application/json" if fmt == "json" else "text/html"
+        headers["ETag"] = f'"{hashlib.md5(self.cache[fmt]).hexdigest()}"'
+        if self.headers.get("If-None-Match") == headers["ETag"]:
+            return self.reply(304, b"", content, headers)
+        return self.reply(200, self.cache[fmt], content, headers)
+
+    def reply(self, code: int, body: bytes, content: str, headers: dict):
+        """Send response.
+
+        :param code: status code.
+        :param body: response body.
+        :param content: content type.
+        :param headers: additional headers.
+        """
+        self.send_response(code)
+        self.send_header("Content-Type", f"{content}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Disable request logging."""
+
+
+class Server(ThreadingHTTPServer):
+    """EODHD API stand-in server."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def serve(port: int = 8002, latency: float = 0.0, rows: int = 100, errors: float = 0.0, limit: int = 100000):
+    """Run EODHD API stand-in server.
+
+    :param port: listening port.
+    :param latency: response delay in seconds.
+    :param rows: payload rows count.
+    :param errors: share of requests answered with server error, 0 - 1.
+    :param limit: rate limit, requests above it are answered with 429.
+    """
+    Handler.config = {"latency": latency, "rows": rows, "errors": errors, "limit": limit}
+    Handler.remaining = limit
+    Handler.cache = {}
+    Server(("127.0.0.1", port), Handler).serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--errors", type=float, default=0.0)
+    parser.add_argument("--limit", type=int, default=100000)
+    serve(**vars(parser.parse_args()))
@@ -3,34 +3,62 @@ from typing import Union, Tuple, Any
 from typing import Callable, Coroutine
 import io
 import json
+import time
+import asyncio
 import pathlib
+from concurrent.futures import Executor
 import pandas as pd
-from eodhdc import exceptions
+from eodhdc import exceptions, middleware
+from eodhdc.storage import atomic
+from eodhdc.registry import Endpoint
+
+CONTENT = {"application/json": "application/json", "text/html": "text/html", "application/csv": "text/html"}
+EXTENSIONS = {
+    ".parquet": "parquet", ".pickle": "pickle", ".csv": "csv", ".hdf": "hdf",
+    ".xlsx": "excel", ".json": "json", ".html": "html", ".feather": "feather",
+    ".tex": "latex", ".dta": "stata", ".md": "markdown"
+}
 
 
 class BaseGroup:
     """Base class for groups."""
 
+    name = None
+    mode = None
+
+    # pylint: disable=too-many-arguments
     def __init__(self, get: Union[Callable, Coroutine], key: str = "demo",
-                 session: Any = None, args: dict = None):
+                 session: Any = None, args: dict = None, chain: list = None, metrics: Any = None,
+                 executor: Executor = None, queue: Any = None, stream: Union[Callable, Coroutine] = None):
         """
         :param get: client <get> function.
         :param key: api token.
         :param session: client session.
         :param args: common client arguments.
+        :param chain: middleware list, outermost first.
+        :param metrics: metrics collector.
+        :param executor: thread or process pool to process responses of asynchronous client off the event loop.
+        :param queue: write-behind queue to save files of asynchronous client in background.
+        :param stream: client <stream> function writing response body directly to file.
         """
         self.get = get
         self.key = key
         self.session = session
         self.args = args or {}
+        self.chain = chain if chain is not None else []
+        self.metrics = metrics
+        self.executor = executor
+        self.queue = queue
+        self.stream = stream
         self.base = "https://eodhistoricaldata.com/api"
         self.headers = {}
 
-    def prepare(self, source: dict, exclude: list) -> dict:
+    def prepare(self, source: dict, exclude: list, renames: dict = None) -> dict:
         """Prepare parameters dictionary.
 
         :param source: source dictionary.
         :param exclude: list of keys to exclude.
+        :param renames: additional keys renames.
         :return: processed parameters.
         """
         result = {
@@ -39,7 +67,8 @@ class BaseGroup:
         convert = {
             "symbol": "s", "start": "from", "finish": "to", "kind": "type",
             "contract": "contract_name", "extract": "filter", "tag": "t", "lookup": "s",
-            "trade_date_start": "trade_date_from", "trade_date_finish": "trade_date_to"
+            "trade_date_start": "trade_date_from", "trade_date_finish": "trade_date_to",
+            **(renames or {})
         }
         exclude = ["self", "args", "output", "writer"] + exclude
         for key, value in source.items():
@@ -48,9 +77,107 @@ class BaseGroup:
             result[convert.get(key, key)] = value
         return result
 
-    # pylint: disable=too-many-branches,too-many-statements
+    def request(self, endpoint: Endpoint, arguments: dict) -> middleware.Request:
+        """Prepare endpoint request.
+
+        :param endpoint: endpoint description.
+        :param arguments: method arguments.
+        :return: group request.
+        """
+        request = middleware.Request(
+            endpoint, arguments, f"{self.base}/{endpoint.url(arguments)}",
+            self.prepare(endpoint.query(arguments), endpoint.excludes(arguments), endpoint.renames),
+            {**self.args, **(arguments.get("args") or {})}
+        )
+        output = (arguments.get("output") or "").split(":", 1)
+        if output[0] == "file" and len(output) == 2 and self.stream is not None:
+            request.target = output[1]
+        return request
+
+    def send(self, request: middleware.Request) -> Union[Tuple[str, bytes, dict], Coroutine]:
+        """Send request through middleware chain.
+
+        :param request: group request.
+        :return: response or coroutine returning response for asynchronous clients.
+        """
+        transport = self.atransport if self.mode == "coro" else self.transport
+        return middleware.dispatch(request, self.chain, transport)
+
+    def transport(self, request: middleware.Request) -> Tuple[str, bytes, dict]:
+        """Send request using synchronous client.
+
+        :param request: group request.
+        :return: response.
+        """
+        request.started = time.perf_counter()
+        try:
+            if request.target is not None:
+                request.response = self.stream(request.url, request.params, request.target, **request.args)
+            else:
+                request.response = self.get(request.url, request.params, **request.args)
+        finally:
+            request.elapsed = time.perf_counter() - request.started
+        return request.response
+
+    async def atransport(self, request: middleware.Request) -> Tuple[str, bytes, dict]:
+        """Send request using asynchronous client.
+
+        :param request: group request.
+        :return: response.
+        """
+        request.started = time.perf_counter()
+        try:
+            if request.target is not None:
+                request.response = await self.stream(
+                    self.session, request.url, request.params, request.target, **request.args
+                )
+            else:
+                request.response = await self.get(self.session, request.url, request.params, **request.args)
+        finally:
+            request.elapsed = time.perf_counter() - request.started
+        return request.response
+
+    def call(self, endpoint: Endpoint, arguments: dict) -> Union[bytes, dict, str, pd.DataFrame]:
+        """Call endpoint using synchronous client.
+
+        :param endpoint: endpoint description.
+        :param arguments: method arguments.
+        :return: data in requested output format.
+        """
+        request = self.request(endpoint, arguments)
+        try:
+            response = self.send(request)
+            return self.process(response, arguments["output"], arguments["writer"], request.timings)
+        except Exception as ex:
+            request.error = ex
+            raise
+        finally:
+            if self.metrics:
+                self.metrics.observe(request)
+
+    async def acall(self, endpoint: Endpoint, arguments: dict) -> Union[bytes, dict, str, pd.DataFrame]:
+        """Call endpoint using asynchronous client.
+
+        :param endpoint: endpoint description.
+        :param arguments: method arguments.
+        :return: data in requested output format.
+        """
+        request = self.request(endpoint, arguments)
+        try:
+            response = await self.send(request)
+            if self.executor is None and self.queue is None:
+                return self.process(response, arguments["output"], arguments["writer"], request.timings)
+            return await self.aprocess(response, arguments["output"], arguments["writer"], request.timings)
+        except Exception as ex:
+            request.error = ex
+            raise
+        finally:
+            if self.metrics:
+                self.metrics.observe(request)
+
     def process(
-        self, response: Tuple[str, bytes, dict], output: str = "content", writer: dict = None
+        self, response: Tuple[str, bytes, dict], output: str = "content", writer: dict = None,
+        timings: dict = None
     ) -> Union[bytes, dict, str, pd.DataFrame]:
         """Process response data.
 
@@ -61,10 +188,12 @@ class BaseGroup:
               - "response": raw binary response body
               - "content": decoded as response content type
               - "pandas": pandas dataframe
+              - "file": stream raw response body to file, path is returned
 
             path: additionally save response to file
 
               - for "response" and "content" will save as is
+              - for "file" will stream by chunks and atomically replace file on completion
               - for "pandas" will save in format specified by extension:
                 parquet, pickle, csv, hdf, xlsx, json, html, feather, tex, dta, md
 
@@ -76,68 +205,160 @@ class BaseGroup:
               - change:reorder - bool to use columns dict for DataFrame columns order
               - change:reindex - str or list to set DataFrame columns as index
 
+        :param timings: dictionary to store "parse" and "write" stages time.
         :return: data in requested output format.
         """
-        result = None
-        output = output.split(":", 1)
         self.headers = response[2]
-        extensions = {
-            ".parquet": "parquet", ".pickle": "pickle", ".csv": "csv", ".hdf": "hdf",
-            ".xlsx": "excel", ".json": "json", ".html": "html", ".feather": "feather",
-            ".tex": "latex", ".dta": "stata", ".md": "markdown"
-        }
-        if response[0] == "application/csv":
-            response = ("text/html", response[1])
-        responses = ["application/json", "text/html"]
-        if response[0] not in responses:
-            raise exceptions.UnsupportedContentType(f"Unsupported content type '{response[0]}'")
-
-        if output[0] == "response":
-            result = response[1]
-
-        if output[0] == "content":
-            if response[0] == responses[0]:
-                try:
-                    result = json.loads(response[1])
-                except json.JSONDecodeError as ex:
-                    raise exceptions.JSONDecodeError(ex, ex.msg)
-            if response[0] == responses[1]:
-                try:
-                    result = response[1].decode("utf-8")
-                except UnicodeDecodeError as ex:
-                    raise exceptions.BytesDecodeError(ex, str(ex))
-
-        if len(output) == 2 and output[0] in ["response", "content"]:
-            try:
-                with open(output[1], "wb") as handle:
-                    handle.write(response[1])
-            except OSError as ex:
-                raise exceptions.FileIOError(str(ex)) from None
+        result, stages = render(response, output, writer)
+        if timings is not None:
+            timings.update(stages)
+        return result
 
-        if output[0] == "pandas":
-            try:
-                if response[0] == responses[0]:
-                    result = pd.read_json(io.BytesIO(response[1]))
-                if response[0] == responses[1]:
-                    result = pd.read_csv(io.BytesIO(response[1]))
-                if writer:
-                    columns = writer.pop("change:columns", None)
-                    reorder = writer.pop("change:reorder", None)
-                    reindex = writer.pop("change:reindex", None)
-                    if columns:
-                        result.rename(columns=columns, inplace=True)
-                    if reorder:
-                        result = result[columns.values()]
-                    if reindex:
-                        result.set_index(reindex, inplace=True)
-                if len(output) == 2:
-                    extension = pathlib.Path(output[1]).suffix
-                    if pathlib.Path(output[1]).suffix not in extensions:
-                        raise exceptions.UnsupportedExtension(f"Unsupported extension '{extension}'")
-                    getattr(result, f"to_{extensions[extension]}")(output[1], **(writer or {}))
-            except exceptions.UnsupportedExtension:
-                raise
-            except Exception as ex:
-                raise exceptions.PandasRuntimeError(ex, str(ex))
+    async def aprocess(
+        self, response: Tuple[str, bytes, dict], output: str = "content", writer: dict = None,
+        timings: dict = None
+    ) -> Union[bytes, dict, str, pd.DataFrame]:
+        """Process response data in group executor and save file with write-behind queue, see <process> method.
 
+        :param response: client response data.
+        :param output: output format and optionally file location.
+        :param writer: pandas writer parameters.
+        :param timings: dictionary to store "parse" and "write" stages time.
+        :return: data in requested output format.
+        """
+        self.headers = response[2]
+        response = (response[0], response[1], {})
+        persist = self.queue is None or ":" not in output
+        if self.executor is None:
+            result, stages = render(response, output, writer, persist)
+        else:
+            loop = asyncio.get_running_loop()
+            result, stages = await loop.run_in_executor(self.executor, render, response, output, writer, persist)
+        if not persist:
+            writer = {key: value for key, value in (writer or {}).items() if not key.startswith("change:")}
+            data = result.copy() if isinstance(result, pd.DataFrame) else result
+            await self.queue.put(save, response, data, output, writer)
+        if timings is not None:
+            timings.update(stages)
         return result
+
+
+def render(
+    response: Tuple[str, bytes, dict], output: str = "content", writer: dict = None, persist: bool = True
+) -> Tuple[Union[bytes, dict, str, pd.DataFrame], dict]:
+    """Decode and save response data, module level to be usable in process pool.
+
+    :param response: client response data.
+    :param output: output format and optionally file location, see group <process> method.
+    :param writer: pandas writer parameters.
+    :param persist: save file, otherwise only decode.
+    :return: data in requested output format and "parse" and "write" stages time.
+    """
+    timings = {}
+    writer = dict(writer) if writer else None
+    started = time.perf_counter()
+    result = decode(response, output, writer)
+    timings["parse"] = time.perf_counter() - started
+    if persist:
+        started = time.perf_counter()
+        save(response, result, output, writer)
+        timings["write"] = time.perf_counter() - started
+    return result, timings
+
+
+# pylint: disable=too-many-branches
+def decode(
+    response: Tuple[str, bytes, dict], output: str = "content", writer: dict = None
+) -> Union[bytes, dict, str, pd.DataFrame]:
+    """Decode response data, parsing stage of group <process> method.
+
+    :param response: client response data.
+    :param output: output format, see group <process> method.
+    :param writer: pandas writer parameters, "change:<...>" keys are consumed.
+    :return: data in requested output format.
+    """
+    result = None
+    output = output.split(":", 1)
+    content = CONTENT.get(response[0], response[0])
+    if content not in CONTENT.values():
+        raise exceptions.UnsupportedContentType(f"Unsupported content type '{response[0]}'")
+
+    if output[0] == "response":
+        result = response[1]
+
+    if output[0] == "file":
+        if len(output) != 2:
+            raise exceptions.FileIOError("File output requires path")
+        result = output[1]
+
+    if output[0] == "content":
+        if content == "application/json":
+            try:
+                result = json.loads(response[1])
+            except json.JSONDecodeError as ex:
+                raise exceptions.JSONDecodeError(ex, ex.msg)
+        if content == "text/html":
+            try:
+                result = response[1].decode("utf-8")
+            except UnicodeDecodeError as ex:
+                raise exceptions.BytesDecodeError(ex, str(ex))
+
+    if output[0] == "pandas":
+        try:
+            if content == "application/json":
+                result = pd.read_json(io.BytesIO(response[1]))
+            if content == "text/html":
+                result = pd.read_csv(io.BytesIO(response[1]))
+            if writer:
+                columns = writer.pop("change:columns", None)
+                reorder = writer.pop("change:reorder", None)
+                reindex = writer.pop("change:reindex", None)
+                if columns:
+                    result.rename(columns=columns, inplace=True)
+                if reorder:
+                    result = result[columns.values()]
+                if reindex:
+                    result.set_index(reindex, inplace=True)
+        except Exception as ex:
+            raise exceptions.PandasRuntimeError(ex, str(ex))
+
+    return result
+
+
+def save(
+    response: Tuple[str, bytes, dict], result: Union[bytes, dict, str, pd.DataFrame],
+    output: str = "content", writer: dict = None
+):
+    """Save response data to file, writing stage of group <process> method.
+
+    :param response: client response data.
+    :param result: decoded data.
+    :param output: output format and file location, see group <process> method.
+    :param writer: pandas writer parameters.
+    """
+    output = output.split(":", 1)
+    if len(output) != 2:
+        return
+
+    if output[0] in ["response", "content"]:
+        try:
+            with open(output[1], "wb") as handle:
+                handle.write(response[1])
+        except OSError as ex:
+            raise exceptions.FileIOError(str(ex)) from None
+
+    if output[0] == "file" and response[1] is not None:
+        try:
+            with atomic(output[1]) as handle:
+                handle.write(response[1])
+        except OSError as ex:
+            raise exceptions.FileIOError(str(ex)) from None
+
+    if output[0] == "pandas":
+        extension = pathlib.Path(output[1]).suffix
+        if extension not in EXTENSIONS:
+            raise exceptions.UnsupportedExtension(f"Unsupported extension '{extension}'")
+        try:
+            getattr(result, f"to_{EXTENSIONS[extension]}")(output[1], **(writer or {}))
+        except Exception as ex:
+            raise exceptions.PandasRuntimeError(ex, str(ex))
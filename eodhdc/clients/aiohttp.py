@@ -3,6 +3,10 @@ from typing import Tuple
 import asyncio
 import aiohttp
 from eodhdc import exceptions
+from eodhdc.storage import atomic, CHUNK
+
+CONNECTOR = {"limit": 256, "limit_per_host": 0, "ttl_dns_cache": 300, "keepalive_timeout": 30.0}
+TIMEOUT = {"total": None, "sock_connect": 10.0, "sock_read": 60.0}
 
 
 async def get(session: aiohttp.ClientSession, url: str, params: dict, **kwargs) -> Tuple[str, bytes]:
@@ -16,24 +20,76 @@ async def get(session: aiohttp.ClientSession, url: str, params: dict, **kwargs)
     """
     try:
         async with session.get(url, params=params, **kwargs) as response:
+            if response.status == 304:
+                raise exceptions.ClientNotModified(response.headers)
             response.raise_for_status()
-            return response.content_type, await response.content.read(), response.headers
+            return response.content_type, await response.read(), response.headers
     except aiohttp.ClientResponseError as ex:
         raise exceptions.ClientHTTPError(ex.status, ex.message) from None
     except asyncio.TimeoutError as ex:
         raise exceptions.ClientConnectionTimeout(ex) from None
     except aiohttp.ClientConnectionError as ex:
         raise exceptions.ClientConnectionError(ex) from None
+    except exceptions.ClientException:
+        raise
     except Exception as ex:
         raise exceptions.ClientException(ex) from None
 
 
-def create() -> aiohttp.ClientSession:
+async def stream(
+    session: aiohttp.ClientSession, url: str, params: dict, path: str, **kwargs
+) -> Tuple[str, None, dict]:
+    """Send remote request and write response body to file by chunks.
+
+    :param session: session object.
+    :param url: request target.
+    :param params: request parameters.
+    :param path: destination file, replaced atomically when body is received.
+    :param kwargs: client arguments.
+    :return: content-type, no content and headers.
+    """
+    try:
+        async with session.get(url, params=params, **kwargs) as response:
+            if response.status == 304:
+                raise exceptions.ClientNotModified(response.headers)
+            response.raise_for_status()
+            with atomic(path) as handle:
+                async for chunk in response.content.iter_chunked(CHUNK):
+                    handle.write(chunk)
+            return response.content_type, None, response.headers
+    except aiohttp.ClientResponseError as ex:
+        raise exceptions.ClientHTTPError(ex.status, ex.message) from None
+    except asyncio.TimeoutError as ex:
+        raise exceptions.ClientConnectionTimeout(ex) from None
+    except aiohttp.ClientConnectionError as ex:
+        raise exceptions.ClientConnectionError(ex) from None
+    except OSError as ex:
+        raise exceptions.FileIOError(str(ex)) from None
+    except exceptions.ClientException:
+        raise
+    except Exception as ex:
+        raise exceptions.ClientException(ex) from None
+
+
+def create(
+    connector: dict = None, timeout: dict = None, auto_decompress: bool = True, **kwargs
+) -> aiohttp.ClientSession:
     """Create async session to make it reusable for optimal performance.
 
+    Defaults are tuned for many concurrent requests to single host: large connections pool,
+    long-lived DNS cache and keep-alive connections, no total timeout to allow large bulk downloads.
+
+    :param connector: aiohttp.TCPConnector arguments: limit, limit_per_host, ttl_dns_cache, keepalive_timeout, etc.
+    :param timeout: aiohttp.ClientTimeout arguments: total, connect, sock_connect, sock_read.
+    :param auto_decompress: decompress response body, disable to receive compressed body as is.
+    :param kwargs: additional aiohttp.ClientSession arguments.
     :return: session object.
     """
-    return aiohttp.ClientSession()
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(**{**CONNECTOR, **(connector or {})}),
+        timeout=aiohttp.ClientTimeout(**{**TIMEOUT, **(timeout or {})}),
+        auto_decompress=auto_decompress, **kwargs
+    )
 
 
 async def destroy(session: aiohttp.ClientSession):
@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
 from typing import Tuple
+import importlib.util
 import httpx
 from eodhdc import exceptions
+from eodhdc.storage import atomic, CHUNK
+from eodhdc.clients.httpxs import compress
+
+HTTP2 = importlib.util.find_spec("h2") is not None
+LIMITS = {"max_connections": 100, "max_keepalive_connections": 20, "keepalive_expiry": 30.0}
 
 
 # pylint: disable=duplicate-code
@@ -16,6 +22,8 @@ async def get(session: httpx.AsyncClient, url: str, params: dict, **kwargs) -> T
     """
     try:
         response = await session.get(url, params=params, **kwargs)
+        if response.status_code == 304:
+            raise exceptions.ClientNotModified(response.headers)
         response.raise_for_status()
         return response.headers["content-type"].split(";")[0], response.content, response.headers
     except httpx.HTTPStatusError as ex:
@@ -28,12 +36,52 @@ async def get(session: httpx.AsyncClient, url: str, params: dict, **kwargs) -> T
         raise exceptions.ClientException(ex) from None
 
 
-def create() -> httpx.AsyncClient:
+async def stream(session: httpx.AsyncClient, url: str, params: dict, path: str, **kwargs) -> Tuple[str, None, dict]:
+    """Send remote request and write response body to file by chunks.
+
+    :param session: session object.
+    :param url: request target.
+    :param params: request parameters.
+    :param path: destination file, replaced atomically when body is received.
+    :param kwargs: client arguments.
+    :return: content-type, no content and headers.
+    """
+    try:
+        async with session.stream("GET", url, params=params, **kwargs) as response:
+            if response.status_code == 304:
+                raise exceptions.ClientNotModified(response.headers)
+            response.raise_for_status()
+            with atomic(path) as handle:
+                async for chunk in response.aiter_bytes(CHUNK):
+                    handle.write(chunk)
+        return response.headers["content-type"].split(";")[0], None, response.headers
+    except httpx.HTTPStatusError as ex:
+        raise exceptions.ClientHTTPError(ex.response.status_code, ex) from None
+    except httpx.TimeoutException as ex:
+        raise exceptions.ClientConnectionTimeout(ex) from None
+    except (httpx.NetworkError, httpx.ProtocolError) as ex:
+        raise exceptions.ClientConnectionError(ex) from None
+    except httpx.HTTPError as ex:
+        raise exceptions.ClientException(ex) from None
+    except OSError as ex:
+        raise exceptions.FileIOError(str(ex)) from None
+
+
+def create(limits: dict = None, http2: bool = None, **kwargs) -> httpx.AsyncClient:
     """Create async session to make it reusable for optimal performance.
 
+    Session negotiates compression with "Accept-Encoding" header, see <httpxs.compress> function,
+    header passed in any case with session arguments replaces it.
+
+    :param limits: connection pool limits: max_connections, max_keepalive_connections, keepalive_expiry.
+    :param http2: use HTTP/2, default - when "h2" package is available.
+    :param kwargs: additional httpx.AsyncClient arguments.
     :return: session object.
     """
-    return httpx.AsyncClient()
+    return httpx.AsyncClient(
+        limits=httpx.Limits(**{**LIMITS, **(limits or {})}), http2=HTTP2 if http2 is None else http2,
+        **compress(kwargs)
+    )
 
 
 async def destroy(session: httpx.AsyncClient):
@@ -1,7 +1,28 @@
 # -*- coding: utf-8 -*-
 from typing import Tuple
+import importlib.util
 import httpx
 from eodhdc import exceptions
+from eodhdc.storage import atomic, CHUNK
+
+BROTLI = any(importlib.util.find_spec(name) for name in ["brotli", "brotlicffi"])
+ENCODING = "br, gzip, deflate" if BROTLI else "gzip, deflate"
+
+
+def compress(kwargs: dict) -> dict:
+    """Add compression negotiation header to client arguments, preferring brotli when it can be decoded.
+
+    httpx default header lists encodings it can decode with brotli last, explicit header lists brotli
+    first, as servers choosing by order of equally weighted encodings pick the best compressing one,
+    header passed by caller in any case is kept as is.
+
+    :param kwargs: client arguments.
+    :return: client arguments.
+    """
+    headers = kwargs.get("headers") or {}
+    if not any(key.lower() == "accept-encoding" for key in headers):
+        kwargs["headers"] = {**headers, "Accept-Encoding": ENCODING}
+    return kwargs
 
 
 # pylint: disable=duplicate-code
@@ -14,7 +35,9 @@ def get(url: str, params: dict, **kwargs) -> Tuple[str, bytes]:
     :return: content-type and content.
     """
     try:
-        response = httpx.get(url, params=params, **kwargs)
+        response = httpx.get(url, params=params, **compress(kwargs))
+        if response.status_code == 304:
+            raise exceptions.ClientNotModified(response.headers)
         response.raise_for_status()
         return response.headers["content-type"].split(";")[0], response.content, response.headers
     except httpx.HTTPStatusError as ex:
@@ -25,3 +48,33 @@ def get(url: str, params: dict, **kwargs) -> Tuple[str, bytes]:
         raise exceptions.ClientConnectionError(ex) from None
     except httpx.HTTPError as ex:
         raise exceptions.ClientException(ex) from None
+
+
+def stream(url: str, params: dict, path: str, **kwargs) -> Tuple[str, None, dict]:
+    """Send remote request and write response body to file by chunks.
+
+    :param url: request target.
+    :param params: request parameters.
+    :param path: destination file, replaced atomically when body is received.
+    :param kwargs: client arguments.
+    :return: content-type, no content and headers.
+    """
+    try:
+        with httpx.stream("GET", url, params=params, **compress(kwargs)) as response:
+            if response.status_code == 304:
+                raise exceptions.ClientNotModified(response.headers)
+            response.raise_for_status()
+            with atomic(path) as handle:
+                for chunk in response.iter_bytes(CHUNK):
+                    handle.write(chunk)
+        return response.headers["content-type"].split(";")[0], None, response.headers
+    except httpx.HTTPStatusError as ex:
+        raise exceptions.ClientHTTPError(ex.response.status_code, ex) from None
+    except httpx.TimeoutException as ex:
+        raise exceptions.ClientConnectionTimeout(ex) from None
+    except (httpx.NetworkError, httpx.ProtocolError) as ex:
+        raise exceptions.ClientConnectionError(ex) from None
+    except httpx.HTTPError as ex:
+        raise exceptions.ClientException(ex) from None
+    except OSError as ex:
+        raise exceptions.FileIOError(str(ex)) from None
@@ -2,6 +2,7 @@
 from typing import Tuple
 import requests
 from eodhdc import exceptions
+from eodhdc.storage import atomic, CHUNK
 
 
 def get(url: str, params: dict, **kwargs) -> Tuple[str, bytes]:
@@ -14,6 +15,8 @@ def get(url: str, params: dict, **kwargs) -> Tuple[str, bytes]:
     """
     try:
         response = requests.get(url, params, **kwargs)
+        if response.status_code == 304:
+            raise exceptions.ClientNotModified(response.headers)
         response.raise_for_status()
         return response.headers["content-type"].split(";")[0], response.content, response.headers
     except requests.exceptions.HTTPError as ex:
@@ -24,3 +27,33 @@ def get(url: str, params: dict, **kwargs) -> Tuple[str, bytes]:
         raise exceptions.ClientConnectionError(ex) from None
     except requests.exceptions.RequestException as ex:
         raise exceptions.ClientException(ex) from None
+
+
+def stream(url: str, params: dict, path: str, **kwargs) -> Tuple[str, None, dict]:
+    """Send remote request and write response body to file by chunks.
+
+    :param url: request target.
+    :param params: request parameters.
+    :param path: destination file, replaced atomically when body is received.
+    :param kwargs: client arguments.
+    :return: content-type, no content and headers.
+    """
+    try:
+        with requests.get(url, params, stream=True, **kwargs) as response:
+            if response.status_code == 304:
+                raise exceptions.ClientNotModified(response.headers)
+            response.raise_for_status()
+            with atomic(path) as handle:
+                for chunk in response.iter_content(CHUNK):
+                    handle.write(chunk)
+        return response.headers["content-type"].split(";")[0], None, response.headers
+    except requests.exceptions.HTTPError as ex:
+        raise exceptions.ClientHTTPError(ex.response.status_code, ex) from None
+    except requests.exceptions.Timeout as ex:
+        raise exceptions.ClientConnectionTimeout(ex) from None
+    except requests.exceptions.ConnectionError as ex:
+        raise exceptions.ClientConnectionError(ex) from None
+    except requests.exceptions.RequestException as ex:
+        raise exceptions.ClientException(ex) from None
+    except OSError as ex:
+        raise exceptions.FileIOError(str(ex)) from None
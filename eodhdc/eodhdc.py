@@ -1,24 +1,42 @@
 # -*- coding: utf-8 -*-
-# pylint: disable=too-few-public-methods
+# pylint: disable=too-few-public-methods, too-many-instance-attributes
 from typing import Union
 from types import ModuleType
+from concurrent.futures import Executor
 import asyncio
 import importlib
 from eodhdc import groups, exceptions
+from eodhdc.middleware import iscoroutine
+from eodhdc.metrics import Metrics
+from eodhdc.storage import WriteBehind
 
 
 class EODHDClient:
     """EODHD HTTP client class"""
 
-    def __init__(self, client: Union[str, ModuleType], key: str = "demo", args: dict = None):
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, client: Union[str, ModuleType], key: str = "demo", args: dict = None,
+        middleware: list = None, metrics: Metrics = None, executor: Executor = None,
+        queue: WriteBehind = None, options: dict = None
+    ):
         """
         :param client: client name or module.
         :param key: api token.
         :param args: common client arguments.
+        :param middleware: request middleware list, outermost first.
+        :param metrics: metrics collector.
+        :param executor: thread or process pool to parse and save responses of asynchronous client off the event loop.
+        :param queue: write-behind queue to save files of asynchronous client in background.
+        :param options: asynchronous client session options, see client module <create> function.
         """
         self.mode = "sync"
         self.key = key
         self.args = args or {}
+        self.middleware = list(middleware or [])
+        self.metrics = metrics
+        self.executor = executor
+        self.queue = queue
         self.session = None
 
         if isinstance(client, str):
@@ -33,21 +51,36 @@ class EODHDClient:
             raise exceptions.ImproperClient(f"Client '{client}' doesn't have <get> method")
         if asyncio.iscoroutinefunction(self.client.get):
             self.mode = "coro"
+        for item in self.middleware:
+            if iscoroutine(item) != (self.mode == "coro"):
+                raise exceptions.ImproperMiddleware(f"Middleware '{item}' doesn't match '{self.mode}' client mode")
+        if self.queue is not None and self.mode != "coro":
+            raise exceptions.ImproperClient(f"Client '{client}' is not asynchronous, required by write queue")
         if self.mode == "coro" and hasattr(self.client, "create"):
-            self.session = self.client.create()
+            self.session = self.client.create(**(options or {}))
 
+        common = (self.client.get, key, self.session, self.args, self.middleware, self.metrics, executor, queue,
+                  getattr(self.client, "stream", None))
         if self.mode == "coro":
-            self.alternative = groups.coro.AlternativeGroup(self.client.get, key, self.session, self.args)
-            self.exchange = groups.coro.ExchangeGroup(self.client.get, key, self.session, self.args)
-            self.fundamental = groups.coro.FundamentalGroup(self.client.get, key, self.session, self.args)
-            self.market = groups.coro.MarketGroup(self.client.get, key, self.session, self.args)
+            self.alternative = groups.coro.AlternativeGroup(*common)
+            self.exchange = groups.coro.ExchangeGroup(*common)
+            self.fundamental = groups.coro.FundamentalGroup(*common)
+            self.market = groups.coro.MarketGroup(*common)
         else:
-            self.alternative = groups.sync.AlternativeGroup(self.client.get, key, self.session, self.args)
-            self.exchange = groups.sync.ExchangeGroup(self.client.get, key, self.session, self.args)
-            self.fundamental = groups.sync.FundamentalGroup(self.client.get, key, self.session, self.args)
-            self.market = groups.sync.MarketGroup(self.client.get, key, self.session, self.args)
+            self.alternative = groups.sync.AlternativeGroup(*common)
+            self.exchange = groups.sync.ExchangeGroup(*common)
+            self.fundamental = groups.sync.FundamentalGroup(*common)
+            self.market = groups.sync.MarketGroup(*common)
+
+    async def flush(self):
+        """Wait for pending write-behind queue writes."""
+        if self.queue is not None:
+            await self.queue.flush()
 
     async def destroy(self):
-        """Manually close client session."""
-        if self.session and hasattr(self.client, "destroy"):
-            await self.client.destroy(self.session)
+        """Manually close client session, pending write-behind queue writes are awaited first."""
+        try:
+            await self.flush()
+        finally:
+            if self.session and hasattr(self.client, "destroy"):
+                await self.client.destroy(self.session)
@@ -1,22 +1,29 @@
 # -*- coding: utf-8 -*-
 from typing import List
 import json
+import time
 from collections import deque
 import websockets
 from eodhdc import exceptions
+from eodhdc.metrics import Metrics
 
 
 class EODHDWebSockets:
     """EODHD WebSockets client class"""
 
-    def __init__(self, key: str = "demo", buffer: [int, bool] = False, args: dict = None):
+    def __init__(
+        self, key: str = "demo", buffer: [int, bool] = False, args: dict = None, metrics: Metrics = None
+    ):
         """
         :param key: api token.
         :param buffer: enable and set buffer size.
         :param args: websocket connection arguments.
+        :param metrics: metrics collector.
         """
         self.key = key
         self.args = args or {}
+        self.metrics = metrics
+        self.endpoint = None
         self.base = "wss://ws.eodhistoricaldata.com/ws"
         self.authorized = False
         self.active = False
@@ -32,6 +39,7 @@ class EODHDWebSockets:
         """
         if endpoint not in ["us", "us-quote", "forex", "crypto", "index"]:
             raise exceptions.WebsocketUnknownEndpoint(f"Unknown endpoint '{endpoint}'")
+        self.endpoint = endpoint
         # pylint: disable=no-member
         return websockets.connect(f"{self.base}/{endpoint}?api_token={self.key}", **self.args)
 
@@ -80,7 +88,11 @@ class EODHDWebSockets:
         """
         await self.authorize(websocket)
         while self.active:
-            msg = json.loads(await websocket.recv())
+            raw = await websocket.recv()
+            started = time.perf_counter()
+            msg = json.loads(raw)
+            if self.metrics:
+                self.metrics.message(self.endpoint, len(raw), time.perf_counter() - started)
             if "status" in msg or "status_code" in msg:
                 code = msg.get("status_code", msg.get("status", None))
                 raise exceptions.WebsocketResponseError(code, msg["message"])
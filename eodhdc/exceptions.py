@@ -22,6 +22,14 @@ class ClientHTTPError(ClientException):
         super().__init__(self.message)
 
 
+class ClientNotModified(ClientHTTPError):
+    """Client not modified response exception, raised for conditional requests."""
+
+    def __init__(self, headers: dict = None):
+        self.headers = headers if headers is not None else {}
+        super().__init__(304, "Not Modified")
+
+
 class ModuleException(Exception):
     """Base module exception."""
 
@@ -46,6 +54,9 @@ class JSONDecodeError(ModuleException):
         self.message = message
         super().__init__(self.message)
 
+    def __reduce__(self):
+        return self.__class__, (self.orig, self.message)
+
 
 class BytesDecodeError(ModuleException):
     """Bytes decoding exception."""
@@ -55,6 +66,9 @@ class BytesDecodeError(ModuleException):
         self.message = message
         super().__init__(self.message)
 
+    def __reduce__(self):
+        return self.__class__, (self.orig, self.message)
+
 
 class PandasRuntimeError(ModuleException):
     """Pandas runtime exception."""
@@ -64,6 +78,9 @@ class PandasRuntimeError(ModuleException):
         self.message = message
         super().__init__(self.message)
 
+    def __reduce__(self):
+        return self.__class__, (self.orig, self.message)
+
 
 class UnknownClient(ModuleException):
     """Unknown client exception."""
@@ -73,6 +90,10 @@ class ImproperClient(ModuleException):
     """Improper client exception."""
 
 
+class ImproperMiddleware(ModuleException):
+    """Improper middleware exception."""
+
+
 class WebsocketException(Exception):
     """Base websocket exception."""
 
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument,too-many-arguments
+from typing import Union, List
+import pandas as pd
+from eodhdc.base import BaseGroup
+from eodhdc.registry import endpoint
+
+
+class MarketGroup(BaseGroup):
+
+    """Stock Market Prices, Splits and Dividends Data API group.
+    https://eodhistoricaldata.com/financial-apis/category/historical-prices-live-data-apis/
+    """
+
+    name = "market"
+
+    @endpoint("eod/{ticker}", schema={
+        "Date": "datetime64[ns]", "Open": "float64", "High": "float64", "Low": "float64",
+        "Close": "float64", "Adjusted_close": "float64", "Volume": "float64"
+    })
+    def historical(
+        self, ticker: str, period: str = "d", order: str = "a", start: str = None, finish: str = None,
+        extract: str = None, fmt: str = "csv", args: dict = None, output: str = "content", writer: dict = None
+    ) -> Union[bytes, dict, str, pd.DataFrame]:
+        """End-Of-Day Historical Stock Market Data API.
+
+        :param ticker: ticker in form {symbol-name}.{exchange-id}.
+        :param period: "d" - daily, "w" - weekly, "m" - monthly.
+        :param order: dates order, "a" - ascending, "d" - descending.
+        :param start: period start date, "YYYY-MM-DD".
+        :param finish: period end date, "YYYY-MM-DD".
+        :param extract: endpoint specific filter.
+        :param fmt: response output format, "csv" or "json".
+        :param args: additional / override client arguments.
+        :param output: output format for 'process' method.
+        :param writer: pandas writer parameters.
+        :return: data in requested output format.
+        """
+
+    @endpoint("real-time/{tickers[0]}", extra=lambda arguments: {"s": arguments["tickers"][1:]})
+    def delayed(
+        self, tickers: List[str], extract: str = None, fmt: str = "csv",
+        args: dict = None, output: str = "content", writer: dict = None
+    ) -> Union[bytes, dict, str, pd.DataFrame]:
+        """Live (Delayed) Stock Prices API.
+
+        :param tickers: list of tickers.
+        :param extract: endpoint specific filter.
+        :param fmt: response output format, "csv" or "json".
+        :param args: additional / override client arguments.
+        :param output: output format for 'process' method.
+        :param writer: pandas writer parameters.
+        :return: data in requested output format.
+        """
+
+    @endpoint("div/{ticker}")
+    def dividends(
+        self, ticker: str, start: str = None, finish: str = None,
+        fmt: str = "csv", args: dict = None, output: str = "content", writer: dict = None
+    ) -> Union[bytes, dict, str, pd.DataFrame]:
+        """Historical Dividends API.
+
+        :param ticker: ticker in form {symbol-name}.{exchange-id}.
+        :param start: period start date, "YYYY-MM-DD".
+        :param finish: period end date, "YYYY-MM-DD".
+        :param fmt: response output format, "csv" or "json".
+        :param args: additional / override client arguments.
+        :param output: output format for 'process' method.
+        :param writer: pandas writer parameters.
+        :return: data in requested output format.
+        """
+
+    @endpoint("splits/{ticker}")
+    def splits(
+        self, ticker: str, start: str = None, finish: str = None,
+        fmt: str = "csv", args: dict = None, output: str = "content", writer: dict = None
+    ) -> Union[bytes, dict, str, pd.DataFrame]:
+        """Historical Splits API.
+
+        :param ticker: ticker in form {symbol-name}.{exchange-id}.
+        :param start: period start date, "YYYY-MM-DD".
+        :param finish: period end date, "YYYY-MM-DD".
+        :param fmt: response output format, "csv" or "json".
+        :param args: additional / override client arguments.
+        :param output: output format for 'process' method.
+        :param writer: pandas writer parameters.
+        :return: data in requested output format.
+        """
+
+    @endpoint("technical/{ticker}", exclude=["params"], extra=lambda arguments: arguments["params"] or {})
+    def indicators(
+        self, ticker: str, function: str, params: dict = None, order: str = "a",
+        splitadjusted_only: str = None, start: str = None, finish: str = None,
+        extract: str = None, fmt: str = "csv", args: dict = None, output: str = "content", writer: dict = None
+    ) -> Union[bytes, dict, str, pd.DataFrame]:
+        """Technical Indicator API.
+
+        :param ticker: ticker in form {symbol-name}.{exchange-id}.
+        :param function: technical indicator function.
+        :param params: technical indicator function parameters.
+        :param order: dates order, "a" - ascending, "d" - descending.
+        :param splitadjusted_only: closed adjusted only with splits.
+        :param start: period start date, "YYYY-MM-DD".
+        :param finish: period end date, "YYYY-MM-DD".
+        :param extract: endpoint specific filter.
+        :param fmt: response output format, "csv" or "json".
+        :param args: additional / override client arguments.
+        :param output: output format for 'process' method.
+        :param writer: pandas writer parameters.
+        :return: data in requested output format.
+        """
+
+    @endpoint("intraday/{ticker}")
+    def intraday(
+        self, ticker: str, interval: str = "1m", start: int = None, finish: int = None,
+        fmt: str = "csv", args: dict = None, output: str = "content", writer: dict = None
+    ) -> Union[bytes, dict, str, pd.DataFrame]:
+        """Intraday Historical Data API.
+
+        :param ticker: ticker in form {symbol-name}.{exchange-id}.
+        :param interval: "5m" - 5 minutes, "1h" - 1 hour, "1m" - 1 minute.
+        :param start: period start date, UNIX time with UTC timezone, "1564752900".
+        :param finish: period end date, UNIX time with UTC timezone, "1564753200".
+        :param fmt: response output format, "csv" or "json".
+        :param args: additional / override client arguments.
+        :param output: output format for 'process' method.
+        :param writer: pandas writer parameters.
+        :return: data in requested output format.
+        """
+
+    @endpoint("options/{ticker}")
+    def options(
+        self, ticker: str, start: str = None, finish: str = None,
+        contract: str = None, trade_date_start: str = None, trade_date_finish: str = None,
+        args: dict = None, output: str = "content", writer: dict = None
+    ) -> Union[bytes, dict, str, pd.DataFrame]:
+        """Options Data API.
+
+        :param ticker: ticker in form {symbol-name}.{exchange-id}.
+        :param start: period start date, "YYYY-MM-DD".
+        :param finish: period end date, "YYYY-MM-DD".
+        :param contract: contract name.
+        :param trade_date_start: last trade period start date, "YYYY-MM-DD".
+        :param trade_date_finish: last trade period end date, "YYYY-MM-DD".
+        :param args: additional / override client arguments.
+        :param output: output format for 'process' method.
+        :param writer: pandas writer parameters.
+        :return: data in requested output format.
+        """
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=too-few-public-methods
+from typing import Callable, Any
+import time
+import threading
+from collections import defaultdict
+
+STAGES = ["network", "parse", "write"]
+
+
+class Metrics:
+    """Requests and websocket messages metrics collector."""
+
+    def __init__(self, sink: Callable = None):
+        """
+        :param sink: callable receiving every observation event, like <OpenTelemetry> or custom one,
+            Prometheus text format is available with <prometheus> method, event format:
+            {"kind": "request", "name": <endpoint>, "bytes": <int>, "error": <exception class name or None>,
+            "network": <seconds>, "parse": <seconds>, "write": <seconds>}
+            {"kind": "message", "name": <websocket endpoint>, "bytes": <int>, "decode": <seconds>}
+        """
+        self.sink = sink
+        self.lock = threading.Lock()
+        self.requests = defaultdict(lambda: {"count": 0, "bytes": 0, **{stage: 0.0 for stage in STAGES}})
+        self.errors = defaultdict(int)
+        self.messages = defaultdict(lambda: {"count": 0, "bytes": 0, "decode": 0.0, "first": None, "last": None})
+
+    def observe(self, request: Any):
+        """Record completed group request.
+
+        :param request: group request passed through middleware chain,
+            stored body returned for "304 Not Modified" response is not counted as received.
+        """
+        response = request.response
+        received = response and not request.cached and isinstance(response[1], bytes)
+        event = {
+            "kind": "request", "name": request.name,
+            "bytes": len(response[1]) if received else 0,
+            "error": type(request.error).__name__ if request.error else None,
+            "network": request.elapsed or 0.0,
+            "parse": request.timings.get("parse", 0.0),
+            "write": request.timings.get("write", 0.0)
+        }
+        with self.lock:
+            stats = self.requests[request.name]
+            stats["count"] += 1
+            stats["bytes"] += event["bytes"]
+            for stage in STAGES:
+                stats[stage] += event[stage]
+            if event["error"]:
+                self.errors[(request.name, event["error"])] += 1
+        if self.sink:
+            self.sink(event)
+
+    def message(self, name: str, size: int, decode: float):
+        """Record received websocket message.
+
+        :param name: websocket endpoint.
+        :param size: message size.
+        :param decode: message decoding time.
+        """
+        event = {"kind": "message", "name": name, "bytes": size, "decode": decode}
+        with self.lock:
+            stats = self.messages[name]
+            stats["count"] += 1
+            stats["bytes"] += size
+            stats["decode"] += decode
+            stats["last"] = time.monotonic()
+            if stats["first"] is None:
+                stats["first"] = stats["last"]
+        if self.sink:
+            self.sink(event)
+
+    def snapshot(self) -> dict:
+        """Get collected metrics.
+
+        :return: metrics dictionary with "requests", "errors" and "messages" keys,
+            messages statistics additionally contain "rate" in messages per second.
+        """
+        with self.lock:
+            messages = {}
+            for name, stats in self.messages.items():
+                period = (stats["last"] or 0) - (stats["first"] or 0)
+                messages[name] = {
+                    "count": stats["count"], "bytes": stats["bytes"], "decode": stats["decode"],
+                    "rate": stats["count"] / period if period > 0 else 0.0
+                }
+            return {
+                "requests": {name: dict(stats) for name, stats in self.requests.items()},
+                "errors": {f"{name}:{error}": count for (name, error), count in self.errors.items()},
+                "messages": messages
+            }
+
+    def prometheus(self) -> str:
+        """Export collected metrics in Prometheus text format, every family is type line followed by its samples.
+
+        :return: metrics exposition text.
+        """
+        snapshot = self.snapshot()
+        requests = sorted(snapshot["requests"].items())
+        messages = sorted(snapshot["messages"].items())
+        errors = sorted((tuple(key.split(":")), count) for key, count in snapshot["errors"].items())
+        families = {
+            "eodhdc_requests_total": [
+                (f'endpoint="{name}"', stats["count"]) for name, stats in requests
+            ],
+            "eodhdc_received_bytes_total": [
+                (f'endpoint="{name}"', stats["bytes"]) for name, stats in requests
+            ],
+            "eodhdc_request_seconds_total": [
+                (f'endpoint="{name}",stage="{stage}"', stats[stage]) for name, stats in requests for stage in STAGES
+            ],
+            "eodhdc_errors_total": [
+                (f'endpoint="{name}",exception="{error}"', count) for (name, error), count in errors
+            ],
+            "eodhdc_messages_total": [
+                (f'endpoint="{name}"', stats["count"]) for name, stats in messages
+            ],
+            "eodhdc_decode_seconds_total": [
+                (f'endpoint="{name}"', stats["decode"]) for name, stats in messages
+            ]
+        }
+        lines = []
+        for family, samples in families.items():
+            lines.append(f"# TYPE {family} counter")
+            lines.extend(f"{family}{{{labels}}} {value}" for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetry:
+    """OpenTelemetry metrics sink."""
+
+    def __init__(self, meter: Any):
+        """
+        :param meter: OpenTelemetry meter, like metrics.get_meter("eodhdc").
+        """
+        self.requests = meter.create_counter("eodhdc.requests", description="Requests count")
+        self.received = meter.create_counter("eodhdc.received", unit="By", description="Received bytes")
+        self.errors = meter.create_counter("eodhdc.errors", description="Errors count")
+        self.duration = meter.create_histogram("eodhdc.duration", unit="s", description="Request stages time")
+        self.messages = meter.create_counter("eodhdc.messages", description="Websocket messages count")
+        self.decode = meter.create_histogram("eodhdc.decode", unit="s", description="Websocket decoding time")
+
+    def __call__(self, event: dict):
+        """Record observation event.
+
+        :param event: <Metrics> event.
+        """
+        attributes = {"endpoint": event["name"]}
+        if event["kind"] == "message":
+            self.messages.add(1, attributes)
+            self.received.add(event["bytes"], attributes)
+            self.decode.record(event["decode"], attributes)
+            return
+        self.requests.add(1, attributes)
+        self.received.add(event["bytes"], attributes)
+        if event["error"]:
+            self.errors.add(1, {**attributes, "exception": event["error"]})
+        for stage in STAGES:
+            self.duration.record(event[stage], {**attributes, "stage": stage})
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=too-few-public-methods
+from typing import Union, Callable, Coroutine, List, Tuple, MutableMapping
+from urllib.parse import urlencode
+import time
+import asyncio
+import threading
+import functools
+from eodhdc import exceptions
+
+
+class Request:  # pylint: disable=too-many-instance-attributes
+    """Group request passing through middleware chain."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, endpoint, arguments: dict, url: str, params: dict, args: dict):
+        """
+        :param endpoint: endpoint description.
+        :param arguments: group method arguments.
+        :param url: request target.
+        :param params: request parameters.
+        :param args: client arguments.
+        """
+        self.endpoint = endpoint
+        self.name = f"{endpoint.group}.{endpoint.name}"
+        self.arguments = arguments
+        self.url = url
+        self.params = params
+        self.args = args
+        self.target = None
+        self.response = None
+        self.cached = False
+        self.error = None
+        self.started = None
+        self.elapsed = None
+        self.timings = {}
+
+    def __repr__(self):
+        return f"Request({self.name})"
+
+
+def dispatch(
+    request: Request, chain: List[Callable], transport: Callable, index: int = 0
+) -> Union[Tuple[str, bytes, dict], Coroutine]:
+    """Pass request through middleware chain to the transport.
+
+    Middleware is a callable accepting request and next handler, returning response tuple,
+    asynchronous clients require coroutine functions:
+
+        def middleware(request, call):
+            # before-send
+            response = call(request)
+            # after-receive
+            return response
+
+    :param request: group request.
+    :param chain: middleware list, outermost first.
+    :param transport: handler sending request using client.
+    :param index: current middleware index.
+    :return: response or coroutine returning response for asynchronous clients.
+    """
+    if index >= len(chain):
+        return transport(request)
+    return chain[index](request, functools.partial(dispatch, chain=chain, transport=transport, index=index + 1))
+
+
+def iscoroutine(middleware: Callable) -> bool:
+    """Check that middleware is asynchronous.
+
+    :param middleware: middleware callable.
+    :return: check result.
+    """
+    return asyncio.iscoroutinefunction(middleware) or asyncio.iscoroutinefunction(
+        getattr(middleware, "__call__", None)
+    )
+
+
+class RateLimit:
+    """Requests rate limiting middleware for synchronous clients."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: requests per second.
+        :param burst: requests allowed to be sent without delay.
+        """
+        self.interval = 1 / rate
+        self.burst = burst
+        self.slot = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve sending slot.
+
+        :return: delay before sending.
+        """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.slot, now - (self.burst - 1) * self.interval)
+            self.slot = slot + self.interval
+            return slot - now
+
+    def __call__(self, request: Request, call: Callable) -> Tuple[str, bytes, dict]:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return call(request)
+
+
+class CoroRateLimit(RateLimit):
+    """Requests rate limiting middleware for asynchronous clients."""
+
+    # pylint: disable=invalid-overridden-method
+    async def __call__(self, request: Request, call: Callable) -> Tuple[str, bytes, dict]:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await call(request)
+
+
+class Conditional:
+    """Conditional requests middleware for synchronous clients.
+
+    Remembers "ETag" and "Last-Modified" validators with response body and sends "If-None-Match" and
+    "If-Modified-Since" headers on repeated requests, "304 Not Modified" response returns stored body.
+    """
+
+    def __init__(self, store: MutableMapping = None, names: List[str] = None):
+        """
+        :param store: responses store, any mapping like dict, shelve or disk cache, default - in-memory dict.
+        :param names: endpoints names like "exchange.tickers", default - endpoints with data freshness ttl.
+        """
+        self.store = store if store is not None else {}
+        self.names = names
+
+    def key(self, request: Request) -> Union[str, None]:
+        """Get request store key.
+
+        :param request: group request.
+        :return: store key or None if request is not conditional.
+        """
+        if request.target is not None:
+            return None
+        if self.names is None and not request.endpoint.ttl:
+            return None
+        if self.names is not None and request.name not in self.names:
+            return None
+        query = urlencode(sorted((key, str(value)) for key, value in request.params.items() if key != "api_token"))
+        return f"{request.url}?{query}" if query else request.url
+
+    def prepare(self, request: Request, key: str) -> Union[tuple, None]:
+        """Add validators of stored response to request headers.
+
+        :param request: group request.
+        :param key: store key.
+        :return: stored response.
+        """
+        stored = self.store.get(key)
+        if stored is None:
+            return None
+        headers = {}
+        if stored[2].get("ETag"):
+            headers["If-None-Match"] = stored[2]["ETag"]
+        if stored[2].get("Last-Modified"):
+            headers["If-Modified-Since"] = stored[2]["Last-Modified"]
+        request.args = {**request.args, "headers": {**(request.args.get("headers") or {}), **headers}}
+        return stored
+
+    def remember(self, key: str, response: Tuple[str, bytes, dict]):
+        """Store response with validators.
+
+        :param key: store key.
+        :param response: client response.
+        """
+        validators = {name: response[2].get(name) for name in ["ETag", "Last-Modified"] if response[2].get(name)}
+        if validators and isinstance(response[1], bytes):
+            self.store[key] = (response[0], response[1], validators)
+
+    def __call__(self, request: Request, call: Callable) -> Tuple[str, bytes, dict]:
+        key = self.key(request)
+        if key is None:
+            return call(request)
+        stored = self.prepare(request, key)
+        try:
+            response = call(request)
+        except exceptions.ClientNotModified as ex:
+            if stored is None:
+                raise
+            request.response = (stored[0], stored[1], {**stored[2], **ex.headers})
+            request.cached = True
+            return request.response
+        self.remember(key, response)
+        return response
+
+
+class CoroConditional(Conditional):
+    """Conditional requests middleware for asynchronous clients."""
+
+    # pylint: disable=invalid-overridden-method
+    async def __call__(self, request: Request, call: Callable) -> Tuple[str, bytes, dict]:
+        key = self.key(request)
+        if key is None:
+            return await call(request)
+        stored = self.prepare(request, key)
+        try:
+            response = await call(request)
+        except exceptions.ClientNotModified as ex:
+            if stored is None:
+                raise
+            request.response = (stored[0], stored[1], {**stored[2], **ex.headers})
+            request.cached = True
+            return request.response
+        self.remember(key, response)
+        return response
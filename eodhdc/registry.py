@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+from typing import Union, Callable, Dict, List
+import re
+import string
+import inspect
+import functools
+
+REGISTRY: Dict[str, "Endpoint"] = {}
+
+
+class Endpoint:
+    """Declarative endpoint description."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, path: Union[str, Callable], exclude: Union[List[str], Callable] = None,
+        extra: Callable = None, renames: dict = None, schema: dict = None,
+        paging: dict = None, ttl: int = None
+    ):
+        """
+        :param path: endpoint path relative to api base, formatted with method arguments,
+            or callable returning path for method arguments.
+        :param exclude: method arguments to exclude from query in addition to path fields,
+            or callable returning such list for method arguments.
+        :param extra: callable returning additional query values for method arguments.
+        :param renames: method argument to query parameter renames in addition to common ones.
+        :param schema: response columns data types for tabular output.
+        :param paging: pagination description, format:
+            {"limit": <limit argument>, "offset": <offset argument>, "size": <max limit>, "cap": <max offset>}
+        :param ttl: data freshness in seconds, None if data is not suitable for caching.
+        """
+        self.path = path
+        self.exclude = exclude or []
+        self.extra = extra
+        self.renames = renames or {}
+        self.schema = schema or {}
+        self.paging = paging or {}
+        self.ttl = ttl
+        self.name = None
+        self.group = None
+        self.fmt = None
+        self.signature = None
+        self.fields = []
+        if isinstance(path, str):
+            self.fields = [
+                re.split(r"[.\[]", field)[0]
+                for _, field, _, _ in string.Formatter().parse(path) if field
+            ]
+
+    def __repr__(self):
+        return f"Endpoint({self.group}.{self.name})"
+
+    def bind(self, args: tuple, kwargs: dict) -> dict:
+        """Bind method call to declared signature.
+
+        :param args: positional arguments, including group instance.
+        :param kwargs: keyword arguments.
+        :return: method arguments with defaults applied, excluding group instance.
+        """
+        bound = self.signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments.pop("self", None)
+        return arguments
+
+    def url(self, arguments: dict) -> str:
+        """Build endpoint path.
+
+        :param arguments: method arguments.
+        :return: path relative to api base.
+        """
+        if callable(self.path):
+            return self.path(arguments)
+        return self.path.format(**arguments)
+
+    def query(self, arguments: dict) -> dict:
+        """Build query source for group <prepare> method.
+
+        :param arguments: method arguments.
+        :return: query source dictionary.
+        """
+        if self.extra:
+            return {**arguments, **self.extra(arguments)}
+        return arguments
+
+    def excludes(self, arguments: dict) -> list:
+        """Get arguments to exclude from query.
+
+        :param arguments: method arguments.
+        :return: list of arguments names.
+        """
+        exclude = self.exclude(arguments) if callable(self.exclude) else self.exclude
+        return self.fields + list(exclude)
+
+
+def endpoint(path: Union[str, Callable], **kwargs) -> Callable:
+    """Declare group method as API endpoint.
+
+    :param path: endpoint path, see <Endpoint> for details.
+    :param kwargs: other <Endpoint> parameters.
+    :return: decorator.
+    """
+    def decorator(func: Callable) -> Callable:
+        spec = Endpoint(path, **kwargs)
+        spec.name = func.__name__
+        spec.signature = inspect.signature(func)
+        fmt = spec.signature.parameters.get("fmt")
+        spec.fmt = fmt.default if fmt else "json"
+        func.endpoint = spec
+        return func
+    return decorator
+
+
+def _sync(func: Callable) -> Callable:
+    """Generate synchronous group method."""
+    spec = func.endpoint
+
+    @functools.wraps(func)
+    def method(self, *args, **kwargs):
+        return self.call(spec, spec.bind((self, *args), kwargs))
+    return method
+
+
+def _coro(func: Callable) -> Callable:
+    """Generate asynchronous group method."""
+    spec = func.endpoint
+
+    @functools.wraps(func)
+    async def method(self, *args, **kwargs):
+        return await self.acall(spec, spec.bind((self, *args), kwargs))
+    return method
+
+
+def generate(mode: str) -> Callable:
+    """Generate group class methods from endpoints declaration of its base classes.
+
+    :param mode: client mode, "sync" or "coro".
+    :return: class decorator.
+    """
+    def decorator(group: type) -> type:
+        group.mode = mode
+        for base in group.__bases__:
+            for name, member in vars(base).items():
+                spec = getattr(member, "endpoint", None)
+                if not isinstance(spec, Endpoint):
+                    continue
+                spec.group = group.name
+                REGISTRY[f"{group.name}.{name}"] = spec
+                setattr(group, name, _coro(member) if mode == "coro" else _sync(member))
+        return group
+    return decorator
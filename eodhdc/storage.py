@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+from typing import Callable, Any, Iterator, BinaryIO
+import os
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK = 256 * 1024
+
+
+@contextlib.contextmanager
+def atomic(path: str) -> Iterator[BinaryIO]:
+    """Open temporary file for writing, replacing destination only on success.
+
+    :param path: destination file path.
+    :return: temporary file handle.
+    """
+    temp = f"{path}.part"
+    try:
+        with open(temp, "wb") as handle:
+            yield handle
+        os.replace(temp, path)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+class WriteBehind:
+    """Write-behind queue for asynchronous clients.
+
+    Group methods with file output return as soon as response is decoded,
+    file writing is done in queue thread pool and can be awaited with <flush> method.
+    """
+
+    def __init__(self, workers: int = 4, limit: int = 0):
+        """
+        :param workers: writing threads count.
+        :param limit: maximum pending writes, further writes wait for free slot, 0 - unlimited.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eodhdc-write")
+        self.limit = limit
+        self.pending = set()
+        self.errors = []
+        self.slots = None
+
+    async def put(self, func: Callable, *args: Any) -> asyncio.Future:
+        """Schedule writing function call.
+
+        :param func: writing function.
+        :param args: function arguments.
+        :return: writing future.
+        """
+        if self.limit:
+            if self.slots is None:
+                self.slots = asyncio.Semaphore(self.limit)
+            await self.slots.acquire()
+        future = asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        self.pending.add(future)
+        future.add_done_callback(self.done)
+        return future
+
+    def done(self, future: asyncio.Future):
+        """Release completed writing and keep its error for <flush>.
+
+        :param future: writing future.
+        """
+        self.pending.discard(future)
+        if self.slots is not None:
+            self.slots.release()
+        if not future.cancelled() and future.exception() is not None:
+            self.errors.append(future.exception())
+
+    async def flush(self):
+        """Wait for all pending writes, raise first writing error if any."""
+        while self.pending:
+            await asyncio.wait(list(self.pending))
+        if self.errors:
+            errors, self.errors = self.errors, []
+            raise errors[0]
+
+    async def close(self):
+        """Flush pending writes and shutdown threads."""
+        try:
+            await self.flush()
+        finally:
+            self.executor.shutdown(wait=True)
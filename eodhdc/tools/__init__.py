@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from eodhdc.tools.calendar import Calendar, Calendars
+from eodhdc.tools.events import Events
+from eodhdc.tools.indicators import Indicator
+from eodhdc.tools.live import LiveView
+from eodhdc.tools.macro import Warehouse
+from eodhdc.tools.news import Ingester
+from eodhdc.tools.options import Chains
+from eodhdc.tools.orchestrator import Orchestrator
+from eodhdc.tools.refresher import Refresher, Store
+from eodhdc.tools.screener import Query, Screener
+from eodhdc.tools.snapshot import Snapshot
+from eodhdc.tools.universe import Universe
+
+__all__ = [
+    "Calendar", "Calendars", "Chains", "Events", "Indicator", "Ingester", "LiveView", "Orchestrator", "Query",
+    "Refresher", "Screener", "Snapshot", "Store", "Universe", "Warehouse"
+]
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+from typing import Mapping, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+from eodhdc.tools.panel import Panel, timeline
+
+PRICES = ["Open", "High", "Low", "Close"]
+AMOUNTS = ["unadjustedValue", "value", "dividend"]
+
+
+def ratio(split: Union[str, float]) -> float:
+    """Convert split to new to old shares ratio.
+
+    :param split: split in form "{new}/{old}", like "4.000000/1.000000", or number.
+    :return: ratio.
+    """
+    if isinstance(split, str) and "/" in split:
+        new, old = split.split("/", 1)
+        return float(new) / float(old)
+    return float(split)
+
+
+def amounts(dividends: pd.DataFrame) -> np.ndarray:
+    """Get unadjusted dividend amounts, adjusted values are used when unadjusted ones are missing.
+
+    :param dividends: dividends frame, as returned by <market.dividends> or bulk dividends.
+    :return: amounts array.
+    """
+    result = pd.Series(np.nan, index=dividends.index)
+    for column in AMOUNTS:
+        if column in dividends.columns:
+            result = result.fillna(pd.to_numeric(dividends[column], errors="coerce"))
+    return result.to_numpy(dtype=float)
+
+
+def events(dates: pd.DatetimeIndex, actions: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Get rows of last dates before actions ex-dates.
+
+    :param dates: ascending dates.
+    :param actions: splits or dividends frame with "date" column.
+    :return: rows and mask of actions applicable to dates.
+    """
+    rows = dates.searchsorted(pd.to_datetime(actions["date"]).to_numpy()) - 1
+    return rows, rows >= 0
+
+
+def factors(
+    dates: pd.DatetimeIndex, close: np.ndarray, splits: Sequence[pd.DataFrame] = None,
+    dividends: Sequence[pd.DataFrame] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate cumulative adjustment factors.
+
+    Every action sets event factor at last date before its ex-date, split factor is old to new shares ratio,
+    dividend factor is one minus dividend to previous close ratio. Cumulative factors are products of all
+    later event factors, calculated with single reversed cumulative product over dates axis.
+
+    :param dates: ascending dates.
+    :param close: unadjusted close prices, dates x tickers array.
+    :param splits: every ticker splits frame or None.
+    :param dividends: every ticker dividends frame or None.
+    :return: split factors and total split and dividend factors, dates x tickers arrays.
+    """
+    split, dividend = np.ones(close.shape), np.ones(close.shape)
+    previous = pd.DataFrame(close).ffill().to_numpy()
+    for column, frame in enumerate(splits or []):
+        if frame is not None and not frame.empty:
+            rows, mask = events(dates, frame)
+            np.multiply.at(split[:, column], rows[mask], 1 / np.array([ratio(item) for item in frame["split"]])[mask])
+    for column, frame in enumerate(dividends or []):
+        if frame is not None and not frame.empty:
+            rows, mask = events(dates, frame)
+            values = 1 - amounts(frame)[mask] / previous[rows[mask], column]
+            np.multiply.at(dividend[:, column], rows[mask], np.where(np.isfinite(values), values, 1.0))
+    split = np.cumprod(split[::-1], axis=0)[::-1]
+    return split, split * np.cumprod(dividend[::-1], axis=0)[::-1]
+
+
+def adjust(
+    prices: Union[pd.DataFrame, Panel], splits: Union[pd.DataFrame, Mapping[str, pd.DataFrame]] = None,
+    dividends: Union[pd.DataFrame, Mapping[str, pd.DataFrame]] = None, kind: str = "all", ohlc: bool = False
+) -> Union[pd.DataFrame, Panel]:
+    """Adjust unadjusted historical prices for splits and dividends.
+
+    "Adjusted_close" is recalculated from "Close", so it matches <market.historical> adjusted close,
+    open, high, low and close prices with volume are adjusted too if requested.
+
+    :param prices: ticker historical prices frame or panel.
+    :param splits: ticker splits frame, ticker to splits frame mapping for panel.
+    :param dividends: ticker dividends frame, ticker to dividends frame mapping for panel.
+    :param kind: "all" - splits and dividends, "splits" - splits only.
+    :param ohlc: adjust open, high, low and close prices and volume.
+    :return: adjusted frame or panel copy.
+    """
+    if isinstance(prices, Panel):
+        splits = [(splits or {}).get(ticker) for ticker in prices.tickers]
+        dividends = [(dividends or {}).get(ticker) for ticker in prices.tickers]
+        data = {field: prices.values[:, :, position] for position, field in enumerate(prices.fields)}
+        dates = prices.dates
+    else:
+        frame = prices.sort_values("Date") if "Date" in prices.columns else prices.sort_index()
+        splits, dividends = [splits], [dividends]
+        data = {field: frame[[field]].to_numpy(dtype=float) for field in PRICES + ["Volume"] if field in frame}
+        dates = timeline(frame)
+    split, total = factors(dates, data["Close"], splits, dividends)
+    factor = total if kind == "all" else split
+    adjusted = {"Adjusted_close": data["Close"] * factor}
+    if ohlc:
+        adjusted.update({field: data[field] * factor for field in PRICES if field in data})
+        if "Volume" in data:
+            adjusted["Volume"] = data["Volume"] / split
+    if isinstance(prices, Panel):
+        values = prices.values.copy()
+        for field, array in adjusted.items():
+            if field in prices.fields:
+                values[:, :, prices.fields.index(field)] = array
+        return Panel(dates, prices.tickers, prices.fields, values, prices.errors)
+    return frame.assign(**{field: array[:, 0] for field, array in adjusted.items()})
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+from typing import Callable, Iterable, Dict, Tuple, Any, Union, Coroutine
+import asyncio
+import inspect
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+Results = Tuple[Dict[Any, Any], Dict[Any, Exception]]
+
+
+def fetch(
+    method: Callable, keys: Iterable, concurrency: int = 8, **params: Any
+) -> Union[Results, Coroutine[Any, Any, Results]]:
+    """Call group method for every key concurrently.
+
+    Synchronous methods are called in threads pool, asynchronous ones are gathered
+    with limited concurrency, in that case coroutine is returned.
+
+    :param method: group method accepting key as first argument, like <eodhdc.market.historical>.
+    :param keys: keys to call method with, like tickers.
+    :param concurrency: maximum concurrent calls.
+    :param params: additional method parameters.
+    :return: key to result and key to error mappings.
+    """
+    keys = list(dict.fromkeys(keys))
+    if inspect.iscoroutinefunction(method):
+        return afetch(method, keys, concurrency, **params)
+    results, errors = {}, {}
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        futures = {key: executor.submit(method, key, **params) for key in keys}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as ex:  # pylint: disable=broad-except
+                errors[key] = ex
+    return results, errors
+
+
+async def afetch(method: Callable, keys: Iterable, concurrency: int = 8, **params: Any) -> Results:
+    """Call asynchronous group method for every key concurrently, see <fetch> function.
+
+    :param method: group method accepting key as first argument.
+    :param keys: keys to call method with.
+    :param concurrency: maximum concurrent calls.
+    :param params: additional method parameters.
+    :return: key to result and key to error mappings.
+    """
+    keys = list(dict.fromkeys(keys))
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def call(key):
+        async with semaphore:
+            return await method(key, **params)
+
+    values = await asyncio.gather(*[call(key) for key in keys], return_exceptions=True)
+    results, errors = {}, {}
+    for key, value in zip(keys, values):
+        if isinstance(value, Exception):
+            errors[key] = value
+        else:
+            results[key] = value
+    return results, errors
+
+
+def then(value: Union[Any, Coroutine], func: Callable) -> Union[Any, Coroutine]:
+    """Apply function to value, or to coroutine result returning new coroutine.
+
+    :param value: value or coroutine.
+    :param func: function to apply, coroutine returned by it is awaited too.
+    :return: function result or coroutine returning it.
+    """
+    if inspect.isawaitable(value):
+        async def wrapper():
+            result = func(await value)
+            return await result if inspect.isawaitable(result) else result
+        return wrapper()
+    return func(value)
+
+
+def pages(method: Callable, paging: dict, **params: Any) -> Union[list, Coroutine[Any, Any, list]]:
+    """Call paginated group method until last page or offset cap, see <Endpoint> paging description.
+
+    :param method: group method, like <alternative.news>, coroutine is returned for asynchronous ones.
+    :param paging: endpoint pagination description.
+    :param params: method parameters.
+    :return: items of all pages.
+    """
+    size, cap, items = paging["size"], paging["cap"], []
+
+    def collect(page, offset):
+        page = page if isinstance(page, list) else []
+        items.extend(page)
+        if len(page) < size or offset + size > cap:
+            return items
+        return request(offset + size)
+
+    def request(offset):
+        page = method(**params, **{paging["limit"]: size, paging["offset"]: offset})
+        return then(page, functools.partial(collect, offset=offset))
+
+    return request(0)
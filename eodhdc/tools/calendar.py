@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+from functools import partial
+from typing import List, Tuple, Sequence, Union, Coroutine, Any
+import numpy as np
+import pandas as pd
+from eodhdc.tools.batch import fetch, then
+
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+INTERVALS = {"1m": 120, "5m": 600, "1h": 7200}
+
+Date = Union[str, pd.Timestamp, np.datetime64]
+
+
+class Calendar:
+    """Exchange trading calendar built from exchange details.
+
+    Working days and holidays are kept in numpy business days calendar, so trading day checks
+    and previous / next session lookups are done with binary search over sorted holidays.
+    """
+
+    def __init__(self, details: dict, closed: Sequence[str] = ("official",)):
+        """
+        :param details: exchange details, as returned by exchange group <details> method "content" output.
+        :param closed: holiday types when exchange is closed, holidays without type are closed too.
+        """
+        hours = details.get("TradingHours") or {}
+        days = [day.strip()[:3].title() for day in (hours.get("WorkingDays") or "Mon,Tue,Wed,Thu,Fri").split(",")]
+        holidays = [
+            item["Date"] for item in (details.get("ExchangeHolidays") or {}).values()
+            if item.get("Date") and (not item.get("Type") or item["Type"] in closed)
+        ]
+        self.code = details.get("Code")
+        self.timezone = details.get("Timezone") or "UTC"
+        self.open = pd.Timedelta(hours.get("Open") or "00:00:00")
+        self.close = pd.Timedelta(hours.get("Close") or "23:59:59")
+        self.weekmask = [int(day in days) for day in WEEKDAYS]
+        self.holidays = np.unique(np.array(holidays, dtype="datetime64[D]"))
+        self.busdays = np.busdaycalendar(weekmask=self.weekmask, holidays=self.holidays)
+
+    def __repr__(self):
+        return f"Calendar({self.code})"
+
+    @classmethod
+    def load(
+        cls, eodhd: Any, exchange: str = "US", start: str = None, finish: str = None, **kwargs: Any
+    ) -> Union["Calendar", Coroutine[Any, Any, "Calendar"]]:
+        """Load exchange calendar.
+
+        :param eodhd: EODHDClient instance, coroutine is returned for asynchronous clients.
+        :param exchange: exchange code.
+        :param start: holidays period start date, "YYYY-MM-DD".
+        :param finish: holidays period end date, "YYYY-MM-DD".
+        :param kwargs: additional calendar parameters.
+        :return: calendar.
+        """
+        return then(eodhd.exchange.details(exchange, start, finish), partial(cls, **kwargs))
+
+    @staticmethod
+    def day(date: Date) -> np.datetime64:
+        """Convert date to numpy day.
+
+        :param date: date.
+        :return: day.
+        """
+        return np.datetime64(pd.Timestamp(date).date(), "D")
+
+    def is_trading_day(self, date: Date) -> bool:
+        """Check exchange is open on date.
+
+        :param date: date.
+        :return: check result.
+        """
+        return bool(np.is_busday(self.day(date), busdaycal=self.busdays))
+
+    def next_session(self, date: Date, inclusive: bool = False) -> pd.Timestamp:
+        """Get next trading day.
+
+        :param date: date.
+        :param inclusive: return date itself if it is trading day.
+        :return: trading day.
+        """
+        day = self.day(date) + (0 if inclusive else 1)
+        return pd.Timestamp(np.busday_offset(day, 0, roll="forward", busdaycal=self.busdays))
+
+    def previous_session(self, date: Date, inclusive: bool = False) -> pd.Timestamp:
+        """Get previous trading day.
+
+        :param date: date.
+        :param inclusive: return date itself if it is trading day.
+        :return: trading day.
+        """
+        day = self.day(date) - (0 if inclusive else 1)
+        return pd.Timestamp(np.busday_offset(day, 0, roll="backward", busdaycal=self.busdays))
+
+    def session_bounds(self, date: Date) -> Union[Tuple[pd.Timestamp, pd.Timestamp], None]:
+        """Get regular trading session open and close time.
+
+        :param date: date.
+        :return: open and close time in UTC timezone, None if exchange is closed.
+        """
+        if not self.is_trading_day(date):
+            return None
+        day = pd.Timestamp(self.day(date)).tz_localize(self.timezone)
+        return (day + self.open).tz_convert("UTC"), (day + self.close).tz_convert("UTC")
+
+    def sessions(self, start: Date, finish: Date) -> pd.DatetimeIndex:
+        """Get trading days in period.
+
+        :param start: period start date, inclusive.
+        :param finish: period end date, inclusive.
+        :return: trading days.
+        """
+        days = np.arange(self.day(start), self.day(finish) + 1, dtype="datetime64[D]")
+        return pd.DatetimeIndex(days[np.is_busday(days, busdaycal=self.busdays)])
+
+    def windows(self, start: Date, finish: Date, days: int) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """Split period into windows of at most given calendar days, skipping days when exchange is closed.
+
+        Windows start and end on trading days, so periods without sessions are never requested.
+
+        :param start: period start date, inclusive.
+        :param finish: period end date, inclusive.
+        :param days: maximum window length in calendar days.
+        :return: first and last trading day of every window.
+        """
+        sessions = self.sessions(start, finish)
+        result = []
+        position = 0
+        while position < len(sessions):
+            first = sessions[position]
+            last = sessions.searchsorted(first + pd.Timedelta(days=days), side="left") - 1
+            result.append((first, sessions[last]))
+            position = last + 1
+        return result
+
+
+class Calendars:
+    """Exchange calendars cache, every exchange details are requested once."""
+
+    def __init__(self, eodhd: Any, start: str = None, finish: str = None, **kwargs: Any):
+        """
+        :param eodhd: EODHDClient instance.
+        :param start: holidays period start date, "YYYY-MM-DD".
+        :param finish: holidays period end date, "YYYY-MM-DD".
+        :param kwargs: additional calendar parameters.
+        """
+        self.eodhd = eodhd
+        self.start = start
+        self.finish = finish
+        self.kwargs = kwargs
+        self.items = {}
+
+    def __contains__(self, exchange: str):
+        return exchange in self.items
+
+    def get(self, exchange: str) -> Union[Calendar, Coroutine[Any, Any, Calendar]]:
+        """Get exchange calendar, loading it on first use.
+
+        :param exchange: exchange code.
+        :return: calendar, coroutine is returned for asynchronous clients.
+        """
+        def remember(calendar):
+            self.items[exchange] = calendar
+            return calendar
+
+        if exchange not in self.items:
+            return then(Calendar.load(self.eodhd, exchange, self.start, self.finish, **self.kwargs), remember)
+        if self.eodhd.mode == "coro":
+            async def cached():
+                return self.items[exchange]
+            return cached()
+        return self.items[exchange]
+
+
+# pylint: disable=too-many-arguments, too-many-locals
+def intraday(
+    eodhd: Any, calendar: Calendar, ticker: str, start: Date, finish: Date, interval: str = "1m",
+    concurrency: int = 4, **params: Any
+) -> Union[pd.DataFrame, Coroutine[Any, Any, pd.DataFrame]]:
+    """Backfill intraday data requesting only windows with trading sessions.
+
+    :param eodhd: EODHDClient instance, coroutine is returned for asynchronous clients.
+    :param calendar: ticker exchange calendar.
+    :param ticker: ticker in form {symbol-name}.{exchange-id}.
+    :param start: period start date.
+    :param finish: period end date.
+    :param interval: "1m", "5m" or "1h", defines maximum window length.
+    :param concurrency: maximum concurrent requests.
+    :param params: additional <market.intraday> parameters.
+    :return: intraday data, windows failed to fetch are available in frame attrs "errors".
+    """
+    windows = []
+    for first, last in calendar.windows(start, finish, INTERVALS.get(interval, INTERVALS["1m"])):
+        begin = first.tz_localize(calendar.timezone)
+        end = last.tz_localize(calendar.timezone) + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+        windows.append((int(begin.timestamp()), int(end.timestamp())))
+
+    def request(window):
+        return eodhd.market.intraday(
+            ticker, interval, window[0], window[1], output="pandas", **{"fmt": "csv", **params}
+        )
+
+    method = request
+    if eodhd.mode == "coro":
+        async def method(window):  # pylint: disable=function-redefined
+            return await request(window)
+
+    def merge(fetched):
+        results, errors = fetched
+        frames = [results[window] for window in windows if window in results]
+        frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        frame.attrs["errors"] = errors
+        return frame
+
+    return then(fetch(method, windows, concurrency), merge)
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+from typing import Iterable, Dict, Union, Coroutine, Any
+import pathlib
+import datetime
+import functools
+import pandas as pd
+from eodhdc.registry import REGISTRY
+from eodhdc.storage import atomic
+from eodhdc.tools.batch import fetch, pages, then
+
+KINDS = {
+    "economic": {"date": "date", "key": ["country", "type", "comparison", "period", "date"]},
+    "earnings": {"date": "report_date", "key": ["code", "date"]},
+    "ipos": {"date": "start_date", "key": ["code", "exchange"]},
+    "splits": {"date": "split_date", "key": ["code", "split_date"]},
+}
+
+
+def diff(stored: pd.DataFrame, fetched: pd.DataFrame, key: list) -> pd.DataFrame:
+    """Compare fetched rows with stored ones by key.
+
+    :param stored: stored rows.
+    :param fetched: fetched rows.
+    :param key: key columns.
+    :return: fetched rows which are new or differ from stored ones, with "change" column "insert" or "update".
+    """
+    columns = list(dict.fromkeys(list(fetched.columns) + list(stored.columns)))
+    left = fetched.set_index(key, drop=False).reindex(columns=columns)
+    right = stored.set_index(key, drop=False).reindex(columns=columns)
+    common = left.index.intersection(right.index)
+    same = left.loc[common].eq(right.loc[common]) | (left.loc[common].isna() & right.loc[common].isna())
+    updated = common[~same.all(axis=1).to_numpy()]
+    changes = pd.concat([
+        left.loc[left.index.difference(right.index)].assign(change="insert"),
+        left.loc[updated].assign(change="update")
+    ])
+    return changes.reset_index(drop=True)
+
+
+class Events:
+    """Economic events and corporate calendar table, synchronized by date windows.
+
+    Only window which can still change is requested, from recent past to near future,
+    fetched rows are compared with stored ones by key and only inserts, updates and deletes are applied.
+    Stored rows of window missing from fetched ones are deleted, like cancelled IPOs, unless economic
+    events window reached paging offset cap. Trends calendar is not synchronized, as it is requested
+    by symbols rather than by date window.
+    """
+
+    def __init__(self, path: str, past: int = 7, future: int = 30):
+        """
+        :param path: store directory, one pickle file per kind.
+        :param past: synchronized window days before today.
+        :param future: synchronized window days after today.
+        """
+        self.path = pathlib.Path(path)
+        self.past = past
+        self.future = future
+        self.errors = {}
+
+    def file(self, kind: str) -> pathlib.Path:
+        """Get kind table file path.
+
+        :param kind: one of <KINDS>.
+        :return: file path.
+        """
+        return self.path / f"{kind}.pickle"
+
+    def load(self, kind: str) -> pd.DataFrame:
+        """Load kind table.
+
+        :param kind: one of <KINDS>.
+        :return: rows sorted by event date.
+        """
+        path = self.file(kind)
+        if path.exists():
+            return pd.read_pickle(path)
+        return pd.DataFrame(columns=list(dict.fromkeys(KINDS[kind]["key"] + [KINDS[kind]["date"]])), dtype=object)
+
+    def window(self, today: str = None) -> tuple:
+        """Get synchronized window.
+
+        :param today: current date, "YYYY-MM-DD", default - today.
+        :return: window start and end dates, "YYYY-MM-DD".
+        """
+        today = datetime.date.fromisoformat(today) if today else datetime.date.today()
+        return (
+            (today - datetime.timedelta(days=self.past)).isoformat(),
+            (today + datetime.timedelta(days=self.future)).isoformat()
+        )
+
+    # pylint: disable=too-many-arguments
+    def sync(
+        self, eodhd: Any, kinds: Iterable[str] = tuple(KINDS), start: str = None, finish: str = None,
+        today: str = None
+    ) -> Union[Dict[str, pd.DataFrame], Coroutine[Any, Any, Dict[str, pd.DataFrame]]]:
+        """Fetch window of every kind concurrently, apply and return changes.
+
+        :param eodhd: EODHDClient instance, coroutine is returned for asynchronous clients.
+        :param kinds: kinds from <KINDS>.
+        :param start: window start date override, "YYYY-MM-DD", like for initial history load.
+        :param finish: window end date override, "YYYY-MM-DD".
+        :param today: current date, "YYYY-MM-DD", default - today.
+        :return: kind to changed rows mapping, kinds failed to fetch are available in <errors>.
+        """
+        default = self.window(today)
+        start, finish = start or default[0], finish or default[1]
+
+        def request(kind):
+            if kind == "economic":
+                paging = REGISTRY["alternative.events"].paging
+                return pages(eodhd.alternative.events, paging, start=start, finish=finish)
+            payload = eodhd.fundamental.calendar(kind, start=start, finish=finish, fmt="json")
+            return then(payload, lambda value: value.get(kind) or [] if isinstance(value, dict) else [])
+
+        if eodhd.mode == "coro":
+            async def pull(kind):
+                return await request(kind)
+        else:
+            pull = request
+        return then(fetch(pull, kinds, len(KINDS)), functools.partial(self.apply, start=start, finish=finish))
+
+    def apply(self, fetched: tuple, start: str, finish: str) -> Dict[str, pd.DataFrame]:
+        """Apply fetched windows to stored tables.
+
+        :param fetched: fetched results and errors.
+        :param start: window start date, "YYYY-MM-DD".
+        :param finish: window end date, "YYYY-MM-DD".
+        :return: kind to changed rows mapping, "change" column is "insert", "update" or "delete".
+        """
+        results, self.errors = fetched
+        paging = REGISTRY["alternative.events"].paging
+        return {
+            kind: self.merge(kind, items, (start, finish) if (
+                kind != "economic" or len(items) < paging["cap"] + paging["size"]
+            ) else None) for kind, items in results.items()
+        }
+
+    def merge(self, kind: str, items: list, window: tuple = None) -> pd.DataFrame:
+        """Merge fetched rows into stored table.
+
+        :param kind: one of <KINDS>.
+        :param items: fetched rows.
+        :param window: fully fetched window start and end dates, stored rows of it missing from fetched
+            ones are deleted, None - rows are not deleted.
+        :return: changed rows with "change" column.
+        """
+        key, date = KINDS[kind]["key"], KINDS[kind]["date"]
+        stored = self.load(kind)
+        frame = pd.DataFrame(items)
+        frame = frame.reindex(columns=list(dict.fromkeys(key + [date] + list(frame.columns))))
+        frame[key] = frame[key].fillna("").astype(str)
+        frame = frame.drop_duplicates(key, keep="last")
+        changes = diff(stored, frame, key)
+        rows = changes.drop(columns="change")
+        kept = ~stored.set_index(key).index.isin(rows.set_index(key).index)
+        if window is not None:
+            missing = ~stored.set_index(key).index.isin(frame.set_index(key).index)
+            deleted = missing & stored[date].astype(str).str[:10].between(*window).to_numpy()
+            changes = pd.concat([changes, stored[deleted].assign(change="delete")], ignore_index=True)
+            kept &= ~deleted
+        if not changes.empty:
+            stored = pd.concat([stored[kept], rows], ignore_index=True)
+            self.save(kind, stored.sort_values([date] + key, ignore_index=True))
+        return changes
+
+    def save(self, kind: str, frame: pd.DataFrame):
+        """Save kind table.
+
+        :param kind: one of <KINDS>.
+        :param frame: rows.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        with atomic(str(self.file(kind))) as handle:
+            frame.to_pickle(handle)
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from typing import Mapping, Dict, Tuple, Union, Any
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from eodhdc.tools.panel import Panel
+
+Arrays = Dict[str, np.ndarray]
+
+DEFAULTS = {
+    "sma": {"period": 50}, "ema": {"period": 50}, "wma": {"period": 50}, "rsi": {"period": 50},
+    "atr": {"period": 50}, "bbands": {"period": 50}, "stddev": {"period": 50}, "volatility": {"period": 50},
+    "slope": {"period": 50}, "avgvol": {"period": 50},
+    "macd": {"fast_period": 12, "slow_period": 26, "signal_period": 9},
+    "stochastic": {"fast_kperiod": 14, "slow_kperiod": 3, "slow_dperiod": 3}
+}
+FIELDS = {
+    "atr": ["High", "Low", "Close"], "stochastic": ["High", "Low", "Close"], "avgvol": ["Volume"]
+}
+
+
+def rolling(values: np.ndarray, period: int, method: str) -> np.ndarray:
+    """Apply rolling window aggregation along dates axis, windows with missing values are NaN.
+
+    :param values: dates x tickers array.
+    :param period: window length.
+    :param method: pandas rolling method, like "mean", "std", "min", "max".
+    :return: dates x tickers array.
+    """
+    window = pd.DataFrame(values).rolling(period, min_periods=period)
+    return getattr(window, method)(ddof=0).to_numpy() if method == "std" else getattr(window, method)().to_numpy()
+
+
+def weighted(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Apply weighted sum over sliding windows along dates axis.
+
+    :param values: dates x tickers array.
+    :param weights: window weights, oldest first.
+    :return: dates x tickers array, first window length - 1 rows are NaN.
+    """
+    result = np.full(values.shape, np.nan)
+    if len(values) >= len(weights):
+        result[len(weights) - 1:] = sliding_window_view(values, len(weights), axis=0) @ weights
+    return result
+
+
+def ewm(values: np.ndarray, alpha: float, seed: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Exponentially weighted moving average along dates axis, seeded with first value or previous average.
+
+    Missing values keep previous average and produce NaN.
+
+    :param values: dates x tickers array.
+    :param alpha: smoothing factor.
+    :param seed: previous average of every ticker.
+    :return: dates x tickers array and last average of every ticker.
+    """
+    previous = np.full(values.shape[1:], np.nan) if seed is None else seed.copy()
+    result = np.empty(values.shape)
+    for row, current in enumerate(values):
+        missing = np.isnan(current)
+        updated = np.where(missing, previous, previous + alpha * (current - previous))
+        previous = np.where(np.isnan(previous), current, updated)
+        result[row] = np.where(missing, np.nan, previous)
+    return result, previous
+
+
+def shifted(values: np.ndarray, previous: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Get previous valid values along dates axis.
+
+    :param values: dates x tickers array.
+    :param previous: last valid value of every ticker before values.
+    :return: dates x tickers array of previous valid values and last valid value of every ticker.
+    """
+    frame = pd.DataFrame(np.vstack([
+        np.full((1,) + values.shape[1:], np.nan) if previous is None else previous[None], values
+    ])).ffill().to_numpy()
+    return frame[:-1], frame[-1]
+
+
+def sma(data: Arrays, state: dict, period: int) -> Arrays:
+    """Simple moving average."""
+    return {"sma": rolling(data["price"], period, "mean")}
+
+
+def ema(data: Arrays, state: dict, period: int) -> Arrays:
+    """Exponential moving average."""
+    result, state["ema"] = ewm(data["price"], 2 / (period + 1), state.get("ema"))
+    return {"ema": result}
+
+
+def wma(data: Arrays, state: dict, period: int) -> Arrays:
+    """Linear weighted moving average."""
+    weights = np.arange(1, period + 1, dtype=float)
+    return {"wma": weighted(data["price"], weights / weights.sum())}
+
+
+def rsi(data: Arrays, state: dict, period: int) -> Arrays:
+    """Relative strength index, Wilder's smoothing."""
+    previous, state["close"] = shifted(data["price"], state.get("close"))
+    delta = data["price"] - previous
+    gain, state["gain"] = ewm(np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0)), 1 / period,
+                              state.get("gain"))
+    loss, state["loss"] = ewm(np.where(delta < 0, -delta, np.where(np.isnan(delta), np.nan, 0.0)), 1 / period,
+                              state.get("loss"))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {"rsi": np.where(loss == 0, np.where(gain == 0, 50.0, 100.0), 100 - 100 / (1 + gain / loss))}
+
+
+def macd(data: Arrays, state: dict, fast_period: int, slow_period: int, signal_period: int) -> Arrays:
+    """Moving average convergence / divergence."""
+    fast, state["fast"] = ewm(data["price"], 2 / (fast_period + 1), state.get("fast"))
+    slow, state["slow"] = ewm(data["price"], 2 / (slow_period + 1), state.get("slow"))
+    signal, state["signal"] = ewm(fast - slow, 2 / (signal_period + 1), state.get("signal"))
+    return {"macd": fast - slow, "signal": signal, "divergence": fast - slow - signal}
+
+
+def atr(data: Arrays, state: dict, period: int) -> Arrays:
+    """Average true range, Wilder's smoothing."""
+    previous, state["close"] = shifted(data["Close"], state.get("close"))
+    spread = data["High"] - data["Low"]
+    ranges = np.fmax(spread, np.fmax(np.abs(data["High"] - previous), np.abs(data["Low"] - previous)))
+    ranges = np.where(np.isnan(spread), np.nan, ranges)
+    result, state["atr"] = ewm(ranges, 1 / period, state.get("atr"))
+    return {"atr": result}
+
+
+def bbands(data: Arrays, state: dict, period: int) -> Arrays:
+    """Bollinger bands, two standard deviations."""
+    middle = rolling(data["price"], period, "mean")
+    deviation = rolling(data["price"], period, "std")
+    return {"uband": middle + 2 * deviation, "mband": middle, "lband": middle - 2 * deviation}
+
+
+def stddev(data: Arrays, state: dict, period: int) -> Arrays:
+    """Standard deviation of prices."""
+    return {"stddev": rolling(data["price"], period, "std")}
+
+
+def volatility(data: Arrays, state: dict, period: int) -> Arrays:
+    """Annualized standard deviation of logarithmic returns, percents."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(np.log(data["price"]), axis=0, prepend=np.nan)
+    return {"volatility": rolling(returns, period, "std") * np.sqrt(252) * 100}
+
+
+def slope(data: Arrays, state: dict, period: int) -> Arrays:
+    """Linear regression slope of prices."""
+    positions = np.arange(period, dtype=float) - (period - 1) / 2
+    return {"slope": weighted(data["price"], positions / (positions ** 2).sum())}
+
+
+def avgvol(data: Arrays, state: dict, period: int) -> Arrays:
+    """Average volume."""
+    return {"avgvol": rolling(data["Volume"], period, "mean")}
+
+
+def stochastic(data: Arrays, state: dict, fast_kperiod: int, slow_kperiod: int, slow_dperiod: int) -> Arrays:
+    """Stochastic oscillator, slow %K and %D values."""
+    lowest = rolling(data["Low"], fast_kperiod, "min")
+    highest = rolling(data["High"], fast_kperiod, "max")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fast = np.where(highest == lowest, 50.0, 100 * (data["Close"] - lowest) / (highest - lowest))
+    fast = np.where(np.isnan(lowest + highest + data["Close"]), np.nan, fast)
+    kvalues = rolling(fast, slow_kperiod, "mean")
+    return {"k_values": kvalues, "d_values": rolling(kvalues, slow_dperiod, "mean")}
+
+
+FUNCTIONS = {
+    "sma": sma, "ema": ema, "wma": wma, "rsi": rsi, "macd": macd, "atr": atr, "bbands": bbands,
+    "stddev": stddev, "volatility": volatility, "slope": slope, "avgvol": avgvol, "stochastic": stochastic
+}
+LOOKBACKS = {
+    "sma": lambda params: params["period"] - 1, "wma": lambda params: params["period"] - 1,
+    "bbands": lambda params: params["period"] - 1, "stddev": lambda params: params["period"] - 1,
+    "volatility": lambda params: params["period"], "slope": lambda params: params["period"] - 1,
+    "avgvol": lambda params: params["period"] - 1,
+    "stochastic": lambda params: params["fast_kperiod"] + params["slow_kperiod"] + params["slow_dperiod"] - 3
+}
+
+
+class Indicator:
+    """Local technical indicator computed for many tickers at once over dates x tickers arrays.
+
+    Function and parameters names mirror <market.indicators> method. Indicator keeps state
+    between updates, so new bars are computed incrementally: window based functions recompute
+    only last window rows, exponential averages continue from previous averages.
+    """
+
+    def __init__(self, function: str, params: dict = None, field: str = "Adjusted_close"):
+        """
+        :param function: technical indicator function, one of <FUNCTIONS>.
+        :param params: technical indicator function parameters, default - <DEFAULTS>.
+        :param field: price field for single series functions, high, low and close functions use "Close".
+        """
+        if function not in FUNCTIONS:
+            raise ValueError(f"Unsupported indicator function '{function}'")
+        self.function = function
+        self.params = {**DEFAULTS[function], **{key: int(value) for key, value in (params or {}).items()}}
+        self.field = field
+        self.lookback = LOOKBACKS.get(function, lambda params: 0)(self.params)
+        self.state = {}
+        self.tail = {}
+
+    def __repr__(self):
+        return f"Indicator({self.function}, {self.params})"
+
+    def update(self, data: Union[Panel, Mapping[str, np.ndarray]]) -> Union[Dict[str, pd.DataFrame], Arrays]:
+        """Compute indicator values for new bars, first update computes whole history.
+
+        :param data: panel or field to dates x tickers array mapping, tickers must be the same on every update.
+        :return: output name to dates x tickers frame mapping for panel or arrays for mapping.
+        """
+        fields = FIELDS.get(self.function, [self.field])
+        if isinstance(data, Panel):
+            arrays = {field: data.values[:, :, data.fields.index(field)] for field in fields}
+        else:
+            arrays = {field: np.asarray(data[field], dtype=float) for field in fields}
+        skip = len(next(iter(self.tail.values()))) if self.tail else 0
+        if skip:
+            arrays = {field: np.concatenate([self.tail[field], values]) for field, values in arrays.items()}
+        if self.lookback:
+            self.tail = {field: values[-self.lookback:] for field, values in arrays.items()}
+        inputs = arrays if self.function in FIELDS else {"price": arrays[self.field]}
+        result = FUNCTIONS[self.function](inputs, self.state, **self.params)
+        result = {name: values[skip:] for name, values in result.items()}
+        if isinstance(data, Panel):
+            columns = pd.Index(data.tickers, dtype=object)
+            return {name: pd.DataFrame(values, index=data.dates, columns=columns) for name, values in result.items()}
+        return result
+
+
+def calculate(
+    data: Union[Panel, Mapping[str, np.ndarray]], function: str, params: dict = None, **kwargs: Any
+) -> Union[Dict[str, pd.DataFrame], Arrays]:
+    """Compute technical indicator for many tickers at once.
+
+    :param data: panel or field to dates x tickers array mapping.
+    :param function: technical indicator function.
+    :param params: technical indicator function parameters.
+    :param kwargs: additional indicator parameters.
+    :return: output name to dates x tickers frame mapping for panel or arrays for mapping.
+    """
+    return Indicator(function, params, **kwargs).update(data)
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+from typing import List, Sequence, Union, Any
+import time
+import asyncio
+import contextlib
+import numpy as np
+import pandas as pd
+from eodhdc.tools.snapshot import Snapshot
+
+FIELDS = ["price", "bid", "ask", "volume", "size", "timestamp", "updated"]
+KEYS = {"bid": ["bp", "b"], "ask": ["ap", "a"], "size": ["v", "q"]}
+SOURCES = ["none", "rest", "stream"]
+
+
+class LiveView:
+    """Live market state of symbols set, seeded with delayed prices and kept current with WebSockets messages.
+
+    State is kept in per-field arrays with symbol to row mapping, so single symbol reads are constant time
+    and snapshot export is single frame construction. Symbols without stream prices for a while
+    are refreshed with delayed prices requests. Day "volume" comes from delayed prices only,
+    stream trade size is kept in "size" field.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, eodhd: Any, tickers: Sequence[str], silence: float = 60.0, interval: float = 15.0, **kwargs: Any
+    ):
+        """
+        :param eodhd: EODHDClient instance for delayed prices requests.
+        :param tickers: tickers in form {symbol-name}.{exchange-id}, stream symbols are symbol names.
+        :param silence: seconds without updates after which symbol is refreshed with delayed prices.
+        :param interval: silent symbols check interval in seconds.
+        :param kwargs: additional <Snapshot> parameters.
+        """
+        self.eodhd = eodhd
+        self.tickers = list(dict.fromkeys(tickers))
+        self.symbols = [ticker.rsplit(".", 1)[0] for ticker in self.tickers]
+        self.rows = {**{symbol: row for row, symbol in enumerate(self.symbols)},
+                     **{ticker: row for row, ticker in enumerate(self.tickers)}}
+        self.silence = silence
+        self.interval = interval
+        self.kwargs = kwargs
+        self.values = {field: np.full(len(self.tickers), np.nan) for field in FIELDS}
+        self.sources = np.zeros(len(self.tickers), dtype=np.int8)
+        self.errors = {}
+        self.active = False
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def __contains__(self, symbol: str):
+        return symbol in self.rows
+
+    def __repr__(self):
+        return f"LiveView({len(self.tickers)} tickers)"
+
+    def get(self, symbol: str) -> Union[dict, None]:
+        """Get symbol state.
+
+        :param symbol: ticker or stream symbol.
+        :return: state with <FIELDS> and "source" keys, None if symbol is unknown.
+        """
+        row = self.rows.get(symbol)
+        if row is None:
+            return None
+        state = {field: float(values[row]) for field, values in self.values.items()}
+        state["source"] = SOURCES[self.sources[row]]
+        return state
+
+    def price(self, symbol: str) -> float:
+        """Get symbol last price.
+
+        :param symbol: ticker or stream symbol.
+        :return: price, NaN if unknown.
+        """
+        row = self.rows.get(symbol)
+        return float(self.values["price"][row]) if row is not None else np.nan
+
+    def frame(self) -> pd.DataFrame:
+        """Export state of all symbols.
+
+        :return: frame indexed by ticker with <FIELDS> and "source" columns.
+        """
+        frame = pd.DataFrame(self.values, index=pd.Index(self.tickers, dtype=object, name="ticker"))
+        frame["source"] = pd.Categorical.from_codes(self.sources, SOURCES)
+        return frame
+
+    def apply(self, message: dict) -> bool:
+        """Apply WebSockets trade or quote message.
+
+        Quote messages set price to bid and ask mid, only messages setting price update timestamp
+        and mark symbol as updated.
+
+        :param message: message with "s" symbol key, trades, quotes, forex and crypto messages are supported.
+        :return: True if message symbol is tracked.
+        """
+        row = self.rows.get(message.get("s"))
+        if row is None:
+            return False
+        for field, keys in KEYS.items():
+            for key in keys:
+                value = message.get(key)
+                if value is not None:
+                    self.values[field][row] = value
+                    break
+        price = message.get("p")
+        for bid, ask in [("bp", "ap"), ("b", "a")]:
+            if price is None and message.get(bid) is not None and message.get(ask) is not None:
+                price = (float(message[ask]) + float(message[bid])) / 2
+        if price is not None:
+            self.values["price"][row] = price
+            if message.get("t") is not None:
+                self.values["timestamp"][row] = message["t"]
+            self.values["updated"][row] = time.time()
+            self.sources[row] = 2
+        return True
+
+    def merge(self, frame: pd.DataFrame):
+        """Apply delayed prices quotes, day volume is always applied, prices only if newer than current state.
+
+        :param frame: quotes frame indexed by ticker, as <Snapshot> frame.
+        """
+        frame = frame[frame.index.isin(self.tickers) & frame["close"].notna()]
+        rows = np.array([self.rows[ticker] for ticker in frame.index], dtype=np.int64)
+        stamps = frame["timestamp"].to_numpy(dtype=float) * 1000
+        newer = ~(stamps < self.values["timestamp"][rows])
+        self.values["volume"][rows] = frame["volume"].to_numpy(dtype=float)
+        rows = rows[newer]
+        self.values["price"][rows] = frame["close"].to_numpy(dtype=float)[newer]
+        self.values["timestamp"][rows] = stamps[newer]
+        self.values["updated"][rows] = time.time()
+        self.sources[rows] = 1
+
+    def stale(self, silence: float = None) -> List[str]:
+        """Get tickers without updates for a while.
+
+        :param silence: seconds without updates, default - view silence.
+        :return: tickers.
+        """
+        silence = self.silence if silence is None else silence
+        updated = self.values["updated"]
+        mask = np.isnan(updated) | (updated < time.time() - silence)
+        return [self.tickers[row] for row in np.flatnonzero(mask)]
+
+    async def refresh(self, tickers: Sequence[str] = None):
+        """Refresh tickers with delayed prices requests.
+
+        :param tickers: tickers, default - all tickers.
+        """
+        snapshot = Snapshot(self.eodhd, self.tickers if tickers is None else tickers, **self.kwargs)
+        if self.eodhd.mode == "coro":
+            await snapshot.refresh()
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, snapshot.refresh)
+        self.errors = snapshot.errors
+        self.merge(snapshot.frame)
+
+    async def fallback(self):
+        """Refresh silent tickers with delayed prices on interval while view is active."""
+        while self.active:
+            await asyncio.sleep(self.interval)
+            stale = self.stale()
+            if stale:
+                await self.refresh(stale)
+
+    async def run(self, eodhdws: Any, endpoint: str = "us"):
+        """Seed state with delayed prices and keep it current with WebSockets messages until stopped.
+
+        :param eodhdws: EODHDWebSockets instance.
+        :param endpoint: WebSockets endpoint, "us", "us-quote", "forex", "crypto" or "index".
+        """
+        self.active = True
+        await self.refresh()
+        task = asyncio.ensure_future(self.fallback())
+        try:
+            async with eodhdws.connect(endpoint) as websocket:
+                await eodhdws.subscribe(websocket, self.symbols)
+                async for message in eodhdws.receive(websocket):
+                    self.apply(message)
+                    if not self.active:
+                        eodhdws.deactivate()
+        finally:
+            self.active = False
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def stop(self):
+        """Stop running view after next message."""
+        self.active = False
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+from typing import Iterable, List, Tuple, Union, Coroutine, Any
+import time
+import pathlib
+import itertools
+import pandas as pd
+from eodhdc.registry import REGISTRY
+from eodhdc.storage import atomic
+from eodhdc.tools.batch import fetch, then
+
+COLUMNS = ["country", "indicator", "Date", "Value"]
+
+
+def records(country: str, indicator: str, payload: Any) -> pd.DataFrame:
+    """Convert macro indicator response into long typed frame.
+
+    :param country: country in the Alpha-3 ISO format.
+    :param indicator: macroeconomics data indicator.
+    :param payload: <alternative.macroindicators> method "content" output.
+    :return: frame with <COLUMNS>.
+    """
+    frame = pd.DataFrame(payload if isinstance(payload, list) else [], columns=["Date", "Value"])
+    frame.insert(0, "country", country)
+    frame.insert(1, "indicator", indicator)
+    return typed(frame)
+
+
+def typed(frame: pd.DataFrame) -> pd.DataFrame:
+    """Cast long frame columns.
+
+    :param frame: frame with <COLUMNS>.
+    :return: same frame with text keys, datetime dates and float values.
+    """
+    frame = frame.reindex(columns=COLUMNS)
+    frame[["country", "indicator"]] = frame[["country", "indicator"]].astype(object)
+    frame["Date"] = pd.to_datetime(frame["Date"], errors="coerce")
+    frame["Value"] = pd.to_numeric(frame["Value"], errors="coerce").astype(float)
+    return frame
+
+
+class Warehouse:
+    """Macro indicators warehouse for countries and indicators cross product, kept in single pickle file.
+
+    Every country and indicator cell remembers its fetch time, updates request only cells
+    missing or older than endpoint data freshness, so warm start makes no requests.
+    """
+
+    def __init__(self, path: str, ttl: float = None):
+        """
+        :param path: store file path.
+        :param ttl: cell freshness in seconds, default - <alternative.macroindicators> endpoint ttl.
+        """
+        self.path = pathlib.Path(path)
+        self.ttl = REGISTRY["alternative.macroindicators"].ttl if ttl is None else ttl
+        self.frame = typed(pd.DataFrame(columns=COLUMNS))
+        self.fetched = {}
+        self.errors = {}
+        if self.path.exists():
+            stored = pd.read_pickle(self.path)
+            self.frame, self.fetched = stored["frame"], stored["fetched"]
+
+    def __len__(self):
+        return len(self.fetched)
+
+    def stale(
+        self, countries: Iterable[str], indicators: Iterable[str], now: float = None
+    ) -> List[Tuple[str, str]]:
+        """Get cells missing or older than freshness.
+
+        :param countries: countries in the Alpha-3 ISO format.
+        :param indicators: macroeconomics data indicators.
+        :param now: current unix time, default - time.time().
+        :return: country and indicator pairs.
+        """
+        now = time.time() if now is None else now
+        return [
+            cell for cell in itertools.product(dict.fromkeys(countries), dict.fromkeys(indicators))
+            if self.fetched.get(cell, float("-inf")) < now - self.ttl
+        ]
+
+    # pylint: disable=too-many-arguments
+    def update(
+        self, eodhd: Any, countries: Iterable[str], indicators: Iterable[str], concurrency: int = 8,
+        force: bool = False
+    ) -> Union[List[Tuple[str, str]], Coroutine[Any, Any, List[Tuple[str, str]]]]:
+        """Fetch stale cells concurrently and store them.
+
+        :param eodhd: EODHDClient instance, coroutine is returned for asynchronous clients.
+        :param countries: countries in the Alpha-3 ISO format.
+        :param indicators: macroeconomics data indicators.
+        :param concurrency: maximum concurrent requests.
+        :param force: fetch all cells regardless of freshness.
+        :return: updated cells, cells failed to fetch are available in <errors>.
+        """
+        cells = self.stale(countries, indicators, float("inf") if force else None)
+        if eodhd.mode == "coro":
+            async def request(cell):
+                return await eodhd.alternative.macroindicators(cell[0], cell[1], fmt="json")
+        else:
+            def request(cell):
+                return eodhd.alternative.macroindicators(cell[0], cell[1], fmt="json")
+        return then(fetch(request, cells, concurrency), self.merge)
+
+    def merge(self, fetched: tuple) -> List[Tuple[str, str]]:
+        """Replace stored cells with fetched ones and save store.
+
+        :param fetched: fetched results and errors.
+        :return: updated cells.
+        """
+        results, self.errors = fetched
+        if not results:
+            return []
+        now = time.time()
+        frames = [records(*cell, payload) for cell, payload in results.items()]
+        keys = pd.MultiIndex.from_frame(self.frame[["country", "indicator"]])
+        kept = self.frame[~keys.isin(list(results))]
+        self.frame = pd.concat([kept] + frames, ignore_index=True).sort_values(COLUMNS[:3], ignore_index=True)
+        self.fetched.update({cell: now for cell in results})
+        self.save()
+        return list(results)
+
+    def save(self):
+        """Save store."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic(str(self.path)) as handle:
+            pd.to_pickle({"frame": self.frame, "fetched": self.fetched}, handle)
+
+    def panel(self, countries: Iterable[str] = None, indicators: Iterable[str] = None) -> pd.DataFrame:
+        """Build wide panel of stored values.
+
+        :param countries: countries filter, default - all stored.
+        :param indicators: indicators filter and columns order, default - all stored.
+        :return: float frame indexed by country and date with indicator columns.
+        """
+        frame = self.frame
+        if countries is not None:
+            frame = frame[frame["country"].isin(list(countries))]
+        if indicators is not None:
+            indicators = list(indicators)
+            frame = frame[frame["indicator"].isin(indicators)]
+        frame = frame.dropna(subset=["Date"]).drop_duplicates(COLUMNS[:3], keep="last")
+        panel = frame.set_index(COLUMNS[:3])["Value"].unstack("indicator")
+        panel = panel.reindex(columns=indicators if indicators is not None else sorted(panel.columns))
+        panel.columns.name = None
+        return panel.astype(float)
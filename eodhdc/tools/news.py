@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+from typing import Callable, Iterable, Sequence, List, Union, Coroutine, Any
+import json
+import math
+import sqlite3
+import hashlib
+import pathlib
+import functools
+import numpy as np
+import pandas as pd
+from eodhdc.registry import REGISTRY
+from eodhdc.storage import atomic
+from eodhdc.tools.batch import fetch, pages, then
+
+
+def digest(key: str) -> bytes:
+    """Get compact item key hash.
+
+    :param key: item key.
+    :return: 16 bytes hash.
+    """
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
+class Bloom:
+    """Bloom filter over item hashes, positions are derived from hash halves with double hashing."""
+
+    def __init__(self, capacity: int = 1000000, error: float = 0.001):
+        """
+        :param capacity: expected items count.
+        :param error: false positives rate at capacity.
+        """
+        self.size = max(int(-capacity * math.log(error) / math.log(2) ** 2) // 8 * 8, 64)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.bits = np.zeros(self.size // 8, dtype=np.uint8)
+
+    def positions(self, digests: Sequence[bytes]) -> np.ndarray:
+        """Get bit positions of item hashes.
+
+        :param digests: item hashes.
+        :return: positions array, one row per hash.
+        """
+        halves = np.frombuffer(b"".join(digests), dtype=np.uint64).reshape(-1, 2)
+        steps = np.arange(self.hashes, dtype=np.uint64)
+        return (halves[:, :1] + steps * np.bitwise_or(halves[:, 1:], np.uint64(1))) % np.uint64(self.size)
+
+    def add(self, digests: Sequence[bytes]):
+        """Add item hashes.
+
+        :param digests: item hashes.
+        """
+        if digests:
+            positions = self.positions(digests).ravel()
+            masks = np.left_shift(1, positions & np.uint64(7)).astype(np.uint8)
+            np.bitwise_or.at(self.bits, positions >> np.uint64(3), masks)
+
+    def contains(self, digests: Sequence[bytes]) -> np.ndarray:
+        """Check item hashes, false positives are possible, false negatives are not.
+
+        :param digests: item hashes.
+        :return: boolean mask of possibly added items.
+        """
+        if not digests:
+            return np.zeros(0, dtype=bool)
+        positions = self.positions(digests)
+        bits = (self.bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=1)
+
+
+class Index:
+    """Seen items index, bloom filter answers most lookups in memory, sqlite set confirms possible hits.
+
+    Set and per-query cursors persist across restarts, filter is saved next to them
+    and rebuilt from set if missing or created with other capacity.
+    """
+
+    def __init__(self, path: str, capacity: int = 1000000, error: float = 0.001):
+        """
+        :param path: index file path, filter is stored with ".bloom" suffix.
+        :param capacity: expected items count.
+        :param error: filter false positives rate at capacity.
+        """
+        self.path = pathlib.Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.database = sqlite3.connect(str(self.path))
+        self.database.execute("CREATE TABLE IF NOT EXISTS seen (key BLOB PRIMARY KEY) WITHOUT ROWID")
+        self.database.execute("CREATE TABLE IF NOT EXISTS cursors (name TEXT PRIMARY KEY, value TEXT)")
+        self.bloom = Bloom(capacity, error)
+        self.file = self.path.with_suffix(".bloom")
+        if self.file.exists() and self.file.stat().st_size == self.bloom.bits.nbytes:
+            self.bloom.bits = np.fromfile(str(self.file), dtype=np.uint8)
+        else:
+            for rows in iter(functools.partial(self.database.execute("SELECT key FROM seen").fetchmany, 10000), []):
+                self.bloom.add([row[0] for row in rows])
+
+    def __len__(self):
+        return self.database.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def new(self, digests: Sequence[bytes]) -> List[bool]:
+        """Check item hashes against index.
+
+        :param digests: item hashes.
+        :return: flags of items not seen before.
+        """
+        flags = ~self.bloom.contains(digests)
+        candidates = [key for key, flag in zip(digests, flags) if not flag]
+        found = set()
+        for start in range(0, len(candidates), 500):
+            chunk = candidates[start:start + 500]
+            query = f"SELECT key FROM seen WHERE key IN ({','.join('?' * len(chunk))})"
+            found.update(row[0] for row in self.database.execute(query, chunk))
+        return [bool(flag) or key not in found for key, flag in zip(digests, flags)]
+
+    def add(self, digests: Sequence[bytes]):
+        """Add item hashes to index.
+
+        :param digests: item hashes.
+        """
+        self.bloom.add(digests)
+        self.database.executemany("INSERT OR IGNORE INTO seen VALUES (?)", [(key,) for key in digests])
+
+    def cursor(self, name: str) -> Union[str, None]:
+        """Get query cursor.
+
+        :param name: query name.
+        :return: cursor value, None if not set.
+        """
+        row = self.database.execute("SELECT value FROM cursors WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def advance(self, name: str, value: str):
+        """Set query cursor if it moves forward.
+
+        :param name: query name.
+        :param value: cursor value.
+        """
+        if value and (self.cursor(name) or "") < value:
+            self.database.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?)", (name, value))
+
+    def commit(self):
+        """Persist filter, then set and cursors, so filter never misses committed items."""
+        with atomic(str(self.file)) as handle:
+            handle.write(self.bloom.bits.tobytes())
+        self.database.commit()
+
+    def close(self):
+        """Commit and close index."""
+        self.commit()
+        self.database.close()
+
+
+class Ingester:
+    """News and sentiment ingester, polls queries with moving start window and appends only unseen items.
+
+    Every query remembers date of its newest item and next poll starts from that date,
+    so only recent pages are requested. Articles returned for many tags or symbols
+    are stored once, sentiment rows are stored again only when their values change.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, eodhd: Any, path: str, concurrency: int = 8, capacity: int = 1000000, error: float = 0.001
+    ):
+        """
+        :param eodhd: EODHDClient instance.
+        :param path: store directory with "news.jsonl" and "sentiment.jsonl" files and index.
+        :param concurrency: maximum concurrent requests.
+        :param capacity: expected stored items count.
+        :param error: index filter false positives rate at capacity.
+        """
+        self.eodhd = eodhd
+        self.path = pathlib.Path(path)
+        self.concurrency = concurrency
+        self.index = Index(str(self.path / "index.sqlite"), capacity, error)
+        self.errors = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.index.close()
+
+    def file(self, kind: str) -> pathlib.Path:
+        """Get store file path.
+
+        :param kind: "news" or "sentiment".
+        :return: file path.
+        """
+        return self.path / f"{kind}.jsonl"
+
+    def load(self, kind: str = "news") -> pd.DataFrame:
+        """Load stored items.
+
+        :param kind: "news" or "sentiment".
+        :return: items frame in ingestion order.
+        """
+        path = self.file(kind)
+        if not path.exists() or not path.stat().st_size:
+            return pd.DataFrame()
+        return pd.read_json(path, lines=True, dtype=False, convert_dates=False)
+
+    def news(
+        self, tags: Iterable[str] = (), symbols: Iterable[str] = (), start: str = None, finish: str = None
+    ) -> Union[List[dict], Coroutine[Any, Any, List[dict]]]:
+        """Poll news of tags and symbols, every query starts from its newest stored item date.
+
+        :param tags: news tags.
+        :param symbols: tickers in form {symbol-name}.{exchange-id}.
+        :param start: period start date for queries polled first time, "YYYY-MM-DD".
+        :param finish: period end date, "YYYY-MM-DD".
+        :return: new articles, queries failed to fetch are available in <errors>.
+        """
+        keys = [("tag", tag) for tag in tags] + [("symbol", symbol) for symbol in symbols]
+        starts = {key: self.index.cursor(f"news:{key[0]}:{key[1]}") or start for key in keys}
+        paging = REGISTRY["alternative.news"].paging
+
+        def request(key):
+            params = {key[0]: key[1], "start": starts[key], "finish": finish}
+            return pages(self.eodhd.alternative.news, paging, **params)
+
+        def name(key, item):
+            return f"news:{key[0]}:{key[1]}", str(item.get("date") or "")[:10]
+
+        def identity(item):
+            return item.get("link") or f"{item.get('date')}|{item.get('title')}"
+
+        return then(fetch(self.puller(request), keys, self.concurrency), functools.partial(
+            self.ingest, kind="news", items=lambda key, value: value, name=name, identity=identity
+        ))
+
+    def sentiment(
+        self, lookups: Iterable[str], source: str = "news", start: str = None, finish: str = None
+    ) -> Union[List[dict], Coroutine[Any, Any, List[dict]]]:
+        """Poll daily sentiment of tickers, every query starts from its newest stored day.
+
+        :param lookups: tickers in form {symbol-name}.{exchange-id}, or comma separated tickers lists.
+        :param source: media source, "news" or "tweets".
+        :param start: period start date for queries polled first time, "YYYY-MM-DD".
+        :param finish: period end date, "YYYY-MM-DD".
+        :return: new or changed sentiment rows with "ticker" and "source" keys.
+        """
+        keys = list(lookups)
+        starts = {key: self.index.cursor(f"sentiment:{source}:{key}") or start for key in keys}
+
+        def request(key):
+            return self.eodhd.alternative.sentiment(source, key, start=starts[key], finish=finish)
+
+        def items(key, value):  # pylint: disable=unused-argument
+            value = value if isinstance(value, dict) else {}
+            return [{"ticker": ticker, "source": source, **row} for ticker, rows in value.items() for row in rows]
+
+        def name(key, item):
+            return f"sentiment:{source}:{key}", str(item.get("date") or "")[:10]
+
+        def identity(item):
+            return json.dumps(item, sort_keys=True, default=str)
+
+        return then(fetch(self.puller(request), keys, self.concurrency), functools.partial(
+            self.ingest, kind="sentiment", items=items, name=name, identity=identity
+        ))
+
+    def puller(self, request: Callable) -> Callable:
+        """Get fetching function for client mode.
+
+        :param request: function calling group method for key.
+        :return: function or coroutine function.
+        """
+        if self.eodhd.mode == "coro":
+            async def pull(key):
+                return await request(key)
+            return pull
+        return request
+
+    # pylint: disable=too-many-arguments
+    def ingest(
+        self, fetched: tuple, kind: str, items: Callable, name: Callable, identity: Callable
+    ) -> List[dict]:
+        """Append unseen fetched items to store and move query cursors.
+
+        :param fetched: fetched results and errors.
+        :param kind: "news" or "sentiment".
+        :param items: function getting items list from key and fetched value.
+        :param name: function getting cursor name and value from key and item.
+        :param identity: function getting item identity string.
+        :return: new items.
+        """
+        results, self.errors = fetched
+        unique, cursors = {}, {}
+        for key, value in results.items():
+            for item in items(key, value):
+                unique.setdefault(digest(identity(item)), item)
+                cursor, date = name(key, item)
+                cursors[cursor] = max(cursors.get(cursor, ""), date)
+        unique = {key: item for (key, item), flag in zip(unique.items(), self.index.new(list(unique))) if flag}
+        self.append(kind, list(unique.values()))
+        self.index.add(list(unique))
+        for cursor, date in cursors.items():
+            self.index.advance(cursor, date)
+        self.index.commit()
+        return list(unique.values())
+
+    def append(self, kind: str, items: List[dict]):
+        """Append items to store file.
+
+        :param kind: "news" or "sentiment".
+        :param items: items.
+        """
+        if items:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(self.file(kind), "a", encoding="utf-8") as handle:
+                handle.writelines(json.dumps(item, default=str) + "\n" for item in items)
+
+    def close(self):
+        """Persist and close index."""
+        self.index.close()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+from typing import Mapping, Sequence, Dict
+import pandas as pd
+
+STATEMENTS = ["Balance_Sheet", "Cash_Flow", "Income_Statement"]
+SECTIONS = ["General", "Highlights", "Valuation", "SharesStats", "Technicals", "SplitsDividends", "AnalystRatings"]
+EARNINGS = ["History", "Trend", "Annual"]
+
+
+def dig(payload: dict, path: Sequence[str]) -> dict:
+    """Get nested payload node.
+
+    :param payload: fundamentals data.
+    :param path: node keys path.
+    :return: node or empty dict if missing.
+    """
+    node = payload
+    for key in path:
+        if not isinstance(node, dict):
+            return {}
+        node = node.get(key)
+    return node if isinstance(node, dict) else {}
+
+
+def numeric(frame: pd.DataFrame) -> pd.DataFrame:
+    """Convert columns holding only numbers or missing values, including numeric strings, to float.
+
+    :param frame: source frame.
+    :return: converted frame.
+    """
+    columns = {}
+    for column in frame.columns:
+        columns[column] = frame[column]
+        if columns[column].dtype == object:
+            try:
+                columns[column] = columns[column].astype(float)
+            except (ValueError, TypeError):
+                pass
+    return pd.DataFrame(columns, index=frame.index, columns=frame.columns)
+
+
+def table(
+    payloads: Mapping[str, dict], path: Sequence[str], column: str = "Ticker", key: str = "date",
+    dates: bool = True
+) -> pd.DataFrame:
+    """Flatten keyed records node of every payload into single frame.
+
+    Node is a mapping of key to record, like statement by dates or earnings history.
+    Records of all tickers are collected into one frame at once, indexed by ticker and key.
+
+    :param payloads: ticker to fundamentals data mapping, as returned by <fundamentals> method "content" output.
+    :param path: records node keys path, like ["Financials", "Balance_Sheet", "quarterly"].
+    :param column: ticker index level name.
+    :param key: records key index level name.
+    :param dates: parse records keys as dates.
+    :return: records frame.
+    """
+    tickers, keys, records = [], [], []
+    for ticker, payload in payloads.items():
+        node = dig(payload, path)
+        tickers.extend([ticker] * len(node))
+        keys.extend(node.keys())
+        records.extend(record if isinstance(record, dict) else {} for record in node.values())
+    level = pd.to_datetime(keys, errors="coerce") if dates else pd.Index(keys, dtype=object)
+    frame = pd.DataFrame.from_records(records) if records else pd.DataFrame()
+    frame.index = pd.MultiIndex.from_arrays([pd.Index(tickers, dtype=object), level], names=[column, key])
+    frame = frame.drop(columns=[key], errors="ignore")
+    return numeric(frame).sort_index()
+
+
+def statements(
+    payloads: Mapping[str, dict], period: str = "quarterly", names: Sequence[str] = None, column: str = "Ticker"
+) -> Dict[str, pd.DataFrame]:
+    """Flatten financial statements.
+
+    :param payloads: ticker to fundamentals data mapping.
+    :param period: "quarterly" or "yearly".
+    :param names: statements, default - "Balance_Sheet", "Cash_Flow", "Income_Statement".
+    :param column: ticker index level name.
+    :return: statement name to frame indexed by ticker and date mapping.
+    """
+    return {name: table(payloads, ["Financials", name, period], column) for name in names or STATEMENTS}
+
+
+def earnings(
+    payloads: Mapping[str, dict], names: Sequence[str] = None, column: str = "Ticker"
+) -> Dict[str, pd.DataFrame]:
+    """Flatten earnings history, trend and annual data.
+
+    :param payloads: ticker to fundamentals data mapping.
+    :param names: earnings sections, default - "History", "Trend", "Annual".
+    :param column: ticker index level name.
+    :return: section name to frame indexed by ticker and date mapping.
+    """
+    return {name: table(payloads, ["Earnings", name], column) for name in names or EARNINGS}
+
+
+def sections(
+    payloads: Mapping[str, dict], names: Sequence[str] = None, column: str = "Ticker"
+) -> Dict[str, pd.DataFrame]:
+    """Flatten single record sections, nested values are kept as objects.
+
+    :param payloads: ticker to fundamentals data mapping.
+    :param names: sections, default - "General", "Highlights", "Valuation", "SharesStats", "Technicals",
+        "SplitsDividends", "AnalystRatings".
+    :param column: ticker index name.
+    :return: section name to frame indexed by ticker mapping.
+    """
+    tickers = pd.Index(list(payloads.keys()), dtype=object, name=column)
+    result = {}
+    for name in names or SECTIONS:
+        records = [dig(payload, [name]) for payload in payloads.values()]
+        frame = pd.DataFrame.from_records(records) if records else pd.DataFrame()
+        frame.index = tickers
+        result[name] = numeric(frame)
+    return result
+
+
+def tidy(frame: pd.DataFrame, field: str = "field", value: str = "value") -> pd.DataFrame:
+    """Convert wide frame to long format with numeric values only.
+
+    :param frame: wide frame, like statement.
+    :param field: field column name.
+    :param value: value column name.
+    :return: frame with index levels, field and value columns.
+    """
+    numbers = frame.select_dtypes("number")
+    numbers.columns.name = field
+    return numbers.stack().rename(value).reset_index()
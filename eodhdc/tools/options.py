@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+from typing import Mapping, Sequence, List, Union, Coroutine, Any
+import pathlib
+import datetime
+import pandas as pd
+from eodhdc.storage import atomic
+from eodhdc.tools.batch import fetch, then
+from eodhdc.tools.normalize import numeric
+
+COLUMNS = [
+    "underlying", "tradeDate", "expirationDate", "type", "strike", "contractName", "lastTradeDateTime",
+    "lastPrice", "bid", "ask", "change", "changePercent", "volume", "openInterest", "impliedVolatility",
+    "delta", "gamma", "theta", "vega", "rho", "theoretical", "intrinsicValue", "timeValue", "inTheMoney",
+    "daysBeforeExpiration", "contractSize", "currency", "updatedAt"
+]
+DATES = ["tradeDate", "expirationDate", "lastTradeDateTime", "updatedAt"]
+TEXT = ["type", "inTheMoney", "underlying", "contractName", "contractSize", "currency"]
+KEY = ["underlying", "contractName"]
+
+
+def flatten(chains: Mapping[str, dict]) -> pd.DataFrame:
+    """Flatten options chains of many underlyings into single typed frame.
+
+    Contracts of all expirations, calls and puts are collected in one pass and converted
+    into frame at once, numbers, dates and flags are typed column-wise.
+
+    :param chains: underlying to options data mapping, as returned by <market.options> method "content" output.
+    :return: contracts frame with <COLUMNS> first, other contract fields after them.
+    """
+    records = [
+        {"type": kind, **contract, "underlying": underlying}
+        for underlying, payload in chains.items() if isinstance(payload, dict)
+        for expiration in payload.get("data") or []
+        for kind, contracts in (expiration.get("options") or {}).items()
+        for contract in contracts or []
+    ]
+    frame = pd.DataFrame(records)
+    frame = frame.reindex(columns=COLUMNS + [column for column in frame.columns if column not in COLUMNS])
+    numbers = [column for column in frame.columns if column not in TEXT + DATES]
+    frame[numbers] = numeric(frame[numbers])
+    frame[TEXT[2:]] = frame[TEXT[2:]].astype(object)
+    for column in DATES[1:]:
+        frame[column] = pd.to_datetime(frame[column], errors="coerce")
+    frame["tradeDate"] = frame["lastTradeDateTime"].dt.normalize()
+    frame["type"] = frame["type"].astype(str).str.upper().astype("category")
+    frame["inTheMoney"] = frame["inTheMoney"].astype(str).str.upper().eq("TRUE")
+    return frame
+
+
+def download(
+    eodhd: Any, tickers: Sequence[str], concurrency: int = 8, **params: Any
+) -> Union[pd.DataFrame, Coroutine[Any, Any, pd.DataFrame]]:
+    """Fetch options chains of many underlyings concurrently and flatten them.
+
+    :param eodhd: EODHDClient instance, coroutine is returned for asynchronous clients.
+    :param tickers: underlying tickers in form {symbol-name}.{exchange-id}.
+    :param concurrency: maximum concurrent requests.
+    :param params: additional <market.options> parameters, like trade_date_start and trade_date_finish.
+    :return: contracts frame, underlyings failed to fetch are available in frame attrs "errors".
+    """
+    def build(fetched):
+        results, errors = fetched
+        frame = flatten(results)
+        frame.attrs["errors"] = errors
+        return frame
+
+    return then(fetch(eodhd.market.options, tickers, concurrency, **params), build)
+
+
+class Chains:
+    """Daily options chains snapshots store, one pickle file per trade date.
+
+    Updates request only trade dates after last stored one with trade_date_start / trade_date_finish
+    parameters, contracts are split by last trade date and merged into stored snapshots.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: store directory, created on first write.
+        """
+        self.path = pathlib.Path(path)
+        self.errors = {}
+
+    def file(self, date: str) -> pathlib.Path:
+        """Get trade date snapshot file path.
+
+        :param date: trade date, "YYYY-MM-DD".
+        :return: file path.
+        """
+        return self.path / f"{date}.pickle"
+
+    def dates(self) -> List[str]:
+        """Get stored trade dates.
+
+        :return: ascending trade dates, "YYYY-MM-DD".
+        """
+        return sorted(path.stem for path in self.path.glob("*.pickle")) if self.path.exists() else []
+
+    def load(self, start: str = None, finish: str = None) -> pd.DataFrame:
+        """Load snapshots of trade dates period.
+
+        :param start: period start date, "YYYY-MM-DD", inclusive.
+        :param finish: period end date, "YYYY-MM-DD", inclusive.
+        :return: contracts frame.
+        """
+        dates = [date for date in self.dates() if (not start or date >= start) and (not finish or date <= finish)]
+        frames = [pd.read_pickle(self.file(date)) for date in dates]
+        return pd.concat(frames, ignore_index=True) if frames else flatten({})
+
+    def save(self, frame: pd.DataFrame) -> List[str]:
+        """Merge contracts into stored snapshots by trade date, newer contract data replaces stored one.
+
+        :param frame: contracts frame.
+        :return: updated trade dates.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        frame = frame[frame["tradeDate"].notna()]
+        frame.attrs = {}
+        updated = []
+        for day, contracts in frame.groupby(frame["tradeDate"].dt.strftime("%Y-%m-%d"), sort=True):
+            path = self.file(day)
+            if path.exists():
+                contracts = pd.concat([pd.read_pickle(path), contracts], ignore_index=True)
+            contracts = contracts.drop_duplicates(KEY, keep="last").reset_index(drop=True)
+            with atomic(str(path)) as handle:
+                contracts.to_pickle(handle)
+            updated.append(day)
+        return updated
+
+    # pylint: disable=too-many-arguments
+    def update(
+        self, eodhd: Any, tickers: Sequence[str], start: str = None, finish: str = None, concurrency: int = 8
+    ) -> Union[List[str], Coroutine[Any, Any, List[str]]]:
+        """Fetch contracts traded since last stored trade date and store them.
+
+        :param eodhd: EODHDClient instance, coroutine is returned for asynchronous clients.
+        :param tickers: underlying tickers in form {symbol-name}.{exchange-id}.
+        :param start: trade dates period start, "YYYY-MM-DD", default - day after last stored trade date.
+        :param finish: trade dates period end, "YYYY-MM-DD", default - today.
+        :param concurrency: maximum concurrent requests.
+        :return: updated trade dates, underlyings failed to fetch are available in <errors>.
+        """
+        dates = self.dates()
+        if start is None and dates:
+            start = (datetime.date.fromisoformat(dates[-1]) + datetime.timedelta(days=1)).isoformat()
+        finish = finish or datetime.date.today().isoformat()
+
+        def store(frame):
+            self.errors = frame.attrs["errors"]
+            return self.save(frame)
+
+        params = {"trade_date_start": start, "trade_date_finish": finish}
+        return then(download(eodhd, tickers, concurrency, **params), store)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+from typing import List
+import os
+import glob
+import hashlib
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from eodhdc import EODHDClient, exceptions
+from eodhdc.base import EXTENSIONS
+from eodhdc.middleware import CoroRateLimit
+
+PARTITIONS = [".parquet", ".pickle", ".csv", ".feather"]
+
+
+class Orchestrator:
+    """Resumable multi-process download job.
+
+    Tickers are distributed across worker processes, each running its own asynchronous client
+    with a share of the global rate limit. Workers write results in partitions with ticker column,
+    every partition is committed together with its tickers list, so restarted job skips them.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, method: str, state: str, client: str = "aiohttp", key: str = "demo", workers: int = None,
+        rate: float = 15.0, concurrency: int = 8, batch: int = 100, extension: str = ".parquet",
+        column: str = "Ticker", params: dict = None, writer: dict = None, base: str = None
+    ):
+        """
+        :param method: group method accepting ticker as first argument, like "market.historical".
+        :param state: job state and partitions directory.
+        :param client: asynchronous client name.
+        :param key: api token.
+        :param workers: worker processes count, default - CPU count.
+        :param rate: global rate limit, requests per second, shared by started worker processes.
+        :param concurrency: concurrent requests per worker.
+        :param batch: tickers per partition.
+        :param extension: partitions format: parquet, pickle, csv, feather.
+        :param column: ticker column name added to results.
+        :param params: group method parameters.
+        :param writer: group method writer parameters.
+        :param base: api base url override.
+        """
+        if extension not in PARTITIONS:
+            raise exceptions.UnsupportedExtension(f"Unsupported extension '{extension}'")
+        self.state = state
+        self.workers = workers or os.cpu_count() or 1
+        self.config = {
+            "method": method, "state": state, "client": client, "key": key,
+            "rate": rate, "concurrency": concurrency, "batch": batch,
+            "extension": extension, "column": column, "params": params or {},
+            "writer": writer, "base": base
+        }
+        os.makedirs(state, exist_ok=True)
+
+    def done(self) -> set:
+        """Get completed tickers, ones listed next to written partitions.
+
+        :return: tickers set.
+        """
+        result = set()
+        for path in self.partitions():
+            with open(f"{os.path.splitext(path)[0]}.txt", "r", encoding="utf-8") as handle:
+                result.update(line.strip() for line in handle if line.strip())
+        return result
+
+    def pending(self, tickers: List[str]) -> List[str]:
+        """Get tickers not completed yet.
+
+        :param tickers: job tickers.
+        :return: tickers list.
+        """
+        done = self.done()
+        return list(dict.fromkeys(ticker for ticker in tickers if ticker not in done))
+
+    def run(self, tickers: List[str]) -> dict:
+        """Run job for pending tickers.
+
+        :param tickers: job tickers.
+        :return: summary with "done" count and "failed" tickers errors.
+        """
+        pending = self.pending(tickers)
+        summary = {"done": 0, "failed": {}}
+        if not pending:
+            return summary
+        workers = min(self.workers, len(pending))
+        config = {**self.config, "rate": self.config["rate"] / workers}
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = [executor.submit(work, config, pending[index::workers]) for index in range(workers)]
+            for future in futures:
+                result = future.result()
+                summary["done"] += result["done"]
+                summary["failed"].update(result["failed"])
+        return summary
+
+    def partitions(self) -> List[str]:
+        """Get written partitions.
+
+        :return: partitions paths.
+        """
+        return sorted(glob.glob(os.path.join(self.state, f"part-*{self.config['extension']}")))
+
+    def merge(self) -> pd.DataFrame:
+        """Merge written partitions.
+
+        :return: job results.
+        """
+        reader = getattr(pd, f"read_{EXTENSIONS[self.config['extension']]}")
+        frames = [reader(path) for path in self.partitions()]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def work(config: dict, tickers: List[str]) -> dict:
+    """Worker process entry point.
+
+    :param config: job configuration with worker rate limit share.
+    :param tickers: worker tickers.
+    :return: worker summary.
+    """
+    return asyncio.run(awork(config, tickers))
+
+
+# pylint: disable=too-many-locals
+async def awork(config: dict, tickers: List[str]) -> dict:
+    """Download worker tickers in batches.
+
+    :param config: job configuration with worker rate limit share.
+    :param tickers: worker tickers.
+    :return: worker summary.
+    """
+    eodhd = EODHDClient(config["client"], config["key"], middleware=[CoroRateLimit(config["rate"])])
+    if eodhd.mode != "coro":
+        raise exceptions.ImproperClient(f"Client '{config['client']}' is not asynchronous")
+    group, name = config["method"].split(".")
+    method = getattr(getattr(eodhd, group), name)
+    if config["base"]:
+        getattr(eodhd, group).base = config["base"]
+    semaphore = asyncio.Semaphore(config["concurrency"])
+    summary = {"done": 0, "failed": {}}
+
+    async def fetch(ticker):
+        async with semaphore:
+            return await method(ticker, **config["params"], output="pandas", writer=config["writer"])
+
+    try:
+        for offset in range(0, len(tickers), config["batch"]):
+            chunk = tickers[offset:offset + config["batch"]]
+            results = await asyncio.gather(*[fetch(ticker) for ticker in chunk], return_exceptions=True)
+            frames, done = [], []
+            for ticker, result in zip(chunk, results):
+                if isinstance(result, Exception):
+                    summary["failed"][ticker] = repr(result)
+                    continue
+                frames.append(result.assign(**{config["column"]: ticker}))
+                done.append(ticker)
+            if frames:
+                store(pd.concat(frames, ignore_index=True), config, done)
+            summary["done"] += len(done)
+    finally:
+        await eodhd.destroy()
+    return summary
+
+
+def store(frame: pd.DataFrame, config: dict, tickers: List[str]):
+    """Write partition atomically with its tickers list, partition replace commits tickers as completed.
+
+    Partition name is derived from its tickers, so batch repeated after crash replaces
+    partition written before instead of duplicating its rows.
+
+    :param frame: partition data.
+    :param config: job configuration.
+    :param tickers: partition tickers.
+    """
+    name = hashlib.sha1("\n".join(tickers).encode()).hexdigest()
+    path = os.path.join(config["state"], f"part-{name}{config['extension']}")
+    with open(f"{path}.tmp", "w", encoding="utf-8") as handle:
+        handle.writelines(f"{ticker}\n" for ticker in tickers)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(f"{path}.tmp", os.path.join(config["state"], f"part-{name}.txt"))
+    options = {"index": False} if config["extension"] == ".csv" else {}
+    getattr(frame, f"to_{EXTENSIONS[config['extension']]}")(f"{path}.tmp", **options)
+    os.replace(f"{path}.tmp", path)
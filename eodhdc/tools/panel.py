@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+from typing import Mapping, Sequence, List, Union, Coroutine, Any
+import numpy as np
+import pandas as pd
+from eodhdc.registry import REGISTRY
+from eodhdc.tools.batch import fetch, then
+
+FIELDS = [name for name in REGISTRY["market.historical"].schema if name != "Date"]
+
+
+class Panel:
+    """Aligned historical prices of many tickers, dates x tickers x fields array."""
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, dates: pd.DatetimeIndex, tickers: List[str], fields: List[str], values: np.ndarray,
+                 errors: dict = None):
+        """
+        :param dates: shared trading calendar.
+        :param tickers: tickers.
+        :param fields: price fields.
+        :param values: values array of dates x tickers x fields shape, missing values are NaN.
+        :param errors: ticker to fetching error mapping.
+        """
+        self.dates = dates
+        self.tickers = tickers
+        self.fields = fields
+        self.values = values
+        self.errors = errors or {}
+
+    def __repr__(self):
+        return f"Panel({len(self.dates)} dates x {len(self.tickers)} tickers x {len(self.fields)} fields)"
+
+    def field(self, name: str) -> pd.DataFrame:
+        """Get single field matrix, like close prices.
+
+        :param name: field name.
+        :return: frame indexed by date with tickers columns.
+        """
+        return pd.DataFrame(
+            self.values[:, :, self.fields.index(name)], index=self.dates, columns=pd.Index(self.tickers, dtype=object)
+        )
+
+    def frame(self) -> pd.DataFrame:
+        """Get panel as frame with field, ticker columns MultiIndex.
+
+        :return: frame indexed by date.
+        """
+        values = self.values.transpose(0, 2, 1).reshape(len(self.dates), -1)
+        columns = pd.MultiIndex.from_product([self.fields, self.tickers], names=["Field", "Ticker"])
+        return pd.DataFrame(values, index=self.dates, columns=columns)
+
+
+def calendar(frames: Mapping[str, pd.DataFrame], column: str = "Date") -> pd.DatetimeIndex:
+    """Build shared calendar as sorted union of all frames dates.
+
+    :param frames: ticker to historical prices frame mapping.
+    :param column: date column name, index is used if frame doesn't have it.
+    :return: dates index.
+    """
+    indexes = [timeline(frame, column) for frame in frames.values() if frame is not None and not frame.empty]
+    return union(indexes, column)
+
+
+def union(indexes: List[pd.DatetimeIndex], name: str = "Date") -> pd.DatetimeIndex:
+    """Get sorted union of dates indexes with single hashing pass, only unique dates are sorted.
+
+    :param indexes: dates indexes.
+    :param name: result index name.
+    :return: dates index.
+    """
+    if not indexes:
+        return pd.DatetimeIndex([], name=name)
+    return pd.DatetimeIndex(np.sort(pd.unique(np.concatenate([index.values for index in indexes]))), name=name)
+
+
+def timeline(frame: pd.DataFrame, column: str = "Date") -> pd.DatetimeIndex:
+    """Get frame dates.
+
+    :param frame: historical prices frame.
+    :param column: date column name, index is used if frame doesn't have it.
+    :return: dates index.
+    """
+    values = frame[column] if column in frame.columns else frame.index
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        values = pd.to_datetime(values, cache=False)
+    return pd.DatetimeIndex(values)
+
+
+def assemble(
+    frames: Mapping[str, pd.DataFrame], fields: Sequence[str] = None, shared: pd.DatetimeIndex = None,
+    column: str = "Date", errors: dict = None
+) -> Panel:
+    """Assemble panel from historical prices frames.
+
+    Values are written into single preallocated array, rows are aligned to shared calendar
+    by dates positions lookup, dates outside of calendar are dropped.
+
+    :param frames: ticker to historical prices frame mapping.
+    :param fields: price fields, default - all historical prices fields.
+    :param shared: shared trading calendar, default - union of all frames dates.
+    :param column: date column name, index is used if frame doesn't have it.
+    :param errors: ticker to fetching error mapping, kept in panel.
+    :return: panel.
+    """
+    fields = list(fields or FIELDS)
+    tickers = list(frames.keys())
+    indexes = {
+        position: timeline(frame, column) for position, frame in enumerate(frames.values())
+        if frame is not None and not frame.empty
+    }
+    shared = union(list(indexes.values()), column) if shared is None else pd.DatetimeIndex(shared)
+    values = np.full((len(shared), len(tickers), len(fields)), np.nan)
+    for position, frame in enumerate(frames.values()):
+        if position not in indexes:
+            continue
+        rows = shared.get_indexer(indexes[position])
+        mask = rows >= 0
+        data = frame.reindex(columns=fields).to_numpy(dtype=float, na_value=np.nan)
+        values[rows[mask], position, :] = data[mask]
+    return Panel(shared, tickers, fields, values, errors)
+
+
+def historical(
+    eodhd: Any, tickers: Sequence[str], fields: Sequence[str] = None, shared: pd.DatetimeIndex = None,
+    concurrency: int = 8, **params: Any
+) -> Union[Panel, Coroutine[Any, Any, Panel]]:
+    """Fetch historical prices of tickers and assemble panel.
+
+    :param eodhd: EODHDClient instance, coroutine is returned for asynchronous clients.
+    :param tickers: tickers.
+    :param fields: price fields, default - all historical prices fields.
+    :param shared: shared trading calendar, default - union of all fetched dates.
+    :param concurrency: maximum concurrent requests.
+    :param params: additional <market.historical> parameters, like start and finish.
+    :return: panel, tickers failed to fetch are kept with NaN values and their errors in panel <errors>.
+    """
+    tickers = list(dict.fromkeys(tickers))
+
+    def build(fetched):
+        results, errors = fetched
+        frames = {ticker: results.get(ticker) for ticker in tickers}
+        return assemble(frames, fields, shared, errors=errors)
+
+    return then(fetch(eodhd.market.historical, tickers, concurrency, output="pandas", **params), build)
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+from typing import Mapping, Sequence, Dict, Union, Coroutine, Any
+import pathlib
+from collections import defaultdict
+import pandas as pd
+from eodhdc.storage import atomic
+from eodhdc.tools.batch import fetch, then
+from eodhdc.tools.calendar import Calendar
+
+KINDS = {"eod": "Date", "splits": "date", "dividends": "date"}
+RENAMES = {
+    "date": "Date", "open": "Open", "high": "High", "low": "Low", "close": "Close",
+    "adjusted_close": "Adjusted_close", "volume": "Volume"
+}
+ACTIONS = {"value": "dividend"}
+
+
+class Store:
+    """Local per-ticker history store, one pickle file per ticker and data kind."""
+
+    def __init__(self, path: str):
+        """
+        :param path: store directory, created on first write.
+        """
+        self.path = pathlib.Path(path)
+
+    def file(self, ticker: str, kind: str = "eod") -> pathlib.Path:
+        """Get ticker history file path.
+
+        :param ticker: ticker in form {symbol-name}.{exchange-id}.
+        :param kind: data kind, "eod", "splits" or "dividends".
+        :return: file path.
+        """
+        return self.path / kind / f"{ticker.upper()}.pickle"
+
+    def load(self, ticker: str, kind: str = "eod") -> Union[pd.DataFrame, None]:
+        """Load ticker history.
+
+        :param ticker: ticker in form {symbol-name}.{exchange-id}.
+        :param kind: data kind, "eod", "splits" or "dividends".
+        :return: history frame or None if not stored.
+        """
+        path = self.file(ticker, kind)
+        return pd.read_pickle(path) if path.exists() else None
+
+    def save(self, ticker: str, frame: pd.DataFrame, kind: str = "eod"):
+        """Save ticker history, file is replaced atomically.
+
+        :param ticker: ticker in form {symbol-name}.{exchange-id}.
+        :param frame: history frame.
+        :param kind: data kind, "eod", "splits" or "dividends".
+        """
+        path = self.file(ticker, kind)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic(str(path)) as handle:
+            frame.to_pickle(handle)
+
+    def append(
+        self, ticker: str, frame: pd.DataFrame, kind: str = "eod", history: pd.DataFrame = None
+    ) -> pd.DataFrame:
+        """Append rows to ticker history, rows with stored dates replace old ones.
+
+        :param ticker: ticker in form {symbol-name}.{exchange-id}.
+        :param frame: new rows frame.
+        :param kind: data kind, "eod", "splits" or "dividends".
+        :param history: already loaded history, default - loaded from store.
+        :return: updated history.
+        """
+        column = KINDS[kind]
+        history = self.load(ticker, kind) if history is None else history
+        frame = frame.assign(**{column: pd.to_datetime(frame[column])})
+        if history is not None and not history.empty:
+            frame = pd.concat([history, frame], ignore_index=True)
+        frame = frame.drop_duplicates(column, keep="last").sort_values(column, kind="mergesort")
+        frame = frame.reset_index(drop=True)
+        self.save(ticker, frame, kind)
+        return frame
+
+
+class Refresher:
+    """Daily exchange refresher, appends bulk last day data to stored tickers histories.
+
+    Every exchange is requested once per data kind with bulk API, tickers with missing sessions
+    since last stored date are filled with per-ticker historical prices, splits and dividends requests.
+    """
+
+    def __init__(
+        self, eodhd: Any, store: Store, calendars: Mapping[str, Calendar] = None, concurrency: int = 8
+    ):
+        """
+        :param eodhd: EODHDClient instance, refresh returns coroutine for asynchronous clients.
+        :param store: tickers history store.
+        :param calendars: exchange to calendar mapping used to detect missing sessions, like <Calendars> items,
+          default - working days calendar without holidays, holidays cause historical requests without new data.
+        :param concurrency: maximum concurrent requests.
+        """
+        self.eodhd = eodhd
+        self.store = store
+        self.calendars = calendars or {}
+        self.concurrency = concurrency
+        self.weekdays = Calendar({})
+
+    def refresh(
+        self, tickers: Sequence[str], date: str = None, actions: bool = True
+    ) -> Union[Dict[str, Any], Coroutine[Any, Any, Dict[str, Any]]]:
+        """Refresh tickers histories with exchanges bulk data.
+
+        :param tickers: tickers in form {symbol-name}.{exchange-id} or <Universe>, active symbols are used.
+        :param date: bulk data date, "YYYY-MM-DD", default - last trading day.
+        :param actions: refresh splits and dividends too.
+        :return: report with "appended", "filled", "current" and "missing" tickers lists
+          and "errors" mapping of (exchange or ticker, kind) to fetching error,
+          tickers without exchange suffix are reported as missing.
+        """
+        if hasattr(tickers, "frame"):
+            tickers = tickers.frame.loc[~tickers.frame["Delisted"].astype(bool), "Symbol"]
+        exchanges, invalid = defaultdict(list), []
+        for ticker in dict.fromkeys(tickers):
+            symbol, _, exchange = ticker.rpartition(".")
+            if symbol and exchange:
+                exchanges[exchange.upper()].append(ticker)
+            else:
+                invalid.append(ticker)
+        kinds = list(KINDS) if actions else ["eod"]
+        keys = [(exchange, kind) for exchange in exchanges for kind in kinds]
+        return then(
+            fetch(self.bulk(date), keys, self.concurrency),
+            lambda fetched: self.apply(exchanges, date, *fetched, kinds=kinds, invalid=invalid)
+        )
+
+    def bulk(self, date: str = None):
+        """Create bulk data fetching function for (exchange, kind) keys.
+
+        :param date: bulk data date, "YYYY-MM-DD", default - last trading day.
+        :return: function or coroutine function.
+        """
+        def kind(key):
+            return None if key[1] == "eod" else key[1]
+
+        if self.eodhd.mode == "coro":
+            async def bulk(key):
+                return await self.eodhd.exchange.bulk(key[0], kind(key), date, fmt="json")
+            return bulk
+        return lambda key: self.eodhd.exchange.bulk(key[0], kind(key), date, fmt="json")
+
+    # pylint: disable=too-many-arguments
+    def apply(
+        self, exchanges: Mapping[str, Sequence[str]], date: str, results: dict, errors: dict,
+        kinds: Sequence[str] = ("eod",), invalid: Sequence[str] = ()
+    ) -> Union[Dict[str, Any], Coroutine[Any, Any, Dict[str, Any]]]:
+        """Append bulk data to stored histories and fill gaps with historical data.
+
+        :param exchanges: exchange to tickers mapping.
+        :param date: bulk data date, "YYYY-MM-DD", used for gaps of exchanges with failed bulk request.
+        :param results: (exchange, kind) to bulk data mapping.
+        :param errors: (exchange, kind) to fetching error mapping.
+        :param kinds: refreshed data kinds, gaps are filled for every kind.
+        :param invalid: tickers without exchange suffix.
+        :return: refresh report.
+        """
+        report = {"appended": [], "filled": [], "current": [], "missing": list(invalid), "errors": dict(errors)}
+        gaps = {}
+        for exchange, tickers in exchanges.items():
+            for kind in KINDS:
+                if kind != "eod" and results.get((exchange, kind)):
+                    self.actions(tickers, results[(exchange, kind)], kind)
+            if (exchange, "eod") in errors:
+                for ticker in tickers:
+                    history = self.store.load(ticker)
+                    gaps[ticker] = (self.following(history), date)
+                continue
+            calendar = self.calendars.get(exchange) or self.weekdays
+            self.update(tickers, results.get((exchange, "eod")), calendar, report, gaps)
+        if not gaps:
+            return report
+        keys = [(ticker, kind) for ticker in gaps for kind in kinds]
+        pending = fetch(self.historical(gaps), keys, self.concurrency)
+        return then(pending, lambda fetched: self.fill(report, *fetched))
+
+    # pylint: disable=too-many-arguments
+    def update(
+        self, tickers: Sequence[str], items: Sequence[dict], calendar: Calendar, report: Dict[str, Any],
+        gaps: Dict[str, tuple]
+    ):
+        """Append bulk end of day data to stored histories, collect tickers with missing sessions.
+
+        :param tickers: exchange tickers.
+        :param items: bulk data items.
+        :param calendar: exchange calendar.
+        :param report: refresh report.
+        :param gaps: ticker to historical prices (start, finish) period mapping, updated in place.
+        """
+        rows = self.bars(items)
+        for ticker in tickers:
+            row = rows.get(ticker.rsplit(".", 1)[0].upper())
+            if row is None:
+                report["missing"].append(ticker)
+                continue
+            history = self.store.load(ticker)
+            last = history["Date"].max() if history is not None and not history.empty else None
+            if last is not None and last >= row["Date"]:
+                report["current"].append(ticker)
+            elif last is not None and calendar.previous_session(row["Date"]) <= last:
+                self.store.append(ticker, pd.DataFrame([row]), history=history)
+                report["appended"].append(ticker)
+            else:
+                gaps[ticker] = (self.following(history), row["Date"].date().isoformat())
+
+    @staticmethod
+    def bars(items: Sequence[dict]) -> Dict[str, dict]:
+        """Convert bulk end of day data to historical prices rows.
+
+        :param items: bulk data items.
+        :return: uppercase symbol code to row mapping.
+        """
+        if not items or not isinstance(items, list):
+            return {}
+        frame = pd.DataFrame(items)
+        codes = frame["code"].astype(str).str.upper()
+        frame = frame.rename(columns=RENAMES).reindex(columns=list(RENAMES.values()))
+        frame["Date"] = pd.to_datetime(frame["Date"])
+        return dict(zip(codes, frame.to_dict("records")))
+
+    def actions(self, tickers: Sequence[str], items: Sequence[dict], kind: str):
+        """Append bulk splits or dividends to stored histories.
+
+        :param tickers: exchange tickers.
+        :param items: bulk data items.
+        :param kind: data kind, "splits" or "dividends".
+        """
+        if not isinstance(items, list):
+            return
+        frame = pd.DataFrame(items)
+        codes = frame.pop("code").astype(str).str.upper()
+        frame = frame.drop(columns=["exchange", "exchange_short_name"], errors="ignore")
+        symbols = {ticker.rsplit(".", 1)[0].upper(): ticker for ticker in tickers}
+        for code, rows in frame.groupby(codes.values, sort=False):
+            if code in symbols:
+                self.store.append(symbols[code], rows, kind)
+
+    @staticmethod
+    def following(history: pd.DataFrame) -> Union[str, None]:
+        """Get day after last stored date.
+
+        :param history: history frame.
+        :return: date, "YYYY-MM-DD", None if history is empty.
+        """
+        if history is None or history.empty:
+            return None
+        return (history["Date"].max() + pd.Timedelta(days=1)).date().isoformat()
+
+    def historical(self, gaps: Mapping[str, tuple]):
+        """Create historical data fetching function for (ticker, kind) keys of gap tickers.
+
+        :param gaps: ticker to (start, finish) mapping.
+        :return: function or coroutine function.
+        """
+        def request(key):
+            start, finish = gaps[key[0]]
+            if key[1] == "eod":
+                return self.eodhd.market.historical(key[0], start=start, finish=finish, output="pandas")
+            return getattr(self.eodhd.market, key[1])(key[0], start=start, finish=finish, fmt="json")
+
+        if self.eodhd.mode == "coro":
+            async def historical(key):
+                return await request(key)
+            return historical
+        return request
+
+    def fill(self, report: Dict[str, Any], results: dict, errors: dict) -> Dict[str, Any]:
+        """Append fetched historical data to stored histories.
+
+        :param report: refresh report.
+        :param results: (ticker, kind) to historical data mapping.
+        :param errors: (ticker, kind) to fetching error mapping.
+        :return: refresh report.
+        """
+        for (ticker, kind), frame in results.items():
+            if kind != "eod":
+                if isinstance(frame, list) and frame:
+                    self.store.append(ticker, pd.DataFrame(frame).rename(columns=ACTIONS), kind)
+            elif isinstance(frame, pd.DataFrame) and "Date" in frame.columns and not frame.empty:
+                self.store.append(ticker, frame)
+                report["filled"].append(ticker)
+            else:
+                report["missing"].append(ticker)
+        report["errors"].update(errors)
+        return report
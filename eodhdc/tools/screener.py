@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+from typing import MutableMapping, Sequence, List, Tuple, Union, Coroutine, Any
+import json
+import time
+import pandas as pd
+from eodhdc.registry import REGISTRY
+from eodhdc.tools.batch import fetch, then
+
+KEY = ["code", "exchange"]
+
+
+class Query:
+    """Screener query builder, every method returns new query.
+
+    Filters and signals are kept normalized, so equal queries built in different order
+    have the same <key> and share cached results.
+    """
+
+    def __init__(self, filters: Sequence[Sequence] = (), signals: Sequence[str] = (), sort: str = None):
+        """
+        :param filters: filters like [["market_capitalization", ">", 1000], ["exchange", "=", "us"]].
+        :param signals: signals like ["50d_new_hi", "bookvalue_pos"].
+        :param sort: sort field and order, "field_name.(asc|desc)".
+        """
+        filters = {json.dumps(list(item)): list(item) for item in filters}
+        self.filters = [filters[item] for item in sorted(filters)]
+        self.signals = sorted(set(signals))
+        self.sort = sort
+
+    def __repr__(self):
+        return f"Query({self.key()})"
+
+    def __eq__(self, other):
+        return isinstance(other, Query) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def where(self, field: str, operation: str, value: Any) -> "Query":
+        """Add filter.
+
+        :param field: field name, like "market_capitalization".
+        :param operation: "=", "!=", ">", "<", ">=", "<=" or "match".
+        :param value: value to compare with.
+        :return: new query.
+        """
+        return Query(self.filters + [[field, operation, value]], self.signals, self.sort)
+
+    def signal(self, *signals: str) -> "Query":
+        """Add signals.
+
+        :param signals: signals names.
+        :return: new query.
+        """
+        return Query(self.filters, self.signals + list(signals), self.sort)
+
+    def order(self, field: str, descending: bool = True) -> "Query":
+        """Set sort.
+
+        :param field: numeric field name.
+        :param descending: descending order.
+        :return: new query.
+        """
+        return Query(self.filters, self.signals, f"{field}.{'desc' if descending else 'asc'}")
+
+    def key(self) -> str:
+        """Get normalized query key.
+
+        :return: key string.
+        """
+        return json.dumps([self.filters, self.signals, self.sort])
+
+    def params(self) -> dict:
+        """Get <exchange.screener> method parameters.
+
+        :return: filters, signals and sort parameters.
+        """
+        return {
+            "filters": json.dumps(self.filters) if self.filters else None,
+            "signals": ",".join(self.signals) if self.signals else None,
+            "sort": self.sort
+        }
+
+    def split(self, field: str, bounds: Sequence[float]) -> List["Query"]:
+        """Split query into field ranges, rows without field value are not covered.
+
+        :param field: numeric field name.
+        :param bounds: ascending ranges bounds.
+        :return: queries sorted by field in descending order, one per range.
+        """
+        bounds = sorted(bounds)
+        query = self.order(field)
+        if not bounds:
+            return [query]
+        parts = [query.where(field, "<", bounds[0])]
+        parts += [query.where(field, ">=", low).where(field, "<", high) for low, high in zip(bounds, bounds[1:])]
+        return parts + [query.where(field, ">=", bounds[-1])]
+
+
+class Screener:
+    """Screener planner, fetches all rows of query beyond offset cap with cached results.
+
+    Query is requested in waves: first pages of all field ranges, then growing batches of next pages
+    of full ranges up to offset cap, then ranges continuing after last row of capped ones.
+    Requests of every wave are made concurrently, results are cached per normalized query.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, eodhd: Any, cache: MutableMapping = None, ttl: float = 3600.0, concurrency: int = 8,
+        field: str = "market_capitalization"
+    ):
+        """
+        :param eodhd: EODHDClient instance.
+        :param cache: results store, any mapping like dict, shelve or disk cache, default - in-memory dict.
+        :param ttl: cached results freshness in seconds.
+        :param concurrency: maximum concurrent requests.
+        :param field: numeric field used to split queries beyond offset cap.
+        """
+        self.eodhd = eodhd
+        self.cache = cache if cache is not None else {}
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.field = field
+        self.paging = REGISTRY["exchange.screener"].paging
+        self.errors = {}
+        self.truncated = []
+
+    def request(self, part: Query, offset: int) -> Union[list, Coroutine[Any, Any, list]]:
+        """Request page of query.
+
+        :param part: query.
+        :param offset: rows offset.
+        :return: page rows.
+        """
+        paging = {self.paging["limit"]: self.paging["size"], self.paging["offset"]: offset}
+        page = self.eodhd.exchange.screener(**part.params(), **paging, fmt="json")
+        return then(page, lambda value: value.get("data") or [] if isinstance(value, dict) else [])
+
+    def run(
+        self, query: Query, bounds: Sequence[float] = (), force: bool = False
+    ) -> Union[pd.DataFrame, Coroutine[Any, Any, pd.DataFrame]]:
+        """Fetch all rows of query.
+
+        :param query: screener query.
+        :param bounds: <field> ranges bounds to request concurrently from the start, like [1e8, 1e9, 1e10].
+        :param force: ignore cached results.
+        :return: rows frame, failed requests are available in <errors> and
+            ranges which can't be split further in <truncated>, coroutine is returned for asynchronous clients.
+        """
+        key = json.dumps([query.key(), self.field, sorted(bounds)])
+        cached = self.cache.get(key)
+        if not force and cached is not None and cached[0] >= time.time() - self.ttl:
+            frame = pd.DataFrame(cached[1])
+            if self.eodhd.mode == "coro":
+                async def result():
+                    return frame
+                return result()
+            return frame
+        self.errors, self.truncated = {}, []
+        parts = query.split(self.field, bounds) if bounds or not query.sort else [query]
+        frontier = {index: 0 for index in range(len(parts))}
+        pages = {}
+
+        def wave(tasks):
+            if self.eodhd.mode == "coro":
+                async def call(task):
+                    return await self.request(parts[task[0]], task[1])
+            else:
+                def call(task):
+                    return self.request(parts[task[0]], task[1])
+            return then(fetch(call, tasks, self.concurrency), step)
+
+        def step(fetched):
+            results, errors = fetched
+            self.errors.update({(parts[task[0]], task[1]): error for task, error in errors.items()})
+            pages.update(results)
+            tasks = []
+            for (index, offset), rows in results.items():
+                if len(rows) == self.paging["size"]:
+                    tasks += self.plan(parts, frontier, index, offset, rows)
+            return wave(tasks) if tasks else self.collect(query, key, pages)
+
+        return wave([(index, 0) for index in range(len(parts))])
+
+    # pylint: disable=too-many-arguments
+    def plan(
+        self, parts: List[Query], frontier: dict, index: int, offset: int, rows: list
+    ) -> List[Tuple[int, int]]:
+        """Plan requests following full page.
+
+        Only full last requested page of query is followed, next pages are requested in batches
+        doubling with every wave, so small result sets don't pay for pages up to offset cap.
+
+        :param parts: queries, continuation queries are added to them.
+        :param frontier: query index to last requested offset mapping, updated with planned requests.
+        :param index: full page query index.
+        :param offset: full page offset.
+        :param rows: full page rows.
+        :return: query index and offset pairs.
+        """
+        size, cap = self.paging["size"], self.paging["cap"]
+        if offset < frontier[index]:
+            return []
+        if offset + size <= cap:
+            offsets = range(offset + size, min(offset * 2 + size, cap) + 1, size)
+            frontier[index] = offsets[-1]
+            return [(index, number) for number in offsets]
+        field, order = (parts[index].sort or f"{self.field}.desc").rsplit(".", 1)
+        value = rows[-1].get(field)
+        bound = [field, "<=" if order == "desc" else ">=", value]
+        if value is None or bound in parts[index].filters:
+            self.truncated.append(parts[index])
+            return []
+        parts.append(Query(
+            [item for item in parts[index].filters if item[:2] != bound[:2]] + [bound],
+            parts[index].signals, parts[index].sort
+        ))
+        frontier[len(parts) - 1] = 0
+        return [(len(parts) - 1, 0)]
+
+    def collect(self, query: Query, key: str, pages: dict) -> pd.DataFrame:
+        """Combine pages into rows frame and cache it.
+
+        :param query: screener query.
+        :param key: cache key.
+        :param pages: query index and offset to rows mapping.
+        :return: rows frame.
+        """
+        rows = [row for task in sorted(pages) for row in pages[task]]
+        frame = pd.DataFrame(rows)
+        if not frame.empty:
+            frame = frame.drop_duplicates([column for column in KEY if column in frame.columns], keep="first")
+            if query.sort:
+                field, order = query.sort.rsplit(".", 1)
+                frame = frame.sort_values(field, ascending=order == "asc", kind="mergesort", na_position="last")
+            frame = frame.reset_index(drop=True)
+        if not self.errors:
+            self.cache[key] = (time.time(), frame.to_dict("records"))
+        return frame
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+from typing import List, Sequence, Tuple, Iterator, AsyncIterator, Union, Coroutine, Any
+import time
+import asyncio
+import pandas as pd
+from eodhdc.tools.batch import fetch, then
+
+COLUMNS = [
+    "code", "timestamp", "gmtoffset", "open", "high", "low", "close", "volume", "previousClose", "change", "change_p"
+]
+
+
+def chunks(tickers: Sequence[str], size: int = 20, length: int = 2000) -> List[Tuple[str, ...]]:
+    """Split tickers into request chunks limited by tickers count and query length.
+
+    :param tickers: tickers in form {symbol-name}.{exchange-id}.
+    :param size: maximum tickers per request.
+    :param length: maximum tickers query length, every ticker takes its length and separator.
+    :return: tickers chunks.
+    """
+    result, chunk, used = [], [], 0
+    for ticker in dict.fromkeys(tickers):
+        if chunk and (len(chunk) >= size or used + len(ticker) + 3 > length):
+            result.append(tuple(chunk))
+            chunk, used = [], 0
+        chunk.append(ticker)
+        used += len(ticker) + 3
+    if chunk:
+        result.append(tuple(chunk))
+    return result
+
+
+def quotes(items: Union[dict, List[dict]]) -> pd.DataFrame:
+    """Convert real-time API response to quotes frame.
+
+    :param items: single quote or quotes list.
+    :return: frame indexed by ticker code with numeric quote columns.
+    """
+    items = [items] if isinstance(items, dict) else list(items or [])
+    frame = pd.DataFrame(items).reindex(columns=COLUMNS)
+    numeric = {column: pd.to_numeric(frame[column], errors="coerce") for column in COLUMNS[1:]}
+    return frame.assign(**numeric).set_index("code")
+
+
+class Snapshot:
+    """Real-time quotes snapshot of many tickers with delayed prices API.
+
+    Tickers are split into request chunks fetched concurrently, responses are merged
+    into single frame indexed by ticker, every refresh reports only changed quotes.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, eodhd: Any, tickers: Sequence[str], size: int = 20, length: int = 2000, concurrency: int = 8
+    ):
+        """
+        :param eodhd: EODHDClient instance, coroutines are returned for asynchronous clients.
+        :param tickers: tickers in form {symbol-name}.{exchange-id}.
+        :param size: maximum tickers per request.
+        :param length: maximum tickers query length per request.
+        :param concurrency: maximum concurrent requests.
+        """
+        self.eodhd = eodhd
+        self.tickers = list(dict.fromkeys(tickers))
+        self.chunks = chunks(self.tickers, size, length)
+        self.concurrency = concurrency
+        self.frame = quotes([]).reindex(self.tickers)
+        self.errors = {}
+        self.updated = None
+
+    def __repr__(self):
+        return f"Snapshot({len(self.tickers)} tickers, {len(self.chunks)} chunks)"
+
+    def refresh(self) -> Union[pd.DataFrame, Coroutine[Any, Any, pd.DataFrame]]:
+        """Fetch all tickers quotes and update snapshot.
+
+        :return: changed quotes frame, chunks failed to fetch are available in <errors>.
+        """
+        if self.eodhd.mode == "coro":
+            async def method(chunk):
+                return await self.eodhd.market.delayed(list(chunk), fmt="json")
+        else:
+            def method(chunk):
+                return self.eodhd.market.delayed(list(chunk), fmt="json")
+        return then(fetch(method, self.chunks, self.concurrency), lambda fetched: self.merge(*fetched))
+
+    def merge(self, results: dict, errors: dict) -> pd.DataFrame:
+        """Merge fetched quotes into snapshot, quotes of failed chunks are kept as is.
+
+        :param results: chunk to response mapping.
+        :param errors: chunk to fetching error mapping.
+        :return: changed quotes frame.
+        """
+        frames = [quotes(items) for items in results.values()]
+        fetched = pd.concat(frames) if frames else quotes([])
+        fetched = fetched[~fetched.index.duplicated(keep="last") & fetched.index.isin(self.tickers)]
+        previous = self.frame.reindex(fetched.index)
+        changed = ((fetched != previous) & ~(fetched.isna() & previous.isna())).any(axis=1)
+        self.frame = pd.concat([self.frame[~self.frame.index.isin(fetched.index)], fetched]).reindex(self.tickers)
+        self.errors = errors
+        self.updated = time.time()
+        return fetched[changed]
+
+    def poll(
+        self, interval: float = 15.0, count: int = None
+    ) -> Union[Iterator[pd.DataFrame], AsyncIterator[pd.DataFrame]]:
+        """Refresh snapshot on interval, refresh time is included in interval.
+
+        :param interval: interval in seconds.
+        :param count: refreshes count, default - infinite.
+        :return: changed quotes frames iterator, asynchronous one for asynchronous clients.
+        """
+        if self.eodhd.mode == "coro":
+            return self.apoll(interval, count)
+        return self.spoll(interval, count)
+
+    def spoll(self, interval: float = 15.0, count: int = None) -> Iterator[pd.DataFrame]:
+        """Refresh snapshot on interval with synchronous client, see <poll> method.
+
+        :param interval: interval in seconds.
+        :param count: refreshes count, default - infinite.
+        :return: changed quotes frames iterator.
+        """
+        number = 0
+        while count is None or number < count:
+            started = time.monotonic()
+            yield self.refresh()
+            number += 1
+            if count is None or number < count:
+                time.sleep(max(interval - (time.monotonic() - started), 0))
+
+    async def apoll(self, interval: float = 15.0, count: int = None) -> AsyncIterator[pd.DataFrame]:
+        """Refresh snapshot on interval with asynchronous client, see <poll> method.
+
+        :param interval: interval in seconds.
+        :param count: refreshes count, default - infinite.
+        :return: changed quotes frames asynchronous iterator.
+        """
+        number = 0
+        while count is None or number < count:
+            started = time.monotonic()
+            yield await self.refresh()
+            number += 1
+            if count is None or number < count:
+                await asyncio.sleep(max(interval - (time.monotonic() - started), 0))
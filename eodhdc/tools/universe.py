@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+from typing import List, Dict, Sequence, Union, Coroutine, Any
+import re
+import bisect
+import datetime
+from collections import defaultdict, Counter
+import pandas as pd
+from eodhdc.tools.batch import fetch, then
+
+COLUMNS = ["Symbol", "Code", "Market", "Name", "Country", "Exchange", "Currency", "Type", "Isin", "Delisted"]
+WORDS = re.compile(r"[A-Z0-9]+")
+
+
+def trigrams(word: str) -> set:
+    """Get word trigrams, padded to match short words and word starts.
+
+    :param word: uppercase word.
+    :return: trigrams set.
+    """
+    padded = f"  {word} "
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+class Universe:
+    """Ticker universe index built from exchanges symbol lists.
+
+    Symbols are stored in frame and indexed in memory for constant time symbol lookups,
+    ISIN mapping, prefix search by code or name and fuzzy search by name words trigrams.
+    Symbol changes history is applied incrementally, old symbols are kept as aliases.
+    """
+
+    def __init__(self, frame: pd.DataFrame = None, aliases: Dict[str, str] = None, updated: str = None):
+        """
+        :param frame: symbols frame with <COLUMNS> columns, default - empty.
+        :param aliases: old symbol to new symbol mapping.
+        :param updated: symbol changes are applied up to this date, "YYYY-MM-DD".
+        """
+        self.frame = frame if frame is not None else pd.DataFrame(columns=COLUMNS)
+        self.aliases = dict(aliases or {})
+        self.updated = updated
+        self.errors = {}
+        self.records = []
+        self.symbols = {}
+        self.isins = defaultdict(list)
+        self.codes = []
+        self.names = []
+        self.words = defaultdict(set)
+        self.grams = defaultdict(set)
+        self.sizes = {}
+        self.index()
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, symbol: str):
+        return self.lookup(symbol) is not None
+
+    def index(self):
+        """Rebuild in-memory indexes from frame."""
+        self.frame = self.frame.reindex(columns=COLUMNS).reset_index(drop=True)
+        self.records = self.frame.where(self.frame.notna(), None).to_dict("records")
+        self.symbols = {record["Symbol"].upper(): position for position, record in enumerate(self.records)}
+        self.isins = defaultdict(list)
+        self.words = defaultdict(set)
+        self.grams = defaultdict(set)
+        codes, names = [], []
+        for position, record in enumerate(self.records):
+            if record["Isin"]:
+                self.isins[record["Isin"].upper()].append(position)
+            codes.append((str(record["Code"]).upper(), position))
+            name = str(record["Name"] or "").upper()
+            names.append((name, position))
+            for word in set(WORDS.findall(name)) | {str(record["Code"]).upper()}:
+                self.words[word].add(position)
+        self.sizes = {}
+        for word in self.words:
+            grams = trigrams(word)
+            self.sizes[word] = len(grams)
+            for gram in grams:
+                self.grams[gram].add(word)
+        self.codes = sorted(codes)
+        self.names = sorted(names)
+
+    def lookup(self, symbol: str) -> Union[dict, None]:
+        """Get symbol metadata, old symbols are resolved with aliases.
+
+        :param symbol: symbol in form {code}.{exchange}, case-insensitive.
+        :return: metadata or None if not found.
+        """
+        symbol = symbol.upper()
+        position = self.symbols.get(symbol)
+        if position is None and symbol in self.aliases:
+            position = self.symbols.get(self.aliases[symbol])
+        return self.records[position] if position is not None else None
+
+    def isin(self, isin: str, delisted: bool = False) -> List[dict]:
+        """Get symbols by ISIN.
+
+        :param isin: ISIN code.
+        :param delisted: include delisted symbols.
+        :return: metadata list.
+        """
+        return self.select(self.isins.get(isin.upper(), []), delisted)
+
+    def prefix(self, text: str, limit: int = 20, delisted: bool = False) -> List[dict]:
+        """Search symbols with code or name starting with text, code matches first.
+
+        :param text: search text, case-insensitive.
+        :param limit: maximum results count.
+        :param delisted: include delisted symbols.
+        :return: metadata list.
+        """
+        text = text.upper()
+        positions = []
+        for keys in [self.codes, self.names]:
+            start = bisect.bisect_left(keys, (text, -1))
+            for key, position in keys[start:]:
+                if not key.startswith(text) or len(positions) >= limit * 4:
+                    break
+                positions.append(position)
+        return self.select(list(dict.fromkeys(positions)), delisted)[:limit]
+
+    def search(self, text: str, limit: int = 20, delisted: bool = False, cutoff: float = 0.3) -> List[dict]:
+        """Search symbols by exact symbol, code or name prefix and fuzzy name words match.
+
+        :param text: search text, case-insensitive.
+        :param limit: maximum results count.
+        :param delisted: include delisted symbols.
+        :param cutoff: minimal words trigrams similarity for fuzzy match, 0 - 1.
+        :return: metadata list ordered by match quality.
+        """
+        found = self.lookup(text) if "." in text else None
+        result = [found] if found and (delisted or not found["Delisted"]) else []
+        result.extend(self.prefix(text, limit, delisted))
+        if len(result) < limit:
+            result.extend(self.fuzzy(text, limit, delisted, cutoff))
+        unique = {id(record): record for record in result}
+        return list(unique.values())[:limit]
+
+    def fuzzy(self, text: str, limit: int = 20, delisted: bool = False, cutoff: float = 0.3) -> List[dict]:
+        """Search symbols by code and name words trigrams similarity.
+
+        :param text: search text, case-insensitive.
+        :param limit: maximum results count.
+        :param delisted: include delisted symbols.
+        :param cutoff: minimal words trigrams similarity, 0 - 1.
+        :return: metadata list ordered by similarity.
+        """
+        scores = Counter()
+        for word in WORDS.findall(text.upper()):
+            grams = trigrams(word)
+            candidates = Counter(match for gram in grams for match in self.grams.get(gram, ()))
+            for match, shared in candidates.items():
+                similarity = shared / (len(grams) + self.sizes[match] - shared)
+                if similarity >= cutoff:
+                    for position in self.words[match]:
+                        scores[position] += similarity
+        return self.select([position for position, _ in scores.most_common(limit * 4)], delisted)[:limit]
+
+    def select(self, positions: Sequence[int], delisted: bool = False) -> List[dict]:
+        """Get records by positions.
+
+        :param positions: records positions.
+        :param delisted: include delisted symbols.
+        :return: metadata list.
+        """
+        return [self.records[position] for position in positions if delisted or not self.records[position]["Delisted"]]
+
+    def build(
+        self, eodhd: Any, exchanges: Sequence[str] = None, concurrency: int = 4
+    ) -> Union["Universe", Coroutine[Any, Any, "Universe"]]:
+        """Build universe from exchanges symbol lists, active and delisted.
+
+        :param eodhd: EODHDClient instance, coroutine is returned for asynchronous clients.
+        :param exchanges: exchange codes, default - all exchanges from exchanges list.
+        :param concurrency: maximum concurrent requests.
+        :return: universe itself.
+        """
+        def listed(codes):
+            keys = [(code, None) for code in codes] + [(code, 1) for code in codes]
+            return then(fetch(self.symbols_list(eodhd), keys, concurrency), lambda fetched: self.merge(*fetched))
+
+        if exchanges is not None:
+            return listed(list(exchanges))
+        return then(eodhd.exchange.exchanges(), lambda items: listed([item["Code"] for item in items]))
+
+    @staticmethod
+    def symbols_list(eodhd: Any):
+        """Create symbols list fetching function for (exchange, delisted) keys.
+
+        :param eodhd: EODHDClient instance.
+        :return: function or coroutine function.
+        """
+        if eodhd.mode == "coro":
+            async def tickers(key):
+                return await eodhd.exchange.tickers(key[0], delisted=key[1], fmt="json")
+            return tickers
+        return lambda key: eodhd.exchange.tickers(key[0], delisted=key[1], fmt="json")
+
+    def merge(self, results: dict, errors: dict) -> "Universe":
+        """Replace exchanges symbols with fetched lists and rebuild indexes.
+
+        :param results: (exchange, delisted) to symbols list mapping.
+        :param errors: (exchange, delisted) to fetching error mapping, such exchanges are kept as is.
+        :return: universe itself.
+        """
+        frames, replaced = [], set()
+        for (market, delisted), items in results.items():
+            if (market, None) in errors or (market, 1) in errors or not isinstance(items, list):
+                continue
+            replaced.add(market)
+            frame = pd.DataFrame(items).reindex(columns=COLUMNS)
+            frame["Market"] = market
+            frame["Delisted"] = bool(delisted)
+            frames.append(frame)
+        frames.insert(0, self.frame[~self.frame["Market"].isin(replaced)])
+        frame = pd.concat(frames, ignore_index=True)
+        frame["Symbol"] = frame["Code"].astype(str) + "." + frame["Market"].astype(str)
+        frame = frame.sort_values("Delisted", kind="mergesort").drop_duplicates("Symbol")
+        self.frame = frame.sort_values("Symbol")
+        self.errors = errors
+        self.index()
+        return self
+
+    def refresh(
+        self, eodhd: Any, start: str = None, finish: str = None
+    ) -> Union["Universe", Coroutine[Any, Any, "Universe"]]:
+        """Apply symbol changes history since last refresh.
+
+        :param eodhd: EODHDClient instance, coroutine is returned for asynchronous clients.
+        :param start: period start date, "YYYY-MM-DD", default - last refresh date.
+        :param finish: period end date, "YYYY-MM-DD", default - today.
+        :return: universe itself.
+        """
+        finish = finish or datetime.date.today().isoformat()
+        return then(eodhd.exchange.history(start or self.updated, finish), lambda changes: self.apply(changes, finish))
+
+    def apply(self, changes: List[dict], updated: str = None) -> "Universe":
+        """Apply symbol changes, old symbols become aliases of new ones.
+
+        :param changes: symbol changes, format: {"exchange", "old_symbol", "new_symbol", "effective", ...}.
+        :param updated: changes are applied up to this date, "YYYY-MM-DD".
+        :return: universe itself.
+        """
+        positions = dict(self.symbols)
+        for change in sorted(changes or [], key=lambda item: item.get("effective") or ""):
+            old = f"{change['old_symbol']}.{change['exchange']}".upper()
+            new = f"{change['new_symbol']}.{change['exchange']}".upper()
+            self.aliases = {alias: new if target == old else target for alias, target in self.aliases.items()}
+            self.aliases[old] = new
+            if old in positions and new not in positions:
+                record = self.records[positions[old]]
+                record["Code"] = change["new_symbol"]
+                record["Symbol"] = f"{change['new_symbol']}.{record['Market']}"
+                positions[new] = positions.pop(old)
+        self.frame = pd.DataFrame(self.records, columns=COLUMNS)
+        self.updated = updated or self.updated
+        self.index()
+        return self
+
+    def save(self, path: str):
+        """Save universe to pickle file.
+
+        :param path: file path.
+        """
+        pd.to_pickle({"frame": self.frame, "aliases": self.aliases, "updated": self.updated}, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Universe":
+        """Load universe from pickle file.
+
+        :param path: file path.
+        :return: universe.
+        """
+        data = pd.read_pickle(path)
+        return cls(data["frame"], data["aliases"], data["updated"])
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+import threading
+import pytest
+from benchmarks import server
+
+
+@pytest.fixture(scope="module")
+def stand_in(request):
+    """Run EODHD API stand-in, payload rows count can be set with test module <ROWS> variable."""
+    rows = getattr(request.module, "ROWS", 100)
+    server.Handler.config = {"latency": 0.0, "rows": rows, "errors": 0.0, "limit": 100000}
+    server.Handler.remaining = server.Handler.config["limit"]
+    server.Handler.cache = {}
+    instance = server.Server(("127.0.0.1", 0), server.Handler)
+    thread = threading.Thread(target=instance.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{instance.server_address[1]}/api"
+    instance.shutdown()
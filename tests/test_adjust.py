@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import pytest
+from eodhdc.tools import adjust
+from eodhdc.tools.panel import assemble
+
+prices = pd.DataFrame({
+    "Date": ["2023-01-02", "2023-01-03", "2023-01-04", "2023-01-05", "2023-01-06"],
+    "Open": [99.0, 101.0, 50.0, 51.0, 51.0], "High": [101.0, 103.0, 52.0, 53.0, 51.0],
+    "Low": [98.0, 100.0, 49.0, 50.0, 49.0], "Close": [100.0, 102.0, 51.0, 52.0, 50.0],
+    "Adjusted_close": np.nan, "Volume": [10.0, 10.0, 20.0, 20.0, 20.0]
+})
+splits = pd.DataFrame({"date": ["2023-01-04"], "split": ["2.000000/1.000000"]})
+dividends = pd.DataFrame({
+    "date": ["2022-12-01", "2023-01-06"], "value": [5.0, 0.5], "unadjustedValue": [5.0, None],
+    "currency": ["USD", "USD"]
+})
+
+
+@pytest.mark.eodhdc
+def test_adjust_frame():
+    """Ticker prices splits and dividends adjustment test."""
+    assert adjust.ratio("4.000000/1.000000") == 4.0 and adjust.ratio("1/10") == 0.1
+    dividend = 1 - 0.5 / 52
+    result = adjust.adjust(prices.iloc[::-1], splits, dividends)
+    assert np.allclose(result["Adjusted_close"], [50 * dividend, 51 * dividend, 51 * dividend, 52 * dividend, 50])
+    assert result["Close"].tolist() == prices["Close"].tolist()
+
+    result = adjust.adjust(prices, splits, dividends, kind="splits", ohlc=True)
+    assert result["Close"].tolist() == [50.0, 51.0, 51.0, 52.0, 50.0]
+    assert result["High"].tolist()[:2] == [50.5, 51.5] and result["Volume"].tolist() == [20.0] * 5
+    assert result["Adjusted_close"].tolist() == result["Close"].tolist()
+
+    later = pd.DataFrame({"date": ["2023-02-01"], "dividend": ["1.0"]})
+    assert np.allclose(adjust.adjust(prices, dividends=later)["Adjusted_close"], prices["Close"] * 0.98)
+
+
+@pytest.mark.eodhdc
+def test_adjust_panel():
+    """Panel splits and dividends adjustment test."""
+    panel = assemble({"A.US": prices, "B.US": prices.iloc[2:]})
+    result = adjust.adjust(panel, {"A.US": splits, "B.US": splits}, {"A.US": dividends})
+    close = result.field("Adjusted_close")
+    assert np.allclose(close["A.US"], adjust.adjust(prices, splits, dividends)["Adjusted_close"])
+    assert close["B.US"].tolist()[2:] == [51.0, 52.0, 50.0] and close["B.US"].isna().sum() == 2
+    assert np.isnan(panel.field("Adjusted_close")).all().all()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import json
+import pytest
+import pandas as pd
+from eodhdc import EODHDClient, exceptions
+from eodhdc.tools.calendar import Calendar, Calendars, intraday
+
+details = {
+    "Name": "USA Stocks", "Code": "US", "Timezone": "America/New_York",
+    "TradingHours": {"Open": "09:30:00", "Close": "16:00:00", "WorkingDays": "Mon, Tue, Wed, Thu, Fri"},
+    "ExchangeHolidays": {
+        "0": {"Holiday": "Christmas", "Date": "2023-12-25", "Type": "official"},
+        "1": {"Holiday": "Columbus Day", "Date": "2023-10-09", "Type": "bank"},
+        "2": {"Holiday": "New Year's Day", "Date": "2024-01-01", "Type": "official"}
+    }
+}
+requests = []
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    requests.append((url, params))
+    if "/exchange-details/" in url:
+        if not url.endswith("/US"):
+            raise exceptions.ClientHTTPError(404, "Not Found")
+        return "application/json", json.dumps(details).encode(), {}
+    body = f"Timestamp,Close\n{params['from']},1.0\n{params['to']},2.0\n"
+    return "application/csv", body.encode(), {}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+@pytest.mark.eodhdc
+def test_calendar_sessions():
+    """Calendar trading days and sessions test."""
+    calendar = Calendar(details)
+    assert not calendar.is_trading_day("2023-12-25") and not calendar.is_trading_day("2023-12-23")
+    assert calendar.is_trading_day("2023-10-09")
+    assert not Calendar(details, ["official", "bank"]).is_trading_day("2023-10-09")
+    assert calendar.next_session("2023-12-22") == pd.Timestamp("2023-12-26")
+    assert calendar.next_session("2023-12-26", inclusive=True) == pd.Timestamp("2023-12-26")
+    assert calendar.previous_session("2024-01-02") == pd.Timestamp("2023-12-29")
+    assert calendar.session_bounds("2023-12-25") is None
+    assert calendar.session_bounds("2023-07-03") == (
+        pd.Timestamp("2023-07-03 13:30", tz="UTC"), pd.Timestamp("2023-07-03 20:00", tz="UTC")
+    )
+    assert calendar.session_bounds("2023-12-26")[0] == pd.Timestamp("2023-12-26 14:30", tz="UTC")
+    assert len(calendar.sessions("2023-12-23", "2024-01-01")) == 4
+    assert calendar.windows("2023-12-23", "2024-01-07", 5) == [
+        (pd.Timestamp("2023-12-26"), pd.Timestamp("2023-12-29")),
+        (pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-05"))
+    ]
+    assert not calendar.windows("2023-12-23", "2023-12-25", 5)
+
+
+@pytest.mark.eodhdc
+def test_calendar_intraday():
+    """Calendars cache and intraday backfill test."""
+    requests.clear()
+    eodhd = EODHDClient(SimpleNamespace(get=get))
+    calendars = Calendars(eodhd)
+    calendar = calendars.get("US")
+    assert calendars.get("US") is calendar and "US" in calendars and len(requests) == 1
+    with pytest.raises(exceptions.ClientHTTPError):
+        calendars.get("XX")
+
+    frame = intraday(eodhd, calendar, "AAPL.US", "2023-12-23", "2024-05-31", "1m")
+    windows = sorted(params["from"] for url, params in requests[2:])
+    assert len(windows) == 2 and len(frame) == 4 and not frame.attrs["errors"]
+    assert windows[0] == pd.Timestamp("2023-12-26", tz="America/New_York").timestamp()
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_calendar_async():
+    """Calendars cache and intraday backfill with asynchronous client test."""
+    requests.clear()
+    eodhd = EODHDClient(SimpleNamespace(get=aget))
+    calendars = Calendars(eodhd)
+    calendar = await calendars.get("US")
+    assert await calendars.get("US") is calendar and len(requests) == 1
+    frame = await intraday(eodhd, calendar, "AAPL.US", "2023-12-23", "2023-12-31", "5m")
+    assert len(frame) == 2 and len(requests) == 2
@@ -2,7 +2,7 @@
 # pylint: disable=duplicate-code
 import os
 import pytest
-from eodhdc import clients, exceptions
+from eodhdc import EODHDClient, clients, exceptions
 
 modules = ["aiohttp", "httpxa"]
 timeouts = {"aiohttp": 5, "httpxa": (5, 5)}
@@ -79,3 +79,33 @@ async def test_response_json(client):
     assert isinstance(result[1], bytes)
     session = client.create()
     await client.destroy(session)
+
+
+@pytest.mark.asyncio
+@pytest.mark.clients
+async def test_session_options():
+    """Session options and compression negotiation test."""
+    eodhd = EODHDClient("httpxa", options={"limits": {"max_connections": 4}, "http2": False, "headers": {"X-A": "1"}})
+    assert eodhd.session.headers["accept-encoding"] == clients.httpxs.ENCODING
+    assert eodhd.session.headers["x-a"] == "1"
+    await eodhd.destroy()
+    eodhd = EODHDClient("httpxa", options={"headers": {"accept-encoding": "identity"}})
+    assert eodhd.session.headers.get_list("accept-encoding") == ["identity"]
+    await eodhd.destroy()
+    kwargs = clients.httpxs.compress({"headers": {"accept-encoding": "identity"}})
+    assert kwargs == {"headers": {"accept-encoding": "identity"}}
+    assert clients.httpxs.compress({})["headers"]["Accept-Encoding"].endswith("gzip, deflate")
+
+
+@pytest.mark.asyncio
+@pytest.mark.clients
+async def test_session_connector():
+    """Session connector and timeout options test."""
+    eodhd = EODHDClient("aiohttp", options={
+        "connector": {"limit_per_host": 50}, "timeout": {"sock_read": 5}, "auto_decompress": False
+    })
+    assert eodhd.session.connector.limit == clients.aiohttp.CONNECTOR["limit"]
+    assert eodhd.session.connector.limit_per_host == 50
+    assert eodhd.session.timeout.sock_read == 5 and eodhd.session.timeout.total is None
+    assert not eodhd.session.auto_decompress
+    await eodhd.destroy()
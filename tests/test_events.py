@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import json
+import pandas as pd
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.tools.events import Events, diff
+
+calendar = {
+    "earnings": [
+        {"code": "AAPL.US", "report_date": "2023-02-02", "date": "2022-12-31", "actual": None, "estimate": 1.94},
+        {"code": "MSFT.US", "report_date": "2023-01-24", "date": "2022-12-31", "actual": 2.32, "estimate": 2.29}
+    ],
+    "splits": [{"code": "GOOGL.US", "split_date": "2023-01-20", "old_shares": 1, "new_shares": 20}],
+    "economic": [
+        {"type": "CPI", "comparison": "mom", "period": "Jan", "country": "US", "date": "2023-02-14 13:30:00",
+         "actual": None, "estimate": 0.5} for _ in range(3)
+    ] + [
+        {"type": "GDP", "comparison": None, "period": f"Q{quarter}", "country": "US", "date": "2023-01-26 13:30:00",
+         "actual": 2.9, "estimate": 2.6} for quarter in range(1, 5)
+    ]
+}
+requests = []
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    kind = url.rsplit("/", 1)[1]
+    requests.append((kind, params))
+    if kind == "ipos":
+        raise exceptions.ClientHTTPError(500, "Server Error")
+    if kind == "economic-events":
+        body = calendar["economic"][params["offset"]:params["offset"] + params["limit"]]
+    else:
+        body = {"type": kind, "from": params["from"], "to": params["to"], kind: calendar[kind]}
+    return "application/json", json.dumps(body).encode(), {}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+@pytest.mark.eodhdc
+def test_events_diff():
+    """Rows diffing by key test."""
+    stored = json.loads(json.dumps(calendar["earnings"]))
+    fetched = stored + [{"code": "TSLA.US", "report_date": "2023-01-25", "date": "2022-12-31"}]
+    fetched[0] = {**fetched[0], "actual": 1.88}
+    changes = diff(pd.DataFrame(stored), pd.DataFrame(fetched), ["code", "date"])
+    assert changes[["code", "change"]].values.tolist() == [["TSLA.US", "insert"], ["AAPL.US", "update"]]
+
+
+@pytest.mark.eodhdc
+def test_events_sync(tmp_path):
+    """Calendar windows synchronization test."""
+    requests.clear()
+    events = Events(str(tmp_path), past=7, future=30)
+    assert events.window("2023-01-20") == ("2023-01-13", "2023-02-19")
+    changes = events.sync(EODHDClient(SimpleNamespace(get=get)), today="2023-01-20")
+    assert sorted(changes) == ["earnings", "economic", "splits"] and list(events.errors) == ["ipos"]
+    assert len(changes["economic"]) == 5 and (changes["earnings"]["change"] == "insert").all()
+    assert all(params["from"] == "2023-01-13" and params["to"] == "2023-02-19" for _, params in requests)
+
+    calendar["earnings"][0]["actual"] = 1.88
+    changes = events.sync(EODHDClient(SimpleNamespace(get=get)), ["earnings", "splits"], today="2023-01-21")
+    assert changes["earnings"][["code", "change", "actual"]].values.tolist() == [["AAPL.US", "update", 1.88]]
+    assert changes["splits"].empty and events.load("earnings")["code"].tolist() == ["MSFT.US", "AAPL.US"]
+    assert events.load("earnings")["actual"].tolist() == [2.32, 1.88] and events.load("ipos").empty
+    calendar["earnings"][0]["actual"] = None
+
+    splits = calendar.pop("splits")
+    calendar["splits"] = []
+    changes = events.sync(EODHDClient(SimpleNamespace(get=get)), ["splits"], today="2023-03-01")
+    assert changes["splits"].empty and len(events.load("splits")) == 1
+    changes = events.sync(EODHDClient(SimpleNamespace(get=get)), ["splits"], today="2023-01-21")
+    assert changes["splits"][["code", "change"]].values.tolist() == [["GOOGL.US", "delete"]]
+    assert events.load("splits").empty
+    calendar["splits"] = splits
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_events_async(tmp_path):
+    """Calendar synchronization with asynchronous client test."""
+    events = Events(str(tmp_path))
+    eodhd = EODHDClient(SimpleNamespace(get=aget))
+    changes = await events.sync(eodhd, ["economic", "splits"], start="2023-01-01", finish="2023-03-01")
+    assert len(changes["economic"]) == 5 and len(changes["splits"]) == 1
+    changes = await events.sync(eodhd, ["economic"], start="2023-01-01", finish="2023-03-01")
+    assert changes["economic"].empty and len(events.load("economic")) == 5
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
 import io
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import pandas as pd
 import pytest
 from eodhdc import exceptions
@@ -72,3 +73,26 @@ def test_base_process(response, output, writer, result):
         assert os.path.exists(parts[1])
         os.remove(parts[1])
     assert group.headers
+
+
+@pytest.mark.asyncio
+@pytest.mark.groups
+@pytest.mark.parametrize("pool", [ThreadPoolExecutor, ProcessPoolExecutor])
+async def test_base_aprocess(pool):
+    """Test base process method in executor."""
+    with pool(max_workers=1) as executor:
+        group = BaseGroup(client, executor=executor)
+        for response, output, writer, result in results:
+            timings = {}
+            value = await group.aprocess(response, output, writer, timings)
+            if isinstance(result, pd.DataFrame):
+                pd.testing.assert_frame_equal(value, result)
+            else:
+                assert value == result
+            if "." in output:
+                assert os.path.exists(output.split(":")[1])
+                os.remove(output.split(":")[1])
+            assert group.headers == {"header": "value"}
+            assert set(timings) == {"parse", "write"}
+        with pytest.raises(exceptions[1][2]):
+            await group.aprocess(exceptions[1][0], exceptions[1][1])
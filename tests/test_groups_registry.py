@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=too-many-arguments
+import inspect
+import pytest
+from eodhdc import groups
+from eodhdc.registry import REGISTRY
+
+requests = [
+    ["market", "historical", ["MCD.US"], dict(start="2023-01-01"),
+     "eod/MCD.US", {"api_token": "demo", "period": "d", "order": "a", "from": "2023-01-01", "fmt": "csv"}],
+    ["market", "delayed", [["MCD.US", "AAPL.US"]], dict(fmt="json"),
+     "real-time/MCD.US", {"api_token": "demo", "s": ["AAPL.US"], "fmt": "json"}],
+    ["market", "indicators", ["AAPL.US", "sma"], dict(params={"period": 10}),
+     "technical/AAPL.US", {"api_token": "demo", "function": "sma", "order": "a", "fmt": "csv", "period": 10}],
+    ["alternative", "sentiment", ["tweets", "aapl"], dict(),
+     "tweets-sentiments", {"api_token": "demo", "s": "aapl"}],
+    ["fundamental", "calendar", ["trends"], dict(symbols=["AAPL.US"], start=1, finish=2),
+     "calendar/trends", {"api_token": "demo", "symbols": ["AAPL.US"], "fmt": "csv"}],
+    ["exchange", "exchanges", [], dict(),
+     "exchanges-list/", {"api_token": "demo"}]
+]
+
+
+def client():
+    """Client dummy function."""
+
+
+@pytest.mark.groups
+def test_registry_endpoints():
+    """Test registry is populated from groups declarations."""
+    assert len(REGISTRY) == 26
+    assert REGISTRY["market.historical"].fmt == "csv"
+    assert REGISTRY["exchange.exchanges"].fmt == "json"
+    assert REGISTRY["exchange.screener"].paging["cap"] == 1000
+    assert REGISTRY["fundamental.fundamentals"].ttl
+
+
+@pytest.mark.groups
+@pytest.mark.parametrize("mode", ["sync", "coro"])
+def test_registry_generate(mode):
+    """Test generated group methods."""
+    group = getattr(groups, mode).MarketGroup
+    assert group.mode == mode
+    assert group.historical.__doc__ == groups.market.MarketGroup.historical.__doc__
+    assert inspect.signature(group.historical) == inspect.signature(groups.market.MarketGroup.historical)
+    assert inspect.iscoroutinefunction(group.historical) == (mode == "coro")
+
+
+@pytest.mark.groups
+@pytest.mark.parametrize("group, method, args, kwargs, path, params", requests)
+def test_registry_request(group, method, args, kwargs, path, params):
+    """Test endpoint request preparation."""
+    instance = getattr(groups.sync, f"{group.capitalize()}Group")(client)
+    spec = REGISTRY[f"{group}.{method}"]
+    request = instance.request(spec, spec.bind((instance, *args), kwargs))
+    assert request.name == f"{group}.{method}"
+    assert request.url == f"{instance.base}/{path}"
+    assert request.params == params
+    assert request.args == {}
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import pytest
+from eodhdc.tools.panel import Panel
+from eodhdc.tools.indicators import Indicator, FUNCTIONS, calculate
+
+generator = np.random.default_rng(7)
+close = 100 * np.exp(np.cumsum(generator.normal(0, 0.01, (300, 4)), axis=0))
+close[:20, 1] = np.nan
+close[150, 2] = np.nan
+data = {
+    "Adjusted_close": close, "Close": close, "High": close * 1.01, "Low": close * 0.99,
+    "Volume": generator.uniform(1000, 2000, (300, 4))
+}
+
+
+@pytest.mark.eodhdc
+def test_indicators_values():
+    """Indicators values compared with pandas implementations test."""
+    frame = pd.DataFrame(close)
+    assert np.allclose(calculate(data, "sma", {"period": 10})["sma"], frame.rolling(10).mean(), equal_nan=True)
+    assert np.allclose(
+        calculate(data, "ema", {"period": 10})["ema"][:, 0], frame[0].ewm(span=10, adjust=False).mean()
+    )
+    delta = frame[0].diff()
+    gain = delta.clip(lower=0).ewm(alpha=0.1, adjust=False).mean()
+    loss = (-delta).clip(lower=0).ewm(alpha=0.1, adjust=False).mean()
+    assert np.allclose(calculate(data, "rsi", {"period": "10"})["rsi"][1:, 0], (100 - 100 / (1 + gain / loss))[1:])
+
+    weights = np.arange(1, 11)
+    wma = frame[0].rolling(10).apply(lambda values: (values * weights).sum() / weights.sum(), raw=True)
+    assert np.allclose(calculate(data, "wma", {"period": 10})["wma"][:, 0], wma, equal_nan=True)
+    bands = calculate(data, "bbands", {"period": 20})
+    assert np.allclose(bands["uband"] - bands["mband"], 2 * frame.rolling(20).std(ddof=0), equal_nan=True)
+    macd = calculate(data, "macd")
+    assert np.allclose(macd["divergence"], macd["macd"] - macd["signal"], equal_nan=True)
+    stochastic = calculate(data, "stochastic")
+    assert np.nanmin(stochastic["k_values"]) >= 0 and np.nanmax(stochastic["d_values"]) <= 100
+    assert np.isnan(calculate(data, "ema")["ema"][150, 2]) and not np.isnan(calculate(data, "ema")["ema"][151, 2])
+    with pytest.raises(ValueError):
+        Indicator("unknown")
+
+
+@pytest.mark.eodhdc
+def test_indicators_incremental():
+    """Indicators incremental updates match full history computation test."""
+    for function in FUNCTIONS:
+        params = {"period": 10} if "period" in Indicator(function).params else None
+        full = calculate(data, function, params)
+        indicator = Indicator(function, params)
+        parts = [
+            indicator.update({field: values[start:finish] for field, values in data.items()})
+            for start, finish in [(0, 100), (100, 101), (101, 180), (180, 300)]
+        ]
+        for name, values in full.items():
+            assert np.allclose(values, np.concatenate([part[name] for part in parts]), equal_nan=True), function
+
+    dates = pd.date_range("2023-01-01", periods=300, name="Date")
+    fields = list(data)
+    panel = Panel(dates, ["A", "B", "C", "D"], fields, np.stack([data[field] for field in fields], axis=2))
+    result = calculate(panel, "atr", {"period": 14})["atr"]
+    assert list(result.columns) == ["A", "B", "C", "D"] and result.index.equals(dates)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import json
+import asyncio
+import contextlib
+import numpy as np
+import pytest
+from eodhdc import EODHDClient
+from eodhdc.tools.live import LiveView
+
+requests = []
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    tickers = [url.rsplit("/", 1)[1]] + list(params.get("s") or [])
+    requests.append(tickers)
+    items = [{"code": ticker, "timestamp": 1700000000, "close": 10.0, "volume": 5} for ticker in tickers]
+    return "application/json", json.dumps(items[0] if len(items) == 1 else items).encode(), {}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+class WebSockets:
+    """WebSockets client dummy."""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.subscriptions = []
+        self.active = True
+
+    @contextlib.asynccontextmanager
+    async def connect(self, endpoint):
+        """Connect dummy."""
+        yield endpoint
+
+    async def subscribe(self, websocket, symbols):
+        """Subscribe dummy."""
+        self.subscriptions.extend(symbols)
+
+    async def receive(self, websocket):
+        """Receive dummy, messages are sent with delay."""
+        for message in self.messages:
+            if not self.active:
+                break
+            await asyncio.sleep(0.05)
+            yield message
+
+    def deactivate(self):
+        """Deactivate dummy."""
+        self.active = False
+
+
+@pytest.mark.eodhdc
+def test_live_state():
+    """Live view stream messages and delayed prices merge test."""
+    view = LiveView(EODHDClient(SimpleNamespace(get=get)), ["AAPL.US", "EURUSD.FOREX", "BTC-USD.CC"])
+    assert view.apply({"s": "AAPL", "p": 190.5, "v": 100, "t": 1700000001000, "ms": "open"})
+    assert view.apply({"s": "AAPL", "p": 190.5, "ms": "closed"}) and view.get("AAPL")["timestamp"] == 1700000001000
+    assert view.get("AAPL")["size"] == 100 and np.isnan(view.get("AAPL")["volume"])
+    assert view.apply({"s": "EURUSD", "a": 1.2, "b": 1.1, "t": 1700000002000})
+    assert not view.apply({"s": "MSFT", "p": 1.0}) and "AAPL.US" in view and "AAPL" in view
+    assert view.price("AAPL.US") == 190.5 and np.isclose(view.price("EURUSD"), 1.15) and np.isnan(view.price("X"))
+    assert view.get("EURUSD.FOREX")["bid"] == 1.1 and view.get("AAPL")["source"] == "stream"
+    assert view.stale() == ["BTC-USD.CC"] and view.get("MSFT") is None
+    assert view.apply({"s": "BTC-USD", "ms": "open", "t": 1700000003000}) and view.stale() == ["BTC-USD.CC"]
+
+    asyncio.run(view.refresh())
+    frame = view.frame()
+    assert frame.loc["AAPL.US", "price"] == 190.5 and frame.loc["BTC-USD.CC", "price"] == 10.0
+    assert frame["source"].tolist() == ["stream", "stream", "rest"] and len(requests[-1]) == 3
+    assert frame.loc["AAPL.US", "volume"] == 5 and frame.loc["AAPL.US", "size"] == 100
+
+
+@pytest.mark.eodhdc
+def test_live_quotes():
+    """Live view US quotes messages test."""
+    view = LiveView(EODHDClient(SimpleNamespace(get=get)), ["AAPL.US", "TSLA.US"], silence=60)
+    assert view.apply({"s": "AAPL", "ap": 190.2, "bp": 190.0, "as": 100, "bs": 200, "t": 1700000001000})
+    assert np.isclose(view.price("AAPL"), 190.1) and view.get("AAPL")["source"] == "stream"
+    assert view.apply({"s": "TSLA", "ap": 250.0, "t": 1700000001000}) and np.isnan(view.price("TSLA"))
+    assert view.stale() == ["TSLA.US"] and view.get("TSLA")["ask"] == 250.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_live_run():
+    """Live view seeding, streaming and silent symbols fallback test."""
+    requests.clear()
+    view = LiveView(EODHDClient(SimpleNamespace(get=aget)), ["AAPL.US", "TSLA.US"], silence=0.1, interval=0.1)
+    eodhdws = WebSockets([{"s": "AAPL", "p": 190.0 + number, "t": 1800000000000} for number in range(10)])
+    await view.run(eodhdws)
+    assert eodhdws.subscriptions == ["AAPL", "TSLA"] and view.price("AAPL") == 199.0
+    assert requests[0] == ["AAPL.US", "TSLA.US"] and ["TSLA.US"] in requests[1:]
+    assert view.get("AAPL")["source"] == "stream" and view.get("TSLA")["source"] == "rest" and not view.active
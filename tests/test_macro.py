@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import json
+import pandas as pd
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.tools.macro import Warehouse
+
+requests = []
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    country = url.rsplit("/", 1)[1]
+    requests.append((country, params["indicator"]))
+    if country == "BAD":
+        raise exceptions.ClientHTTPError(404, "Not Found")
+    base = {"USA": 100, "DEU": 10}[country] + (1 if params["indicator"] == "inflation_consumer_prices_annual" else 0)
+    body = [
+        {"CountryCode": country, "Indicator": params["indicator"], "Date": f"{year}-12-31", "Period": "Annual",
+         "Value": base + year - 2020 if year > 2020 else "NA"} for year in [2022, 2021, 2020]
+    ]
+    return "application/json", json.dumps(body).encode(), {}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+@pytest.mark.eodhdc
+def test_macro_warehouse(tmp_path):
+    """Macro indicators warehouse update, staleness and panel test."""
+    requests.clear()
+    eodhd = EODHDClient(SimpleNamespace(get=get))
+    indicators = ["gdp_current_usd", "inflation_consumer_prices_annual"]
+    warehouse = Warehouse(str(tmp_path / "macro.pickle"))
+    updated = warehouse.update(eodhd, ["USA", "DEU", "BAD"], indicators)
+    assert len(updated) == 4 and len(requests) == 6 and sorted(warehouse.errors) == [
+        ("BAD", "gdp_current_usd"), ("BAD", "inflation_consumer_prices_annual")
+    ]
+    panel = warehouse.panel()
+    assert panel.shape == (6, 2) and list(panel.columns) == indicators and panel.index.names == ["country", "Date"]
+    assert panel.loc[("USA", pd.Timestamp("2022-12-31")), "inflation_consumer_prices_annual"] == 103.0
+    assert panel.loc[("DEU", pd.Timestamp("2020-12-31"))].isna().all() and (panel.dtypes == float).all()
+
+    requests.clear()
+    warehouse = Warehouse(str(tmp_path / "macro.pickle"))
+    assert not warehouse.update(eodhd, ["USA", "DEU"], indicators) and not requests and len(warehouse) == 4
+    assert warehouse.stale(["USA", "FRA"], indicators) == [("FRA", indicator) for indicator in indicators]
+    assert warehouse.update(eodhd, ["USA"], indicators[:1], force=True) == [("USA", "gdp_current_usd")]
+    assert len(warehouse.frame) == 12 and warehouse.panel(["DEU"], indicators[1:]).shape == (3, 1)
+    assert Warehouse(str(tmp_path / "macro.pickle"), ttl=0).stale(["USA"], indicators) == [
+        ("USA", indicator) for indicator in indicators
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_macro_async(tmp_path):
+    """Macro indicators warehouse with asynchronous client test."""
+    warehouse = Warehouse(str(tmp_path / "macro.pickle"))
+    eodhd = EODHDClient(SimpleNamespace(get=aget))
+    assert len(await warehouse.update(eodhd, ["USA", "DEU"], ["gdp_current_usd"])) == 2
+    assert warehouse.panel().shape == (6, 1) and not await warehouse.update(eodhd, ["USA"], ["gdp_current_usd"])
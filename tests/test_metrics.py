@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=too-few-public-methods,unused-argument
+from types import SimpleNamespace
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.metrics import Metrics, OpenTelemetry
+from eodhdc.middleware import Conditional
+
+
+def get(url, params, **kwargs):
+    """Client dummy function."""
+    if "XXX" in url:
+        raise exceptions.ClientHTTPError(404, "Not Found")
+    return "text/html", b'a,b\n1,2', {}
+
+
+class Instrument:
+    """OpenTelemetry instrument dummy class."""
+
+    def __init__(self, name, **kwargs):
+        self.name = name
+        self.values = []
+
+    def add(self, value, attributes):
+        """Counter add."""
+        self.values.append((value, attributes))
+
+    record = add
+
+
+class Meter:
+    """OpenTelemetry meter dummy class."""
+
+    def __init__(self):
+        self.instruments = {}
+
+    def create_counter(self, name, **kwargs):
+        """Create counter."""
+        return self.instruments.setdefault(name, Instrument(name, **kwargs))
+
+    create_histogram = create_counter
+
+
+@pytest.mark.eodhdc
+def test_metrics_requests():
+    """Requests metrics test."""
+    events = []
+    metrics = Metrics(sink=events.append)
+    eodhd = EODHDClient(SimpleNamespace(get=get), metrics=metrics)
+    eodhd.market.historical("MCD.US", output="pandas")
+    eodhd.market.historical("MCD.US", output="content")
+    with pytest.raises(exceptions.ClientHTTPError):
+        eodhd.market.historical("XXX.US")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["requests"]["market.historical"]["count"] == 3
+    assert snapshot["requests"]["market.historical"]["bytes"] == 14
+    assert snapshot["requests"]["market.historical"]["parse"] > 0
+    assert snapshot["errors"] == {"market.historical:ClientHTTPError": 1}
+    assert [event["error"] for event in events] == [None, None, "ClientHTTPError"]
+
+    metrics.message("us", 10, 0.001)
+    text = metrics.prometheus()
+    assert 'eodhdc_requests_total{endpoint="market.historical"} 3' in text
+    assert 'eodhdc_errors_total{endpoint="market.historical",exception="ClientHTTPError"} 1' in text
+    families = []
+    for line in text.splitlines():
+        family = line.split()[2] if line.startswith("# TYPE") else line.split("{")[0]
+        if not families or families[-1] != family:
+            families.append(family)
+    assert len(families) == len(set(families)) == 6
+    assert text.startswith("# TYPE eodhdc_requests_total counter\neodhdc_requests_total{")
+
+
+@pytest.mark.eodhdc
+def test_metrics_not_modified():
+    """Stored body returned for not modified response is not counted as received test."""
+    def etag(url, params, **kwargs):
+        if kwargs.get("headers", {}).get("If-None-Match") == '"v1"':
+            raise exceptions.ClientNotModified({})
+        return "application/json", b'{"a":1}', {"ETag": '"v1"'}
+
+    metrics = Metrics()
+    eodhd = EODHDClient(SimpleNamespace(get=etag), metrics=metrics, middleware=[Conditional()])
+    assert eodhd.exchange.exchanges() == {"a": 1} and eodhd.exchange.exchanges() == {"a": 1}
+    stats = metrics.snapshot()["requests"]["exchange.exchanges"]
+    assert stats["count"] == 2 and stats["bytes"] == 7
+
+
+@pytest.mark.eodhdc
+def test_metrics_messages():
+    """Websocket messages metrics and OpenTelemetry sink test."""
+    meter = Meter()
+    metrics = Metrics(sink=OpenTelemetry(meter))
+    metrics.message("us", 10, 0.001)
+    metrics.message("us", 20, 0.002)
+    snapshot = metrics.snapshot()
+    assert snapshot["messages"]["us"]["count"] == 2
+    assert snapshot["messages"]["us"]["bytes"] == 30
+    assert len(meter.instruments["eodhdc.messages"].values) == 2
+    assert meter.instruments["eodhdc.decode"].values[1] == (0.002, {"endpoint": "us"})
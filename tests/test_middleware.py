@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import time
+import asyncio
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.middleware import RateLimit, CoroRateLimit, Conditional, CoroConditional
+
+response = ("application/json", b'{"a":1}', {"header": "value"})
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    return response[0], response[1], {**response[2], "url": url, "params": params, "kwargs": kwargs}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+@pytest.mark.eodhdc
+@pytest.mark.parametrize("client, middleware", [
+    [SimpleNamespace(get=get), [aget]],
+    [SimpleNamespace(get=aget), [get]]
+])
+def test_middleware_exceptions(client, middleware):
+    """Middleware mode mismatch test."""
+    with pytest.raises(exceptions.ImproperMiddleware):
+        _ = EODHDClient(client, middleware=middleware)
+
+
+@pytest.mark.eodhdc
+def test_middleware_sync():
+    """Synchronous middleware chain test."""
+    calls = []
+
+    def outer(request, call):
+        calls.append(("outer", request.name, request.params["from"]))
+        result = call(request)
+        calls.append(("outer", request.elapsed is not None, result[2]["url"]))
+        return result
+
+    def inner(request, call):
+        request.args["timeout"] = 5
+        result = call(request)
+        calls.append(("inner", result[2]["kwargs"]))
+        return result
+
+    eodhd = EODHDClient(SimpleNamespace(get=get), middleware=[outer, inner])
+    assert eodhd.market.historical("MCD.US", start="2023-01-01") == {"a": 1}
+    assert calls == [
+        ("outer", "market.historical", "2023-01-01"),
+        ("inner", {"timeout": 5}),
+        ("outer", True, "https://eodhistoricaldata.com/api/eod/MCD.US")
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_middleware_async():
+    """Asynchronous middleware chain test with short-circuit."""
+    cache = {}
+
+    async def dedupe(request, call):
+        if request.url not in cache:
+            cache[request.url] = await call(request)
+        return cache[request.url]
+
+    eodhd = EODHDClient(SimpleNamespace(get=aget), middleware=[dedupe])
+    assert await eodhd.exchange.exchanges(output="response") == response[1]
+    assert await eodhd.exchange.exchanges() == {"a": 1}
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_middleware_rate_limit():
+    """Asynchronous rate limit middleware test."""
+    eodhd = EODHDClient(SimpleNamespace(get=aget), middleware=[CoroRateLimit(rate=100, burst=2)])
+    started = time.monotonic()
+    await asyncio.gather(*[eodhd.exchange.exchanges() for _ in range(6)])
+    assert 0.04 <= time.monotonic() - started < 0.5
+
+
+@pytest.mark.eodhdc
+def test_middleware_rate_limit_sync():
+    """Synchronous rate limit middleware test."""
+    eodhd = EODHDClient(SimpleNamespace(get=get), middleware=[RateLimit(rate=100)])
+    started = time.monotonic()
+    for _ in range(3):
+        eodhd.exchange.exchanges()
+    assert 0.02 <= time.monotonic() - started < 0.5
+
+
+@pytest.mark.eodhdc
+def test_middleware_conditional():
+    """Synchronous conditional requests middleware test."""
+    sent = []
+
+    def etag(url, params, **kwargs):
+        sent.append(kwargs.get("headers"))
+        if kwargs.get("headers", {}).get("If-None-Match") == '"v1"':
+            raise exceptions.ClientNotModified({"X-RateLimit-Remaining": "9"})
+        return "application/json", b'{"a":1}', {"ETag": '"v1"', "Last-Modified": "Mon, 01 May 2023 00:00:00 GMT"}
+
+    store = {}
+    eodhd = EODHDClient(SimpleNamespace(get=etag), key="secret", middleware=[Conditional(store)])
+    assert eodhd.exchange.exchanges() == {"a": 1}
+    assert eodhd.exchange.exchanges() == {"a": 1}
+    assert eodhd.exchange.headers["X-RateLimit-Remaining"] == "9"
+    assert eodhd.market.historical("MCD.US") == {"a": 1}
+    assert sent == [None, {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 May 2023 00:00:00 GMT"
+    }, None]
+    assert list(store) == ["https://eodhistoricaldata.com/api/exchanges-list/"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+@pytest.mark.parametrize("client", ["requests", "httpxs", "httpxa", "aiohttp"])
+async def test_middleware_conditional_clients(client, stand_in):
+    """Conditional requests middleware with clients test."""
+    middleware = CoroConditional(names=["market.historical"]) if client in ["httpxa", "aiohttp"] else Conditional(
+        names=["market.historical"]
+    )
+    eodhd = EODHDClient(client, middleware=[middleware])
+    eodhd.market.base = stand_in
+    for _ in range(2):
+        result = eodhd.market.historical("MCD.US", output="response")
+        result = await result if eodhd.mode == "coro" else result
+        assert len(result) > 1000
+    assert len(middleware.store) == 1
+    assert isinstance(eodhd.market.headers, dict) and eodhd.market.headers["ETag"]
+    if eodhd.mode == "coro":
+        await eodhd.destroy()
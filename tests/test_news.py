@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import json
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.tools.news import Ingester, Index, Bloom, digest
+from eodhdc.tools.batch import pages
+
+articles = [
+    {"date": f"2023-01-{day:02d}T10:00:00+00:00", "title": f"Article {day}", "link": f"https://news/{day}",
+     "symbols": ["AAPL.US"], "tags": ["EARNINGS"] if day % 2 else ["IPO"]} for day in range(1, 11)
+]
+requests = []
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    requests.append(params)
+    if url.endswith("sentiments"):
+        day = params.get("from") or "2023-01-01"
+        body = {ticker: [{"date": day, "count": 2, "normalized": 0.5}] for ticker in params["s"].split(",")}
+        return "application/json", json.dumps(body).encode(), {}
+    if params.get("t") == "BAD":
+        raise exceptions.ClientHTTPError(500, "Server Error")
+    items = [
+        article for article in reversed(articles)
+        if (params.get("s") in article["symbols"] or params.get("t") in article["tags"])
+        and article["date"][:10] >= (params.get("from") or "")
+    ]
+    offset = params["offset"]
+    return "application/json", json.dumps(items[offset:offset + params["limit"]]).encode(), {}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+@pytest.mark.eodhdc
+def test_news_index(tmp_path):
+    """Bloom filter and persistent index test."""
+    bloom = Bloom(1000, 0.01)
+    keys = [digest(str(number)) for number in range(1000)]
+    bloom.add(keys[:500])
+    assert bloom.contains(keys[:500]).all() and bloom.contains(keys[500:]).mean() < 0.05
+
+    index = Index(str(tmp_path / "index.sqlite"), 1000)
+    index.add(keys[:10])
+    index.advance("query", "2023-01-02")
+    index.advance("query", "2023-01-01")
+    index.close()
+    (tmp_path / "index.bloom").unlink()
+    index = Index(str(tmp_path / "index.sqlite"), 1000)
+    assert index.new(keys[5:15]) == [False] * 5 + [True] * 5 and len(index) == 10
+    assert index.cursor("query") == "2023-01-02" and index.cursor("other") is None
+    index.close()
+
+    items = pages(lambda limit, offset: list(range(offset, min(offset + limit, 25))), {
+        "limit": "limit", "offset": "offset", "size": 10, "cap": 10
+    })
+    assert items == list(range(20))
+
+
+@pytest.mark.eodhdc
+def test_news_ingester(tmp_path):
+    """News and sentiment ingestion with moving window and de-duplication test."""
+    requests.clear()
+    with Ingester(EODHDClient(SimpleNamespace(get=get)), str(tmp_path), capacity=1000) as ingester:
+        added = ingester.news(["EARNINGS", "IPO", "BAD"], ["AAPL.US"], start="2023-01-01")
+        assert len(added) == 10 and list(ingester.errors) == [("tag", "BAD")]
+        assert ingester.index.cursor("news:tag:EARNINGS") == "2023-01-09"
+        rows = ingester.sentiment(["AAPL.US,MSFT.US"], start="2023-01-01")
+        assert [row["ticker"] for row in rows] == ["AAPL.US", "MSFT.US"] and rows[0]["source"] == "news"
+
+    articles.append({"date": "2023-01-11T10:00:00+00:00", "title": "Article 11", "link": "https://news/11",
+                     "symbols": ["AAPL.US"], "tags": ["IPO"]})
+    requests.clear()
+    with Ingester(EODHDClient(SimpleNamespace(get=get)), str(tmp_path), capacity=1000) as ingester:
+        added = ingester.news(["EARNINGS", "IPO"], ["AAPL.US"], start="2023-01-01")
+        assert [article["title"] for article in added] == ["Article 11"]
+        assert [params["from"] for params in requests] == ["2023-01-09", "2023-01-10", "2023-01-10"]
+        assert not ingester.sentiment(["AAPL.US,MSFT.US"])
+        assert len(ingester.load()) == 11 and len(ingester.load("sentiment")) == 2
+    articles.pop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_news_async(tmp_path):
+    """News ingestion with asynchronous client test."""
+    ingester = Ingester(EODHDClient(SimpleNamespace(get=aget)), str(tmp_path), capacity=1000)
+    assert len(await ingester.news(["IPO"])) == 5 and not await ingester.news(["IPO"])
+    assert len(await ingester.sentiment(["AAPL.US"], "tweets")) == 1
+    ingester.close()
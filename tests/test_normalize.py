@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pandas as pd
+import pytest
+from eodhdc.tools import normalize
+
+
+def payload(shift):
+    """Fundamentals payload dummy."""
+    return {
+        "General": {"Code": f"T{shift}", "Name": "Test", "Officers": {"0": {"Name": "A"}}},
+        "Highlights": {"MarketCapitalization": 1000 + shift, "PERatio": "12.5"},
+        "Financials": {
+            "Balance_Sheet": {
+                "currency_symbol": "USD",
+                "quarterly": {
+                    "2023-03-31": {"date": "2023-03-31", "filing_date": "2023-05-01", "currency_symbol": "USD",
+                                   "totalAssets": f"{100 + shift}.00", "cash": None},
+                    "2022-12-31": {"date": "2022-12-31", "filing_date": None, "currency_symbol": "USD",
+                                   "totalAssets": f"{90 + shift}.00", "cash": "5.5"}
+                },
+                "yearly": {}
+            },
+            "Income_Statement": {"quarterly": {"2023-03-31": {"date": "2023-03-31", "netIncome": "7"}}}
+        },
+        "Earnings": {"History": {"2023-03-31": {"reportDate": "2023-04-20", "epsActual": 1.5 + shift}}}
+    }
+
+
+@pytest.mark.eodhdc
+def test_normalize_statements():
+    """Financial statements flattening test."""
+    payloads = {"A.US": payload(0), "B.US": payload(1), "C.US": {"General": {"Code": "C"}}}
+    result = normalize.statements(payloads)
+    balance = result["Balance_Sheet"]
+    assert list(balance.index.names) == ["Ticker", "date"] and len(balance) == 4
+    assert list(balance.columns) == ["filing_date", "currency_symbol", "totalAssets", "cash"]
+    assert balance["totalAssets"].dtype == np.float64 and balance["filing_date"].dtype == object
+    assert balance.loc[("B.US", pd.Timestamp("2023-03-31")), "totalAssets"] == 101.0
+    assert balance.index.get_level_values("date")[0] == pd.Timestamp("2022-12-31")
+    assert len(result["Income_Statement"]) == 2 and result["Cash_Flow"].empty
+    assert normalize.statements(payloads, "yearly")["Balance_Sheet"].empty
+
+    history = normalize.earnings(payloads, ["History"])["History"]
+    assert history["epsActual"].tolist() == [1.5, 2.5]
+
+
+@pytest.mark.eodhdc
+def test_normalize_sections():
+    """Single record sections and long format test."""
+    payloads = {"A.US": payload(0), "B.US": payload(1)}
+    result = normalize.sections(payloads, ["General", "Highlights", "Valuation"])
+    assert result["Highlights"]["PERatio"].tolist() == [12.5, 12.5]
+    assert result["General"].loc["B.US", "Officers"] == {"0": {"Name": "A"}}
+    assert result["Valuation"].shape == (2, 0)
+
+    long = normalize.tidy(normalize.statements(payloads)["Balance_Sheet"])
+    assert list(long.columns) == ["Ticker", "date", "field", "value"]
+    assert len(long) == 6 and long["value"].sum() == 100 + 90 + 5.5 + 101 + 91 + 5.5
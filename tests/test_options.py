@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument, too-many-arguments
+from types import SimpleNamespace
+import json
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.tools.options import Chains, flatten, download
+
+requests = []
+
+
+def contract(underlying, expiration, kind, strike, traded, price):
+    """Options contract dummy."""
+    return {
+        "contractName": f"{underlying}{expiration.replace('-', '')[2:]}{kind[0]}{strike:08d}",
+        "contractSize": "REGULAR", "currency": "USD", "type": kind,
+        "inTheMoney": "TRUE" if kind == "CALL" else "FALSE",
+        "lastTradeDateTime": f"{traded} 15:59:59", "expirationDate": expiration, "strike": strike,
+        "lastPrice": price, "bid": str(price - 0.1), "ask": price + 0.1, "volume": 10, "openInterest": None,
+        "impliedVolatility": 25.5, "delta": 0.5, "gamma": 0.01, "theta": -0.02, "vega": 0.1, "rho": 0.01,
+        "updatedAt": f"{traded} 16:00:00"
+    }
+
+
+def chain(underlying, traded, price):
+    """Options chain dummy."""
+    return {"code": underlying, "exchange": "US", "data": [
+        {"expirationDate": expiration, "options": {
+            "CALL": [contract(underlying, expiration, "CALL", strike, traded, price) for strike in [100, 110]],
+            "PUT": [contract(underlying, expiration, "PUT", strike, traded, price) for strike in [100, 110]]
+        }} for expiration in ["2023-02-17", "2023-03-17"]
+    ]}
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    requests.append(params)
+    underlying = url.rsplit("/", 1)[1]
+    if underlying == "BAD.US":
+        raise exceptions.ClientHTTPError(404, "Not Found")
+    traded = params.get("trade_date_to") or "2023-01-05"
+    body = chain(underlying.split(".")[0], traded, 1.0 if traded == "2023-01-05" else 2.0)
+    if params.get("trade_date_from") is None:
+        body["data"][0]["options"]["CALL"][0] = contract(underlying.split(".")[0], "2023-02-17", "CALL", 100,
+                                                        "2023-01-04", 0.5)
+    return "application/json", json.dumps(body).encode(), {}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+@pytest.mark.eodhdc
+def test_options_flatten():
+    """Options chains flattening test."""
+    frame = flatten({"AAPL.US": chain("AAPL", "2023-01-05", 1.0), "MSFT.US": chain("MSFT", "2023-01-05", 3.0),
+                     "BAD.US": None})
+    assert len(frame) == 16 and list(frame.columns[:6]) == ["underlying", "tradeDate", "expirationDate", "type",
+                                                             "strike", "contractName"]
+    assert frame["bid"].dtype == float and frame["openInterest"].isna().all() and frame["inTheMoney"].sum() == 8
+    assert list(frame["type"].cat.categories) == ["CALL", "PUT"] and frame["expirationDate"].dt.month.max() == 3
+    assert (frame["tradeDate"] == "2023-01-05").all()
+    assert frame["underlying"].unique().tolist() == ["AAPL.US", "MSFT.US"]
+    assert flatten({}).empty
+
+
+@pytest.mark.eodhdc
+def test_options_chains(tmp_path):
+    """Options daily snapshots store test."""
+    requests.clear()
+    eodhd = EODHDClient(SimpleNamespace(get=get))
+    frame = download(eodhd, ["AAPL.US", "BAD.US"])
+    assert len(frame) == 8 and list(frame.attrs["errors"]) == ["BAD.US"]
+
+    chains = Chains(str(tmp_path))
+    assert chains.update(eodhd, ["AAPL.US", "BAD.US"], finish="2023-01-05") == ["2023-01-04", "2023-01-05"]
+    assert list(chains.errors) == ["BAD.US"] and requests[-1]["trade_date_to"] == "2023-01-05"
+    assert chains.update(eodhd, ["AAPL.US"], finish="2023-01-06") == ["2023-01-06"]
+    assert requests[-1]["trade_date_from"] == "2023-01-06" and chains.dates()[-1] == "2023-01-06"
+    assert chains.save(frame) == ["2023-01-04", "2023-01-05"] and len(chains.load("2023-01-05", "2023-01-05")) == 7
+    assert len(chains.load()) == 16 and chains.load("2023-01-06")["lastPrice"].tolist() == [2.0] * 8
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_options_async(tmp_path):
+    """Options download with asynchronous client test."""
+    frame = await download(EODHDClient(SimpleNamespace(get=aget)), ["AAPL.US", "MSFT.US"])
+    assert len(frame) == 16 and not frame.attrs["errors"]
+    eodhd = EODHDClient(SimpleNamespace(get=aget))
+    updated = await Chains(str(tmp_path)).update(eodhd, ["AAPL.US"], finish="2023-01-05")
+    assert updated == ["2023-01-04", "2023-01-05"]
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import pytest
+from eodhdc.tools import Orchestrator
+from eodhdc.tools import orchestrator
+from eodhdc.tools.orchestrator import store
+
+ROWS = 5
+
+
+@pytest.mark.eodhdc
+@pytest.mark.parametrize("extension", [".pickle", ".csv"])
+def test_orchestrator_flow(stand_in, extension, tmp_path):
+    """Orchestrator run, resume and merge test."""
+    tickers = [f"T{index}.US" for index in range(7)]
+    job = Orchestrator(
+        "market.historical", str(tmp_path), workers=2, rate=1000, batch=2,
+        extension=extension, base=stand_in
+    )
+    assert job.pending(tickers) == tickers
+    summary = job.run(tickers[:4])
+    assert summary == {"done": 4, "failed": {}}
+    assert job.pending(tickers) == tickers[4:]
+
+    summary = job.run(tickers)
+    assert summary == {"done": 3, "failed": {}}
+    assert not job.pending(tickers)
+    assert job.run(tickers) == {"done": 0, "failed": {}}
+
+    result = job.merge()
+    assert len(result) == 35
+    assert sorted(result["Ticker"].unique()) == sorted(tickers)
+    assert len(job.partitions()) == 4
+
+
+
+@pytest.mark.eodhdc
+def test_orchestrator_crash(stand_in, tmp_path):
+    """Orchestrator resume after crash during partition writing test."""
+    tickers = [f"T{index}.US" for index in range(3)]
+    job = Orchestrator(
+        "market.historical", str(tmp_path), workers=1, rate=1000, batch=3, extension=".pickle", base=stand_in
+    )
+    frame = pd.DataFrame({"Close": [1.0] * ROWS, "Ticker": [tickers[0]] * ROWS})
+    store(frame, job.config, tickers[:1])
+    os.remove(job.partitions()[0])
+    assert job.pending(tickers) == tickers
+
+    assert job.run(tickers) == {"done": 3, "failed": {}}
+    partition = job.partitions()[0]
+    frame = pd.read_pickle(partition)
+    store(frame, job.config, tickers)
+    result = job.merge()
+    assert job.partitions() == [partition] and len(result) == 15 and not job.pending(tickers)
+    assert not result.duplicated().any()
+
+
+@pytest.mark.eodhdc
+def test_orchestrator_rate(monkeypatch, tmp_path):
+    """Orchestrator global rate limit share of started workers test."""
+    configs = []
+
+    class Executor(ThreadPoolExecutor):
+        """Process pool stand-in running workers in threads."""
+
+        def __init__(self, max_workers, mp_context):
+            super().__init__(max_workers)
+
+    def work(config, tickers):
+        configs.append(config)
+        return {"done": len(tickers), "failed": {}}
+
+    monkeypatch.setattr(orchestrator, "ProcessPoolExecutor", Executor)
+    monkeypatch.setattr(orchestrator, "work", work)
+    job = Orchestrator("market.historical", str(tmp_path), workers=4, rate=12)
+    assert job.run(["T0.US", "T1.US"]) == {"done": 2, "failed": {}}
+    assert [config["rate"] for config in configs] == [6.0, 6.0] and job.config["rate"] == 12
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.tools import panel
+
+ROWS = 30
+
+
+def prices(dates, base):
+    """Historical prices frame dummy."""
+    return pd.DataFrame({
+        "Date": dates, "Open": base, "High": base + 1, "Low": base - 1, "Close": base + 0.5,
+        "Adjusted_close": base + 0.25, "Volume": 1000.0
+    })
+
+
+@pytest.mark.eodhdc
+def test_panel_assemble():
+    """Panel assembly and calendar alignment test."""
+    frames = {
+        "A.US": prices(["2023-01-02", "2023-01-03", "2023-01-05"], np.array([1.0, 2.0, 3.0])),
+        "B.US": prices(["2023-01-03", "2023-01-04"], np.array([10.0, 20.0])),
+        "C.US": None
+    }
+    result = panel.assemble(frames, errors={"C.US": ValueError()})
+    assert result.values.shape == (4, 3, 6)
+    assert list(result.dates.strftime("%d")) == ["02", "03", "04", "05"]
+    close = result.field("Close")
+    assert close["A.US"].tolist()[:2] == [1.5, 2.5] and np.isnan(close["A.US"].iloc[2])
+    assert close["B.US"].iloc[1:3].tolist() == [10.5, 20.5] and close["C.US"].isna().all()
+    assert result.frame()[("Volume", "B.US")].sum() == 2000.0
+    assert list(result.errors) == ["C.US"]
+
+    shared = pd.DatetimeIndex(["2023-01-03", "2023-01-05"])
+    result = panel.assemble(frames, ["Close"], shared)
+    assert result.values[:, :, 0].tolist()[0][:2] == [2.5, 10.5]
+    assert result.field("Close").loc["2023-01-05", "A.US"] == 3.5
+
+
+@pytest.mark.eodhdc
+def test_panel_historical_sync():
+    """Panel fetching with synchronous client test."""
+    def get(url, params, **kwargs):
+        if url.endswith("X.US"):
+            raise exceptions.ClientHTTPError(404, "Not Found")
+        return "text/html", b"Date,Close\n2023-01-02,1\n2023-01-03,2", {}
+
+    result = panel.historical(EODHDClient(SimpleNamespace(get=get)), ["A.US", "X.US", "A.US"], ["Close"])
+    assert result.tickers == ["A.US", "X.US"] and isinstance(result.errors["X.US"], exceptions.ClientHTTPError)
+    assert result.field("Close")["A.US"].tolist() == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_panel_historical_async(stand_in):
+    """Panel fetching with asynchronous client test."""
+    eodhd = EODHDClient("aiohttp")
+    eodhd.market.base = stand_in
+    result = await panel.historical(eodhd, [f"T{index}.US" for index in range(20)], concurrency=4)
+    await eodhd.destroy()
+    assert result.values.shape == (len(result.dates), 20, 6) and not result.errors
+    assert not np.isnan(result.values).all(axis=(0, 2)).any()
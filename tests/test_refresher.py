@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import json
+import pytest
+import pandas as pd
+from eodhdc import EODHDClient, exceptions
+from eodhdc.tools.calendar import Calendar
+from eodhdc.tools.refresher import Store, Refresher
+
+bulk = {
+    ("US", None): [
+        {"code": "AAPL", "exchange_short_name": "US", "date": "2023-01-09", "open": 1, "high": 2, "low": 0.5,
+         "close": 1.5, "adjusted_close": 1.4, "volume": 100},
+        {"code": "MSFT", "exchange_short_name": "US", "date": "2023-01-09", "open": 3, "high": 4, "low": 2.5,
+         "close": 3.5, "adjusted_close": 3.4, "volume": 200},
+        {"code": "TSLA", "exchange_short_name": "US", "date": "2023-01-09", "open": 5, "high": 6, "low": 4.5,
+         "close": 5.5, "adjusted_close": 5.4, "volume": 300}
+    ],
+    ("US", "splits"): [{"code": "TSLA", "exchange": "US", "date": "2023-01-09", "split": "3.000000/1.000000"}],
+    ("US", "dividends"): [{"code": "MSFT", "exchange": "US", "date": "2023-01-09", "dividend": "0.68"}]
+}
+requests = []
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    requests.append((url.rsplit("/", 2)[1:], params))
+    if "/eod-bulk-last-day/" in url:
+        if url.endswith("/LSE"):
+            raise exceptions.ClientHTTPError(500, "Server Error")
+        return "application/json", json.dumps(bulk[(url.rsplit("/", 1)[1], params.get("type"))]).encode(), {}
+    if url.endswith("X.LSE"):
+        raise exceptions.ClientHTTPError(404, "Not Found")
+    if "/splits/" in url or "/div/" in url:
+        field, value = ("split", "2.000000/1.000000") if "/splits/" in url else ("value", "0.5")
+        return "application/json", json.dumps([{"date": params.get("from") or "2023-01-03", field: value}]).encode(), {}
+    body = f"Date,Open,High,Low,Close,Adjusted_close,Volume\n{params.get('from') or '2023-01-02'},1,1,1,1,1,1\n"
+    return "text/html", (body + "2023-01-09,1,1,1,1,1,1\n").encode(), {}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+def history(dates):
+    """Historical prices frame dummy."""
+    return pd.DataFrame({
+        "Date": pd.to_datetime(dates), "Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0,
+        "Adjusted_close": 1.0, "Volume": 1.0
+    })
+
+
+@pytest.mark.eodhdc
+def test_refresher_sync(tmp_path):
+    """Bulk refresh with gaps filling test."""
+    requests.clear()
+    store = Store(str(tmp_path))
+    store.save("AAPL.US", history(["2023-01-05", "2023-01-06"]))
+    store.save("MSFT.US", history(["2023-01-04"]))
+    store.save("IBM.US", history(["2023-01-06"]))
+    store.save("Y.LSE", history(["2023-01-06"]))
+    eodhd = EODHDClient(SimpleNamespace(get=get))
+    refresher = Refresher(eodhd, store)
+    report = refresher.refresh(["AAPL.US", "MSFT.US", "TSLA.US", "IBM.US", "X.LSE", "Y.LSE", "BAD"])
+    assert report["appended"] == ["AAPL.US"] and report["current"] == []
+    assert report["missing"] == ["BAD", "IBM.US"]
+    assert sorted(report["filled"]) == ["MSFT.US", "TSLA.US", "Y.LSE"]
+    assert sorted(report["errors"]) == [
+        ("LSE", "dividends"), ("LSE", "eod"), ("LSE", "splits"),
+        ("X.LSE", "dividends"), ("X.LSE", "eod"), ("X.LSE", "splits")
+    ]
+    assert len(requests) == 18
+
+    aapl = store.load("AAPL.US")
+    assert aapl["Date"].dt.day.tolist() == [5, 6, 9] and aapl["Close"].iloc[-1] == 1.5
+    assert store.load("MSFT.US")["Date"].dt.day.tolist() == [4, 5, 9]
+    assert store.load("TSLA.US")["Date"].dt.day.tolist() == [2, 9]
+    assert store.load("Y.LSE")["Date"].dt.day.tolist() == [6, 7, 9]
+    assert store.load("TSLA.US", "splits")["split"].tolist() == ["2.000000/1.000000", "3.000000/1.000000"]
+    assert store.load("MSFT.US", "dividends")["dividend"].tolist() == ["0.5", "0.68"]
+    assert store.load("Y.LSE", "splits")["date"].dt.day.tolist() == [7]
+
+    requests.clear()
+    report = refresher.refresh(["AAPL.US", "MSFT.US"], actions=False)
+    assert report["current"] == ["AAPL.US", "MSFT.US"] and len(requests) == 1
+    assert len(store.load("TSLA.US", "splits")) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_refresher_async(tmp_path):
+    """Bulk refresh with asynchronous client and holidays calendar test."""
+    requests.clear()
+    store = Store(str(tmp_path))
+    store.save("AAPL.US", history(["2023-01-05"]))
+    store.save("MSFT.US", history(["2023-01-05"]))
+    calendar = Calendar({"ExchangeHolidays": {"0": {"Date": "2023-01-06"}}})
+    refresher = Refresher(EODHDClient(SimpleNamespace(get=aget)), store, {"US": calendar})
+    report = await refresher.refresh(["AAPL.US", "MSFT.US"], actions=False)
+    assert report["appended"] == ["AAPL.US", "MSFT.US"] and len(requests) == 1
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import json
+import operator
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.tools.screener import Query, Screener
+
+universe = [
+    {"code": f"T{number}", "exchange": "US", "market_capitalization": float(number // 2), "adjusted_close": number}
+    for number in range(2500)
+]
+OPERATIONS = {"=": operator.eq, ">": operator.gt, "<": operator.lt, ">=": operator.ge, "<=": operator.le}
+requests = []
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    requests.append(params)
+    filters = json.loads(params.get("filters") or "[]")
+    if ["code", "=", "BAD"] in filters:
+        raise exceptions.ClientHTTPError(500, "Server Error")
+    rows = [row for row in universe if all(OPERATIONS[item[1]](row[item[0]], item[2]) for item in filters)]
+    field, order = params.get("sort", "adjusted_close.asc").rsplit(".", 1)
+    rows = sorted(rows, key=lambda row: row[field], reverse=order == "desc")
+    body = {"data": rows[params["offset"]:params["offset"] + params["limit"]]}
+    return "application/json", json.dumps(body).encode(), {}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+@pytest.mark.eodhdc
+def test_screener_query():
+    """Screener query builder test."""
+    first = Query().where("exchange", "=", "us").where("market_capitalization", ">", 1000).signal("new_hi")
+    second = Query([["market_capitalization", ">", 1000]], ["new_hi"]).where("exchange", "=", "us")
+    assert first == second and first.key() == second.key() and len({first, second}) == 1
+    assert first.params()["signals"] == "new_hi" and json.loads(first.params()["filters"])[0][0] == "exchange"
+    assert Query().params() == {"filters": None, "signals": None, "sort": None}
+    parts = Query().split("market_capitalization", [100, 10])
+    assert [part.filters for part in parts] == [
+        [["market_capitalization", "<", 10]],
+        [["market_capitalization", "<", 100], ["market_capitalization", ">=", 10]],
+        [["market_capitalization", ">=", 100]]
+    ]
+    assert all(part.sort == "market_capitalization.desc" for part in parts)
+
+
+@pytest.mark.eodhdc
+def test_screener_planner():
+    """Screener planner beyond offset cap and results cache test."""
+    requests.clear()
+    screener = Screener(EODHDClient(SimpleNamespace(get=get)))
+    frame = screener.run(Query().where("adjusted_close", ">=", 10))
+    assert len(frame) == 2490 and frame["code"].is_unique and not screener.errors and not screener.truncated
+    assert frame["market_capitalization"].is_monotonic_decreasing and len(requests) == 26
+
+    requests.clear()
+    assert len(screener.run(Query().where("adjusted_close", "<", 250))) == 250
+    assert [params["offset"] for params in requests] == [0, 100, 200, 300]
+
+    requests.clear()
+    assert len(screener.run(Query().where("adjusted_close", ">=", 10))) == 2490 and not requests
+    frame = screener.run(Query().order("adjusted_close", False), bounds=[500, 1000], force=True)
+    assert len(frame) == 2500 and frame["adjusted_close"].tolist() == list(range(2500))
+    assert all(params["sort"] == "market_capitalization.desc" for params in requests)
+
+    screener.paging = {**screener.paging, "size": 1, "cap": 1}
+    frame = screener.run(Query().where("market_capitalization", "=", 5.0), force=True)
+    assert len(frame) == 2 and len(screener.truncated) == 1
+    frame = screener.run(Query().where("code", "=", "BAD"))
+    assert frame.empty and len(screener.errors) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_screener_async():
+    """Screener planner with asynchronous client test."""
+    screener = Screener(EODHDClient(SimpleNamespace(get=aget)))
+    frame = await screener.run(Query().where("adjusted_close", "<", 1500))
+    assert len(frame) == 1500 and frame["code"].is_unique
+    assert len(await screener.run(Query().where("adjusted_close", "<", 1500))) == 1500
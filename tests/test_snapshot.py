@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import json
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.tools.snapshot import Snapshot, chunks
+
+prices = {f"T{number}.US": float(number) for number in range(45)}
+requests = []
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    tickers = [url.rsplit("/", 1)[1]] + list(params.get("s") or [])
+    requests.append(tickers)
+    if "BAD.US" in tickers:
+        raise exceptions.ClientHTTPError(500, "Server Error")
+    items = [
+        {"code": ticker, "timestamp": 1700000000, "gmtoffset": 0, "open": "NA", "close": prices[ticker],
+         "volume": 100} for ticker in tickers
+    ]
+    return "application/json", json.dumps(items[0] if len(items) == 1 else items).encode(), {}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+@pytest.mark.eodhdc
+def test_snapshot_chunks():
+    """Tickers chunking by count and query length test."""
+    assert [len(chunk) for chunk in chunks(list(prices), 20)] == [20, 20, 5]
+    limited = chunks(list(prices), 20, 40)
+    assert sum(len(chunk) for chunk in limited) == 45 and [len(chunk) for chunk in limited[:3]] == [5, 5, 4]
+    assert all(sum(len(ticker) + 3 for ticker in chunk) <= 40 for chunk in limited)
+    assert chunks(["A.US", "B.US", "A.US"], 1) == [("A.US",), ("B.US",)]
+
+
+@pytest.mark.eodhdc
+def test_snapshot_sync():
+    """Snapshot refresh with change detection test."""
+    requests.clear()
+    snapshot = Snapshot(EODHDClient(SimpleNamespace(get=get)), list(prices) + ["BAD.US"], size=20)
+    changed = snapshot.refresh()
+    assert len(requests) == 3 and len(changed) == 40 and list(snapshot.errors) == [snapshot.chunks[-1]]
+    assert snapshot.frame.loc["T3.US", "close"] == 3.0 and snapshot.frame["open"].isna().all()
+    assert snapshot.frame.loc["T44.US"].isna().all() and list(snapshot.frame.index) == snapshot.tickers
+
+    prices["T7.US"] = 7.5
+    frames = list(snapshot.poll(0.01, 2))
+    assert list(frames[0].index) == ["T7.US"] and frames[0].loc["T7.US", "close"] == 7.5 and frames[1].empty
+    prices["T7.US"] = 7.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_snapshot_async():
+    """Snapshot polling with asynchronous client test."""
+    snapshot = Snapshot(EODHDClient(SimpleNamespace(get=aget)), ["T1.US", "T2.US", "T3.US"], size=1)
+    frames = [frame async for frame in snapshot.poll(0.01, 2)]
+    assert len(frames[0]) == 3 and frames[1].empty and snapshot.frame["close"].tolist() == [1.0, 2.0, 3.0]
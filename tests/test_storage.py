@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import os
+import time
+import pandas as pd
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.storage import WriteBehind
+
+ROWS = 5000
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return "text/html", b"a,b\n1,2\n3,4", {"header": "value"}
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    return "text/html", b"a,b\n1,2\n3,4", {"header": "value"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_storage_queue():
+    """Write-behind queue limit and errors test."""
+    queue = WriteBehind(workers=2, limit=1)
+    calls = []
+
+    def write(value):
+        time.sleep(0.01)
+        calls.append(value)
+
+    def fail():
+        raise OSError("disk")
+
+    for index in range(3):
+        await queue.put(write, index)
+        assert len(queue.pending) <= 1
+    await queue.flush()
+    assert calls == [0, 1, 2] and not queue.pending
+
+    await queue.put(fail)
+    with pytest.raises(OSError):
+        await queue.flush()
+    await queue.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_storage_client(tmp_path):
+    """Client file output with write-behind queue test."""
+    queue = WriteBehind()
+    eodhd = EODHDClient(SimpleNamespace(get=aget), queue=queue)
+    writer = {"change:columns": {"a": "ca", "b": "cb"}, "index": False}
+    result = await eodhd.market.historical("MCD.US", output=f"pandas:{tmp_path / 'result.csv'}", writer=writer)
+    raw = await eodhd.market.historical("MCD.US", output=f"response:{tmp_path / 'raw.csv'}")
+    result["ca"] = 0
+    await eodhd.destroy()
+    assert not queue.pending
+    assert pd.read_csv(tmp_path / "result.csv").to_dict("list") == {"ca": [1, 3], "cb": [2, 4]}
+    assert (tmp_path / "raw.csv").read_bytes() == raw
+    assert eodhd.market.headers == {"header": "value"}
+
+    await eodhd.market.historical("MCD.US", output=f"pandas:{tmp_path / 'result.xxx'}")
+    with pytest.raises(exceptions.UnsupportedExtension):
+        await eodhd.flush()
+    await queue.close()
+
+
+@pytest.mark.eodhdc
+def test_storage_exceptions():
+    """Write-behind queue with synchronous client test."""
+    with pytest.raises(exceptions.ImproperClient):
+        _ = EODHDClient(SimpleNamespace(get=get), queue=WriteBehind())
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+@pytest.mark.parametrize("client", ["requests", "httpxs", "httpxa", "aiohttp"])
+async def test_storage_stream(client, stand_in, tmp_path):
+    """Response body streaming to file test."""
+    eodhd = EODHDClient(client)
+    eodhd.market.base = stand_in
+    path = str(tmp_path / "eod.csv")
+    if eodhd.mode == "coro":
+        result = await eodhd.market.historical("MCD.US", output=f"file:{path}")
+        expected = await eodhd.market.historical("MCD.US", output="response")
+    else:
+        result = eodhd.market.historical("MCD.US", output=f"file:{path}")
+        expected = eodhd.market.historical("MCD.US", output="response")
+    assert result == path and os.listdir(tmp_path) == ["eod.csv"]
+    assert len(expected) > 100000 and (tmp_path / "eod.csv").read_bytes() == expected
+
+    eodhd.market.key = "wrong"
+    with pytest.raises(exceptions.ClientHTTPError):
+        if eodhd.mode == "coro":
+            await eodhd.market.historical("MCD.US", output=f"file:{tmp_path / 'wrong.csv'}")
+        else:
+            eodhd.market.historical("MCD.US", output=f"file:{tmp_path / 'wrong.csv'}")
+    assert os.listdir(tmp_path) == ["eod.csv"]
+    if eodhd.mode == "coro":
+        await eodhd.destroy()
+
+
+@pytest.mark.eodhdc
+def test_storage_stream_fallback(tmp_path):
+    """File output with client without streaming support test."""
+    eodhd = EODHDClient(SimpleNamespace(get=get))
+    path = str(tmp_path / "eod.csv")
+    assert eodhd.market.historical("MCD.US", output=f"file:{path}") == path
+    assert os.listdir(tmp_path) == ["eod.csv"]
+    assert (tmp_path / "eod.csv").read_bytes() == b"a,b\n1,2\n3,4"
+    with pytest.raises(exceptions.FileIOError):
+        eodhd.market.historical("MCD.US", output="file")
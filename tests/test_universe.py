@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=unused-argument
+from types import SimpleNamespace
+import json
+import pytest
+from eodhdc import EODHDClient, exceptions
+from eodhdc.tools.universe import Universe
+
+symbols = {
+    ("US", None): [
+        {"Code": "AAPL", "Name": "Apple Inc", "Country": "USA", "Exchange": "NASDAQ", "Currency": "USD",
+         "Type": "Common Stock", "Isin": "US0378331005"},
+        {"Code": "MSFT", "Name": "Microsoft Corporation", "Country": "USA", "Exchange": "NASDAQ",
+         "Currency": "USD", "Type": "Common Stock", "Isin": "US5949181045"},
+        {"Code": "FB", "Name": "Meta Platforms Inc", "Country": "USA", "Exchange": "NASDAQ", "Currency": "USD",
+         "Type": "Common Stock", "Isin": "US30303M1027"}
+    ],
+    ("US", 1): [
+        {"Code": "ENRNQ", "Name": "Enron Corp", "Country": "USA", "Exchange": "PINK", "Currency": "USD",
+         "Type": "Common Stock", "Isin": None}
+    ],
+    ("XETRA", None): [
+        {"Code": "APC", "Name": "Apple Inc", "Country": "Germany", "Exchange": "XETRA", "Currency": "EUR",
+         "Type": "Common Stock", "Isin": "US0378331005"}
+    ],
+    ("XETRA", 1): []
+}
+changes = [{"exchange": "US", "old_symbol": "FB", "new_symbol": "META", "effective": "2022-06-09"}]
+
+
+def get(url, params, **kwargs):
+    """Synchronous client dummy function."""
+    if url.endswith("exchanges-list/"):
+        body = [{"Code": "US"}, {"Code": "XETRA"}, {"Code": "LSE"}]
+    elif url.endswith("symbol-change-history"):
+        body = changes
+    elif url.endswith("/LSE"):
+        raise exceptions.ClientHTTPError(500, "Server Error")
+    else:
+        body = symbols[(url.rsplit("/", 1)[1], params.get("delisted"))]
+    return "application/json", json.dumps(body).encode(), {}
+
+
+async def aget(session, url, params, **kwargs):
+    """Asynchronous client dummy function."""
+    return get(url, params, **kwargs)
+
+
+@pytest.mark.eodhdc
+def test_universe_index(tmp_path):
+    """Universe build, lookup and search test."""
+    eodhd = EODHDClient(SimpleNamespace(get=get))
+    universe = Universe().build(eodhd)
+    assert len(universe) == 5 and list(universe.errors) == [("LSE", None), ("LSE", 1)]
+    assert universe.lookup("aapl.us")["Name"] == "Apple Inc" and "MSFT.US" in universe
+    assert universe.lookup("ENRNQ.US")["Delisted"] and universe.lookup("AAPL.LSE") is None
+    assert [item["Symbol"] for item in universe.isin("US0378331005")] == ["AAPL.US", "APC.XETRA"]
+
+    assert [item["Symbol"] for item in universe.prefix("m")] == ["MSFT.US", "FB.US"]
+    assert [item["Symbol"] for item in universe.prefix("en")] == []
+    assert [item["Symbol"] for item in universe.prefix("en", delisted=True)] == ["ENRNQ.US"]
+    assert universe.search("microsfot")[0]["Symbol"] == "MSFT.US"
+    assert universe.search("APC.XETRA")[0]["Symbol"] == "APC.XETRA"
+
+    universe.refresh(eodhd, "2022-01-01", "2022-12-31")
+    assert universe.updated == "2022-12-31"
+    assert universe.lookup("META.US")["Code"] == "META" and universe.lookup("FB.US")["Symbol"] == "META.US"
+
+    universe.save(str(tmp_path / "universe.pickle"))
+    loaded = Universe.load(str(tmp_path / "universe.pickle"))
+    assert loaded.lookup("FB.US")["Name"] == "Meta Platforms Inc" and loaded.updated == "2022-12-31"
+
+    universe.apply([{"exchange": "US", "old_symbol": "META", "new_symbol": "MVRS", "effective": "2023-01-01"}])
+    assert universe.aliases == {"FB.US": "MVRS.US", "META.US": "MVRS.US"}
+    assert universe.lookup("FB.US")["Symbol"] == "MVRS.US"
+
+
+@pytest.mark.asyncio
+@pytest.mark.eodhdc
+async def test_universe_async():
+    """Universe build with asynchronous client test."""
+    eodhd = EODHDClient(SimpleNamespace(get=aget))
+    universe = await Universe().build(eodhd, ["US"])
+    assert len(universe) == 4 and not universe.errors
+    await universe.refresh(eodhd, "2022-01-01", "2022-12-31")
+    assert "META.US" in universe
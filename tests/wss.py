@@ -6,14 +6,19 @@ from urllib.parse import urlparse, parse_qs
 import websockets
 
 
-async def handler(websocket):
-    """WebSocket server handler."""
+async def authorize(websocket):
+    """WebSocket server authorization."""
     params = parse_qs(urlparse(websocket.path).query)
     if "api_token" in params and params["api_token"][0] == "demo":
         await websocket.send(json.dumps({"status_code": 200, "message": "Authorized"}))
     else:
         await websocket.send(json.dumps({"status_code": 403, "message": "Forbidden"}))
 
+
+async def handler(websocket):
+    """WebSocket server handler."""
+    await authorize(websocket)
+
     while True:
         try:
             msg = json.loads(await websocket.recv())